@@ -0,0 +1,225 @@
+import asyncio
+import uuid
+from concurrent import futures
+from typing import Generator, List
+from unittest.mock import patch
+
+import grpc
+import httpx
+import pytest
+from grpc import ServicerContext
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+from werkzeug.wrappers import Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockHealthServicer
+from weaviate.collections.batch.grpc_batch_objects import SCHEMA_ENCODER_MIN_OBJECTS
+from weaviate.collections.classes.grpc import MetadataQuery
+from weaviate.connect.base import ConnectionParams
+from weaviate.exceptions import WeaviateQueryError
+from weaviate.classes.aggregate import Metrics
+from weaviate.classes.query import Filter
+from weaviate.proto.v1 import (
+    batch_delete_pb2,
+    batch_pb2,
+    properties_pb2,
+    search_get_pb2,
+    weaviate_pb2_grpc,
+)
+
+
+class MockWeaviateServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.requests: List[search_get_pb2.SearchRequest] = []
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        return batch_pb2.BatchObjectsReply(
+            errors=[batch_pb2.BatchObjectsReply.BatchError(index=0, error="failed")]
+        )
+
+    def BatchDelete(
+        self, request: batch_delete_pb2.BatchDeleteRequest, context: ServicerContext
+    ) -> batch_delete_pb2.BatchDeleteReply:
+        return batch_delete_pb2.BatchDeleteReply(matches=3, successful=2, failed=1)
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.requests.append(request)
+        if request.limit == 0:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "limit is required")
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    properties=search_get_pb2.PropertiesResult(
+                        target_collection=request.collection,
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"index": properties_pb2.Value(int_value=i)}
+                        ),
+                    ),
+                    metadata=search_get_pb2.MetadataResult(
+                        id_as_bytes=uuid.UUID(int=i).bytes,
+                        creation_time_unix=1,
+                        creation_time_unix_present=True,
+                        last_update_time_unix=1,
+                        last_update_time_unix_present=True,
+                        # the objects of longer tenant names are further away
+                        distance=i + 0.5 * len(request.tenant),
+                        distance_present=request.metadata.distance,
+                    ),
+                )
+                for i in range(request.limit)
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def search_servicer() -> Generator[MockWeaviateServicer, None, None]:
+    server: grpc.Server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    servicer = MockWeaviateServicer()
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+
+    yield servicer
+
+    server.stop(0)
+
+
+def _client() -> weaviate.WeaviateAsyncClient:
+    return weaviate.WeaviateAsyncClient(
+        ConnectionParams.from_params(
+            http_host=MOCK_IP,
+            http_port=MOCK_PORT,
+            http_secure=False,
+            grpc_host=MOCK_IP,
+            grpc_port=MOCK_PORT_GRPC,
+            grpc_secure=False,
+        ),
+        skip_init_checks=True,
+    )
+
+
+def test_async_queries(weaviate_mock: HTTPServer, search_servicer: MockWeaviateServicer) -> None:
+    async def run() -> None:
+        async with _client() as client:
+            collection = client.collections.get("Test")
+            results = await asyncio.gather(
+                *(collection.query.fetch_objects(limit=limit) for limit in range(1, 6))
+            )
+            assert [len(res.objects) for res in results] == [1, 2, 3, 4, 5]
+            assert results[2].objects[2].properties == {"index": 2}
+            assert results[2].objects[2].uuid == uuid.UUID(int=2)
+
+            obj = await collection.query.fetch_object_by_id(uuid.UUID(int=0))
+            assert obj is not None and obj.collection == "Test"
+
+            with pytest.raises(WeaviateQueryError):
+                await collection.query.fetch_objects()
+
+    asyncio.run(run())
+    # every query is sent exactly once
+    assert len(search_servicer.requests) == 7
+
+
+def test_async_query_across_tenants(
+    weaviate_mock: HTTPServer, search_servicer: MockWeaviateServicer
+) -> None:
+    async def run() -> None:
+        async with _client() as client:
+            collection = client.collections.get("Test")
+            res = await collection.query.across_tenants(
+                ["a", "bb"],
+                lambda q: q.near_vector(
+                    [1.0], limit=3, return_metadata=MetadataQuery(distance=True)
+                ),
+                limit=4,
+            )
+            assert res.tenants == ["a", "bb", "a", "bb"]
+            assert [obj.metadata.distance for obj in res.objects] == [0.5, 1.0, 1.5, 2.0]
+            assert [obj.uuid for obj in res.objects] == [uuid.UUID(int=i) for i in [0, 0, 1, 1]]
+
+    asyncio.run(run())
+    assert sorted(request.tenant for request in search_servicer.requests) == ["a", "bb"]
+
+
+def test_async_rest_methods(
+    weaviate_mock: HTTPServer, search_servicer: MockWeaviateServicer
+) -> None:
+    weaviate_mock.expect_request(
+        f"/v1/objects/Test/{uuid.UUID(int=1)}", method="HEAD"
+    ).respond_with_response(Response(status=204))
+
+    async def run() -> None:
+        async with _client() as client:
+            assert await client.collections.get("Test").data.exists(uuid.UUID(int=1))
+
+    asyncio.run(run())
+
+
+def test_async_data_and_aggregate_do_not_block(
+    weaviate_mock: HTTPServer, search_servicer: MockWeaviateServicer
+) -> None:
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json({})
+    weaviate_mock.expect_request(
+        f"/v1/objects/Test/{uuid.UUID(int=1)}", method="DELETE"
+    ).respond_with_response(Response(status=404))
+    weaviate_mock.expect_request("/v1/graphql", method="POST").respond_with_json(
+        {"data": {"Aggregate": {"Test": [{"meta": {"count": 3}, "name": {"count": 2}}]}}}
+    )
+
+    async def run() -> None:
+        async with _client() as client:
+            collection = client.collections.get("Test")
+            # the blocking HTTP client is not used
+            with patch.object(httpx.Client, "send", side_effect=AssertionError("blocking")):
+                uid = await collection.data.insert({"name": "test"}, uuid=uuid.UUID(int=2))
+                assert uid == uuid.UUID(int=2)
+                assert not await collection.data.delete_by_id(uuid.UUID(int=1))
+
+                res = await collection.data.insert_many([{"name": "a"}, {"name": "b"}])
+                assert list(res.errors) == [0] and len(res.uuids) == 1
+
+                deleted = await collection.data.delete_many(Filter.by_property("name").equal("a"))
+                assert (deleted.matches, deleted.successful, deleted.failed) == (3, 2, 1)
+
+                agg = await collection.aggregate.over_all(
+                    return_metrics=[Metrics("name").text(count=True)]
+                )
+                assert agg.total_count == 3
+                assert agg.properties["name"].count == 2  # type: ignore
+
+    asyncio.run(run())
+
+
+def test_async_insert_many_requests_schema_without_blocking(
+    weaviate_mock: HTTPServer, search_servicer: MockWeaviateServicer
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/Test").respond_with_json(
+        {
+            "class": "Test",
+            "properties": [
+                {
+                    "name": "numbers",
+                    "dataType": ["number[]"],
+                    "indexFilterable": True,
+                    "indexSearchable": False,
+                }
+            ],
+            "vectorizer": "none",
+        }
+    )
+
+    async def run() -> None:
+        async with _client() as client:
+            collection = client.collections.get("Test")
+            objects = [{"numbers": [i, 0.5]} for i in range(SCHEMA_ENCODER_MIN_OBJECTS)]
+            with patch.object(httpx.Client, "send", side_effect=AssertionError("blocking")):
+                await collection.data.insert_many(objects)
+
+    asyncio.run(run())
+    assert len([req for req, _ in weaviate_mock.log if req.path == "/v1/schema/Test"]) == 1
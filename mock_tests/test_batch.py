@@ -0,0 +1,376 @@
+import array
+import json
+import struct
+import threading
+import uuid
+from concurrent import futures
+from pathlib import Path
+from typing import Generator, List
+
+import grpc
+import pytest
+from grpc import ServicerContext
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
+from pytest_httpserver import HTTPServer
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, MockHealthServicer
+from weaviate.collections.batch.grpc_batch_objects import SCHEMA_ENCODER_MIN_OBJECTS
+from weaviate.collections.classes.batch import BatchObjectReturn
+from weaviate.collections.classes.data import DataObject
+from weaviate.exceptions import WeaviateBatchValidationError
+from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
+
+
+class MockWeaviateServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.requests: List[batch_pb2.BatchObjectsRequest] = []
+        self.first_request = threading.Event()
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        self.requests.append(request)
+        self.first_request.set()
+        return batch_pb2.BatchObjectsReply(
+            errors=[
+                batch_pb2.BatchObjectsReply.BatchError(index=i, error="failed")
+                for i, obj in enumerate(request.objects)
+                if obj.properties.non_ref_properties.fields.get("fail") is not None
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def batch_servicer() -> Generator[MockWeaviateServicer, None, None]:
+    server: grpc.Server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    servicer = MockWeaviateServicer()
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+
+    yield servicer
+
+    server.stop(0)
+
+
+@pytest.fixture(scope="function")
+def client(
+    weaviate_mock: HTTPServer, batch_servicer: MockWeaviateServicer
+) -> Generator[weaviate.WeaviateClient, None, None]:
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC, skip_init_checks=True
+    )
+    yield client
+    client.close()
+
+
+def test_batch_sends_all_objects(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    collection = client.collections.get("Test")
+    with collection.batch.fixed_size(batch_size=10, concurrent_requests=2) as batch:
+        uuids = [batch.add_object(properties={"name": f"test{i}"}) for i in range(25)]
+
+    sent = [obj.uuid for request in batch_servicer.requests for obj in request.objects]
+    assert sorted(sent) == sorted(str(uid) for uid in uuids)
+    assert all(len(request.objects) <= 10 for request in batch_servicer.requests)
+    assert len(collection.batch.failed_objects) == 0
+    assert len(collection.batch.results.objs.all_responses) == 25
+
+
+@pytest.mark.parametrize("keep_successful", [True, False])
+def test_batch_results(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer, keep_successful: bool
+) -> None:
+    batches: List[BatchObjectReturn] = []
+    collection = client.collections.get("Test")
+    with collection.batch.fixed_size(
+        batch_size=10,
+        concurrent_requests=1,
+        keep_successful=keep_successful,
+        on_results=batches.append,
+    ) as batch:
+        for i in range(25):
+            batch.add_object(properties={"fail": True} if i % 10 == 9 else {"name": "test"})
+
+    results = collection.batch.results
+    assert results.num_objects == 25
+    assert sum(len(objs.all_responses) for objs in batches) == 25
+    assert sum(len(objs.errors) for objs in batches) == 2
+    # the indices of the merged results continue across the batches
+    assert len(results.objs.errors) == 2
+    assert all("fail" in error.object_.properties for error in results.objs.errors.values())
+    assert results.objs.elapsed_seconds == pytest.approx(
+        sum(objs.elapsed_seconds for objs in batches)
+    )
+    assert len(collection.batch.failed_objects) == 2
+    if keep_successful:
+        assert len(results.objs.all_responses) == 25
+        assert sorted([*results.objs.uuids, *results.objs.errors]) == list(range(25))
+    else:
+        assert all(index < 25 for index in results.objs.errors)
+        assert len(results.objs.all_responses) == 0
+        assert len(results.objs.uuids) == 0
+
+
+def test_concurrent_batches_of_the_same_tenant(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    collection = client.collections.get("Test")
+    barrier = threading.Barrier(2, timeout=10)
+    results = {}
+
+    def run(num_objects: int, num_failed: int) -> None:
+        handle = collection.with_tenant("tenant")
+        with handle.batch.fixed_size(batch_size=5, concurrent_requests=1) as batch:
+            barrier.wait()
+            for i in range(num_objects):
+                batch.add_object(properties={"fail": True} if i < num_failed else {"name": "test"})
+            barrier.wait()
+        results[num_objects] = (handle.batch.results.num_objects, len(handle.batch.failed_objects))
+
+    threads = [threading.Thread(target=run, args=args) for args in [(12, 3), (20, 7)]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {12: (12, 3), 20: (20, 7)}
+
+
+def test_batch_results_callback_raises(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    def on_results(results: BatchObjectReturn) -> None:
+        raise ValueError("callback failed")
+
+    with pytest.raises(ValueError, match="callback failed"):
+        with client.batch.fixed_size(batch_size=10, on_results=on_results) as batch:
+            batch.add_object("test", properties={"name": "test"})
+
+
+def test_trusted_batch(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    with client.batch.fixed_size(batch_size=10, trusted=True) as batch:
+        uid = batch.add_object(
+            "test", properties={"name": "first"}, vector=array.array("f", [1, 2])
+        )
+        batch.add_object("test", uuid=uuid.UUID(int=1), vector={"named": [3.0]}, tenant="tenant")
+
+    sent = [obj for request in batch_servicer.requests for obj in request.objects]
+    assert [obj.uuid for obj in sent] == [str(uid), str(uuid.UUID(int=1))]
+    assert [obj.collection for obj in sent] == ["Test", "Test"]
+    assert sent[0].vector_bytes == struct.pack("2f", 1, 2)
+    assert sent[1].vectors[0].vector_bytes == struct.pack("1f", 3)
+    assert sent[1].tenant == "tenant"
+    assert {
+        (shard.collection, shard.tenant) for shard in client.batch._batch_data.imported_shards
+    } == {
+        ("test", None),
+        ("test", "tenant"),
+    }
+
+
+def test_batch_sends_without_waiting_for_full_batch(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    collection = client.collections.get("Test")
+    with collection.batch.fixed_size(batch_size=100) as batch:
+        batch.add_object(properties={"name": "test"})
+        # the sender is woken up by the new object and does not wait for the batch to fill up
+        assert batch_servicer.first_request.wait(timeout=5)
+        batch.flush()
+        assert len(batch_servicer.requests) == 1
+
+
+def test_add_objects_with_vector_matrix(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    matrix = memoryview(array.array("f", range(6))).cast("B").cast("f", [3, 2])
+    collection = client.collections.get("Test")
+    with collection.batch.fixed_size(batch_size=10) as batch:
+        uuids = batch.add_objects([{"name": f"test{i}"} for i in range(3)], vectors=matrix)
+
+    sent = {obj.uuid: obj for request in batch_servicer.requests for obj in request.objects}
+    for i, uid in enumerate(uuids):
+        assert sent[str(uid)].vector_bytes == struct.pack("2f", 2 * i, 2 * i + 1)
+
+
+def test_insert_many_with_vector_matrix(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    matrix = memoryview(array.array("f", range(4))).cast("B").cast("f", [2, 2])
+    collection = client.collections.get("Test")
+    ret = collection.data.insert_many(
+        [{"name": "first"}, DataObject(properties={"name": "second"}, uuid=uuid.UUID(int=1))],
+        vectors={"named": matrix},
+    )
+
+    assert not ret.has_errors
+    sent = batch_servicer.requests[0].objects
+    assert [obj.vectors[0].vector_bytes for obj in sent] == [
+        struct.pack("2f", 0, 1),
+        struct.pack("2f", 2, 3),
+    ]
+    assert sent[1].uuid == str(uuid.UUID(int=1))
+
+
+def test_multiprocess_batch(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    with client.batch.multiprocess(workers=2, batch_size=10) as batch:
+        uuids = [batch.add_object("Test", properties={"name": f"test{i}"}) for i in range(250)]
+        uuids.append(batch.add_object("Test", vector=memoryview(array.array("f", [1, 2]))))
+        batch.flush()
+        assert batch.number_errors == 0
+
+    sent = {obj.uuid: obj for request in batch_servicer.requests for obj in request.objects}
+    assert sorted(sent) == sorted(str(uid) for uid in uuids)
+    assert sent[str(uuids[-1])].vector_bytes == struct.pack("2f", 1, 2)
+    assert all(len(request.objects) <= 10 for request in batch_servicer.requests)
+    assert len(client.batch.failed_objects) == 0
+    assert len(client.batch.results.objs.all_responses) == 251
+
+
+def test_multiprocess_batch_results(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    streamed: List[BatchObjectReturn] = []
+    with client.batch.multiprocess(
+        workers=2, batch_size=10, keep_successful=False, on_results=streamed.append
+    ) as batch:
+        for i in range(50):
+            batch.add_object(
+                "Test", properties={"name": f"test{i}", **({"fail": True} if i % 10 == 0 else {})}
+            )
+
+    results = client.batch.results.objs
+    assert results.all_responses == []
+    assert results.uuids == {}
+    assert client.batch.results.num_objects == 50
+    assert len(results.errors) == len(client.batch.failed_objects) == 5
+    # every error has its own index, although the objects of the workers are merged
+    assert len(set(results.errors)) == 5
+    assert sum(len(ret.all_responses) for ret in streamed) == 50
+    assert sum(len(ret.errors) for ret in streamed) == 5
+
+
+def test_multiprocess_batch_raises_worker_errors(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    with pytest.raises(WeaviateBatchValidationError) as error:
+        with client.batch.multiprocess(workers=2, batch_size=10) as batch:
+            batch.add_object("", properties={"name": "test"})
+            batch.flush()
+    assert str(error.value).count("Batch validation error") == 1
+
+
+def test_import_from_jsonl(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer, tmp_path: Path
+) -> None:
+    path = tmp_path / "objects.jsonl"
+    with open(path, "w") as file:
+        for i in range(5):
+            row = {"name": f"test{i}", "tags": ["a", "b"], "id": str(uuid.UUID(int=i))}
+            file.write(json.dumps({**row, "embedding": [i, i + 1]} if i > 0 else row) + "\n")
+
+    ret = client.collections.get("Test").data.import_from(
+        path, mapping={"name": "title"}, uuid_column="id", vector_columns="embedding", batch_size=2
+    )
+
+    assert not ret.has_errors
+    assert len(ret.all_responses) == 5
+    assert [len(request.objects) for request in batch_servicer.requests] == [2, 2, 1]
+    sent = [obj for request in batch_servicer.requests for obj in request.objects]
+    assert [obj.uuid for obj in sent] == [str(uuid.UUID(int=i)) for i in range(5)]
+    assert sent[0].vector_bytes == b""
+    assert sent[3].vector_bytes == struct.pack("2f", 3, 4)
+    assert sent[3].properties.non_ref_properties["title"] == "test3"
+    assert len(sent[3].properties.text_array_properties) == 0
+
+
+def test_import_from_arrow(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "name": ["first", None, "third"],
+            "count": [1, 2, 3],
+            "scores": [[0.5], [], [1.5, 2.5]],
+            "embedding": pa.FixedSizeListArray.from_arrays(pa.array(range(6), pa.float32()), 2),
+        }
+    )
+
+    ret = client.collections.get("Test").data.import_from(
+        table.slice(1), vector_columns={"named": "embedding"}, batch_size=10
+    )
+
+    assert not ret.has_errors
+    sent = batch_servicer.requests[0].objects
+    assert len(sent) == 2
+    assert [obj.vectors[0].vector_bytes for obj in sent] == [
+        struct.pack("2f", 2, 3),
+        struct.pack("2f", 4, 5),
+    ]
+    assert "name" not in sent[0].properties.non_ref_properties
+    assert sent[1].properties.non_ref_properties["count"] == 3
+    assert sent[0].properties.empty_list_props == ["scores"]
+    assert sent[1].properties.number_array_properties[0].values_bytes == struct.pack("2d", 1.5, 2.5)
+
+
+def test_import_from_arrow_file(
+    client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer, tmp_path: Path
+) -> None:
+    pa = pytest.importorskip("pyarrow")
+    ipc = pytest.importorskip("pyarrow.ipc")
+    table = pa.table({"name": ["first", "second", "third"], "count": [1, 2, 3]})
+    path = tmp_path / "objects.arrow"
+    with ipc.new_file(str(path), table.schema) as writer:
+        writer.write_table(table, max_chunksize=2)
+
+    ret = client.collections.get("Test").data.import_from(
+        path, mapping={"name": "title"}, batch_size=10
+    )
+
+    assert not ret.has_errors
+    sent = [obj for request in batch_servicer.requests for obj in request.objects]
+    assert [obj.properties.non_ref_properties["title"] for obj in sent] == [
+        "first",
+        "second",
+        "third",
+    ]
+    # only the mapped columns are imported
+    assert all("count" not in obj.properties.non_ref_properties for obj in sent)
+
+
+def test_insert_many_encodes_by_schema(
+    weaviate_mock: HTTPServer, client: weaviate.WeaviateClient, batch_servicer: MockWeaviateServicer
+) -> None:
+    weaviate_mock.expect_request("/v1/schema/Test").respond_with_json(
+        {
+            "class": "Test",
+            "properties": [
+                {
+                    "name": "numbers",
+                    "dataType": ["number[]"],
+                    "indexFilterable": True,
+                    "indexSearchable": False,
+                }
+            ],
+            "vectorizer": "none",
+        }
+    )
+    collection = client.collections.get("Test")
+    objects = [{"numbers": [i, 0.5]} for i in range(SCHEMA_ENCODER_MIN_OBJECTS)]
+    collection.data.insert_many(objects)
+    collection.data.insert_many(objects[:1])
+
+    # without the schema, lists that start with an int are encoded as int[]
+    sent = [obj for request in batch_servicer.requests for obj in request.objects]
+    assert len(sent) == SCHEMA_ENCODER_MIN_OBJECTS + 1
+    assert sent[1].properties.number_array_properties[0].values_bytes == struct.pack("2d", 1, 0.5)
+    assert sent[-1].properties.number_array_properties[0].values_bytes == struct.pack("2d", 0, 0.5)
+    assert len([req for req, _ in weaviate_mock.log if req.path == "/v1/schema/Test"]) == 1
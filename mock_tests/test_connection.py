@@ -1,13 +1,23 @@
 import json
 import time
-from typing import Dict
+from concurrent import futures
+from typing import Dict, List
 
+import grpc
 import pytest
+from grpc_health.v1.health_pb2_grpc import add_HealthServicer_to_server
 from pytest_httpserver import HTTPServer
 from werkzeug import Request, Response
 
 import weaviate
-from mock_tests.conftest import MOCK_SERVER_URL, MOCK_IP, MOCK_PORT
+from mock_tests.conftest import (
+    MOCK_SERVER_URL,
+    MOCK_IP,
+    MOCK_PORT,
+    MOCK_PORT_GRPC,
+    MockHealthServicer,
+)
+from weaviate.proto.v1 import search_get_pb2, weaviate_pb2_grpc
 
 
 @pytest.mark.parametrize(
@@ -64,3 +74,87 @@ def test_wait_for_weaviate(httpserver: HTTPServer):
 def test_user_pw_in_url(weaviate_mock):
     """Test that user and pw can be in the url."""
     weaviate.Client("http://user:pw@" + MOCK_IP + ":" + str(MOCK_PORT))  # no exception
+
+
+def test_rest_metrics(weaviate_mock: HTTPServer) -> None:
+    weaviate_mock.expect_request("/v1/schema/Test/tenants").respond_with_json([])
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        skip_init_checks=True,
+        additional_config=weaviate.classes.init.AdditionalConfig(
+            connection=weaviate.config.ConnectionConfig(session_pool_maxsize=7)
+        ),
+    )
+    client.collections.get("Test").tenants.get()
+    client.collections.get("Test").tenants.get()
+    client.get_meta()
+
+    metrics = client.rest_metrics()
+    # the pool is configured even if no proxies are used
+    pool = client._connection._client._transport._pool  # type: ignore
+    assert pool._max_connections == 7
+    client.close()
+
+    assert metrics["schema/tenants"].requests == 2
+    assert metrics["meta"].requests == 2  # connecting requests the meta endpoint as well
+    assert metrics["meta"].new_connections >= 1
+    assert all(m.errors == 0 and m.tls_handshakes == 0 for m in metrics.values())
+    assert all(m.http2_requests == 0 and m.max_seconds > 0 for m in metrics.values())
+
+
+def test_http2_requires_h2(weaviate_mock: HTTPServer) -> None:
+    try:
+        import h2  # noqa: F401
+
+        pytest.skip("h2 is installed")
+    except ImportError:
+        pass
+    with pytest.raises(ImportError, match="h2"):
+        weaviate.connect_to_local(
+            port=MOCK_PORT,
+            host=MOCK_IP,
+            skip_init_checks=True,
+            additional_config=weaviate.classes.init.AdditionalConfig(
+                connection=weaviate.config.ConnectionConfig(http2=True)
+            ),
+        )
+
+
+class _PeerServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.peers: List[str] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.peers.append(context.peer())
+        return search_get_pb2.SearchReply()
+
+
+def test_grpc_channel_pool(weaviate_mock: HTTPServer) -> None:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    servicer = _PeerServicer()
+    add_HealthServicer_to_server(MockHealthServicer(), server)
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"[::]:{MOCK_PORT_GRPC}")
+    server.start()
+
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=weaviate.classes.init.AdditionalConfig(
+            connection=weaviate.config.ConnectionConfig(grpc_channels=3)
+        ),
+    )
+    collection = client.collections.get("Test")
+    for _ in range(6):
+        collection.query.fetch_objects()
+    client.close()
+    server.stop(0)
+
+    # every channel has its own connection, the calls are sent over them in turn
+    assert len(servicer.peers) == 6
+    assert len(set(servicer.peers)) == 3
+    assert servicer.peers[:3] == servicer.peers[3:]
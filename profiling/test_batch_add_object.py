@@ -0,0 +1,39 @@
+# Compares the time that adding small objects to a batch takes with and without validation. Without `trusted` every
+# object is validated by a pydantic model before it is queued, which dominates the time of the producer for small
+# objects.
+
+import uuid
+from typing import Any
+
+import pytest
+
+from weaviate.collections import Collection
+from weaviate.collections.classes.config import Configure, DataType, Property
+from .conftest import CollectionFactory
+
+NUM_OBJECTS = 10_000
+
+
+def _add_objects(collection: Collection, trusted: bool) -> None:
+    with collection.batch.fixed_size(batch_size=1000, trusted=trusted) as batch:
+        for i in range(NUM_OBJECTS):
+            batch.add_object(
+                properties={"name": f"object {i}", "count": i},
+                uuid=uuid.UUID(int=i),
+                vector=[0.1, 0.2, 0.3],
+            )
+
+
+@pytest.mark.parametrize("trusted", [False, True], ids=["validated", "trusted"])
+def test_benchmark_add_object(
+    benchmark: Any, collection_factory: CollectionFactory, trusted: bool
+) -> None:
+    collection = collection_factory(
+        properties=[
+            Property(name="name", data_type=DataType.TEXT),
+            Property(name="count", data_type=DataType.INT),
+        ],
+        vectorizer_config=Configure.Vectorizer.none(),
+    )
+    benchmark.pedantic(_add_objects, args=(collection, trusted), rounds=5)
+    assert len(collection.batch.failed_objects) == 0
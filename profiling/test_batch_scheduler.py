@@ -0,0 +1,48 @@
+# The batch scheduler used to poll its queues every 10ms, so every open batch context burned CPU while idle and every
+# small import waited up to one polling interval before its first request was sent and again before `flush` noticed
+# that it finished. These benchmarks track both numbers for the event-driven scheduler.
+
+import time
+from contextlib import ExitStack
+from typing import Any
+
+from weaviate.collections import Collection
+from weaviate.collections.classes.config import Configure, DataType, Property
+from .conftest import CollectionFactory
+
+IDLE_CONTEXTS = 20
+IDLE_SECONDS = 2
+
+
+def _small_import(collection: Collection) -> None:
+    with collection.batch.fixed_size(batch_size=100) as batch:
+        batch.add_object(properties={"name": "first"}, vector=[0.1, 0.2, 0.3])
+
+
+def _collection(collection_factory: CollectionFactory) -> Collection:
+    return collection_factory(
+        properties=[Property(name="name", data_type=DataType.TEXT)],
+        vectorizer_config=Configure.Vectorizer.none(),
+    )
+
+
+def test_benchmark_time_to_first_send(
+    benchmark: Any, collection_factory: CollectionFactory
+) -> None:
+    collection = _collection(collection_factory)
+    benchmark(_small_import, collection)
+    assert len(collection.batch.failed_objects) == 0
+
+
+def test_idle_batch_cpu(collection_factory: CollectionFactory) -> None:
+    collection = _collection(collection_factory)
+    with ExitStack() as stack:
+        for _ in range(IDLE_CONTEXTS):
+            stack.enter_context(collection.batch.fixed_size())
+
+        start = time.process_time()
+        time.sleep(IDLE_SECONDS)
+        cpu_seconds = time.process_time() - start
+
+    # with polling every context woke up 100 times per second, now idle contexts only wait on a condition
+    assert cpu_seconds < 0.05 * IDLE_SECONDS, f"idle batch contexts used {cpu_seconds:.3f}s of CPU"
@@ -0,0 +1,48 @@
+# Compares near_vector searches with the same filters and returned properties, built for every search or prepared once
+# with `query.prepare`.
+
+from typing import Any
+
+import pytest
+
+from weaviate.collections import Collection
+from weaviate.collections.classes.config import Configure, DataType, Property
+from weaviate.collections.classes.filters import Filter
+from .conftest import CollectionFactory
+
+NUM_SEARCHES = 1_000
+VECTOR = [0.1, 0.2, 0.3]
+
+
+def _filters() -> Any:
+    return Filter.by_property("count").greater_than(10) & Filter.by_property("name").like("object*")
+
+
+def _search(collection: Collection) -> None:
+    for _ in range(NUM_SEARCHES):
+        collection.query.near_vector(
+            VECTOR, limit=10, filters=_filters(), return_properties=["name", "count"]
+        )
+
+
+def _search_prepared(collection: Collection) -> None:
+    prepared = collection.query.prepare(
+        limit=10, filters=_filters(), return_properties=["name", "count"]
+    )
+    for _ in range(NUM_SEARCHES):
+        prepared.near_vector(VECTOR)
+
+
+@pytest.mark.parametrize("prepared", [False, True], ids=["built", "prepared"])
+def test_benchmark_near_vector(
+    benchmark: Any, collection_factory: CollectionFactory, prepared: bool
+) -> None:
+    collection = collection_factory(
+        properties=[
+            Property(name="name", data_type=DataType.TEXT),
+            Property(name="count", data_type=DataType.INT),
+        ],
+        vectorizer_config=Configure.Vectorizer.none(),
+    )
+    collection.data.insert_many([{"name": f"object {i}", "count": i} for i in range(100)])
+    benchmark.pedantic(_search_prepared if prepared else _search, args=(collection,), rounds=5)
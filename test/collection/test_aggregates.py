@@ -2,6 +2,14 @@ import pytest
 from typing import Callable
 from weaviate.connect import ConnectionV4
 from weaviate.collections.aggregate import _AggregateCollection
+from weaviate.collections.classes.aggregate import (
+    AggregateBoolean,
+    AggregateInteger,
+    AggregateText,
+    GroupedBy,
+    Metrics,
+    TopOccurrence,
+)
 from weaviate.exceptions import WeaviateInvalidInputError
 
 
@@ -34,3 +42,41 @@ def test_bad_aggregate_inputs(connection: ConnectionV4) -> None:
 
     # near image
     _test_aggregate(lambda: aggregate.near_image(42))
+
+
+def test_group_by_result_parsing(connection: ConnectionV4) -> None:
+    aggregate = _AggregateCollection(connection, "Dummy", None, None)
+    response = {
+        "data": {
+            "Aggregate": {
+                "Dummy": [
+                    {
+                        "groupedBy": {"path": ["category"], "value": "a"},
+                        "meta": {"count": 2},
+                        "text": {"count": 2, "topOccurrences": [{"occurs": 2, "value": "x"}]},
+                        "int": {"count": 2, "maximum": 3, "sum": 4},
+                        "bool": {"count": 2, "totalTrue": 1},
+                    }
+                ]
+            }
+        }
+    }
+    metrics = [
+        Metrics("text").text(),
+        Metrics("int").integer(),
+        Metrics("bool").boolean(),
+        Metrics("date").date_(),
+    ]
+
+    group = aggregate._to_group_by_result(response, metrics).groups[0]
+    assert group.grouped_by == GroupedBy(prop="category", value="a")
+    assert group.total_count == 2
+    assert group.properties == {
+        "text": AggregateText(count=2, top_occurrences=[TopOccurrence(count=2, value="x")]),
+        "int": AggregateInteger(
+            count=2, maximum=3, mean=None, median=None, minimum=None, mode=None, sum_=4
+        ),
+        "bool": AggregateBoolean(
+            count=2, percentage_false=None, percentage_true=None, total_false=None, total_true=1
+        ),
+    }
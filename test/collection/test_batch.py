@@ -0,0 +1,245 @@
+import array
+import datetime
+import struct
+import uuid
+from typing import Optional
+
+import pytest
+
+from weaviate.collections.batch.base import ObjectsBatchRequest, ReferencesBatchRequest
+from weaviate.collections.batch.grpc_batch_objects import (
+    _encode_properties,
+    _pack_vector,
+    _schema_encoders,
+    _translate_properties_from_python_to_grpc,
+)
+from weaviate.collections.classes.batch import (
+    BatchObject,
+    BatchObjectReturn,
+    ErrorObject,
+    _BatchObject,
+    _BatchReference,
+    _split_vectors,
+)
+from weaviate.collections.classes.config_methods import _properties_from_config
+from weaviate.exceptions import WeaviateInsertInvalidPropertyError, WeaviateInvalidInputError
+from weaviate.proto.v1 import batch_pb2
+
+
+def _object(i: int) -> _BatchObject:
+    return _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=str(uuid.UUID(int=i)),
+        properties={"index": i},
+        tenant=None,
+        references=None,
+    )
+
+
+def _reference(from_uuid: str, i: int) -> _BatchReference:
+    return _BatchReference(from_=f"from{i}", to=f"to{i}", tenant=None, from_uuid=from_uuid)
+
+
+def test_objects_pop_items_in_order() -> None:
+    objects = ObjectsBatchRequest()
+    for i in range(5):
+        objects.add(_object(i))
+
+    assert [obj.properties for obj in objects.pop_items(2)] == [{"index": 0}, {"index": 1}]
+    assert len(objects) == 3
+    assert [obj.properties for obj in objects.pop_items(10)] == [
+        {"index": 2},
+        {"index": 3},
+        {"index": 4},
+    ]
+    assert len(objects) == 0
+    assert objects.pop_items(10) == []
+
+
+def test_objects_prepend_keeps_order() -> None:
+    objects = ObjectsBatchRequest()
+    objects.add(_object(2))
+    objects.prepend([_object(0), _object(1)])
+
+    assert [obj.properties for obj in objects.pop_items(3)] == [
+        {"index": 0},
+        {"index": 1},
+        {"index": 2},
+    ]
+
+
+def test_references_are_parked_until_their_object_is_processed() -> None:
+    references = ReferencesBatchRequest()
+    in_flight = str(uuid.UUID(int=1))
+    done = str(uuid.UUID(int=2))
+    references.add(_reference(in_flight, 0))
+    references.add(_reference(done, 1))
+    references.add(_reference(in_flight, 2))
+    references.add(_reference(done, 3))
+
+    popped = references.pop_items(10, uuid_lookup={in_flight})
+    assert [ref.from_ for ref in popped] == ["from1", "from3"]
+    # parked references still count as queued so that flushing waits for them
+    assert len(references) == 2
+    assert references.pop_items(10, uuid_lookup={in_flight}) == []
+
+    references.add(_reference(done, 4))
+    references.unpark([in_flight])
+    assert len(references) == 3
+    popped = references.pop_items(10, uuid_lookup=set())
+    assert [ref.from_ for ref in popped] == ["from0", "from2", "from4"]
+    assert len(references) == 0
+
+
+def test_references_pop_amount() -> None:
+    references = ReferencesBatchRequest()
+    for i in range(5):
+        references.add(_reference(str(uuid.UUID(int=i)), i))
+
+    assert len(references.pop_items(3, uuid_lookup=set())) == 3
+    assert len(references) == 2
+
+
+def _matrix(rows: int, columns: int) -> memoryview:
+    # a 2-D float32 buffer, behaves like a numpy array of shape (rows, columns) for the buffer protocol
+    return memoryview(array.array("f", range(rows * columns))).cast("B").cast("f", [rows, columns])
+
+
+def _return(objects: int, failed: int) -> BatchObjectReturn:
+    error = ErrorObject(message="failed", object_=_object(failed))
+    responses = [error if i == failed else uuid.UUID(int=i) for i in range(objects)]
+    return BatchObjectReturn(
+        all_responses=responses,
+        elapsed_seconds=1.0,
+        errors={failed: error},
+        uuids={i: uid for i, uid in enumerate(responses) if isinstance(uid, uuid.UUID)},
+        has_errors=True,
+    )
+
+
+def test_batch_object_return_add() -> None:
+    merged = BatchObjectReturn([], 0.0, {}, {})
+    merged += _return(3, failed=0)
+    merged += _return(2, failed=1)
+
+    assert sorted(merged.errors) == [0, 4]
+    assert sorted(merged.uuids) == [1, 2, 3]
+    assert [merged.all_responses[i] for i in merged.errors] == list(merged.errors.values())
+    assert [merged.all_responses[i] for i in merged.uuids] == list(merged.uuids.values())
+    assert merged.elapsed_seconds == 2.0
+    assert merged.has_errors
+
+
+def test_batch_object_return_merge_without_successful() -> None:
+    merged = BatchObjectReturn([], 0.0, {}, {})
+    merged._merge(_return(3, failed=2), offset=0, keep_successful=False)
+    merged._merge(_return(2, failed=0), offset=3, keep_successful=False)
+
+    assert sorted(merged.errors) == [2, 3]
+    assert merged.uuids == {}
+    assert merged.all_responses == []
+    assert merged.elapsed_seconds == 2.0
+
+
+def test_pack_vector_from_buffer() -> None:
+    vector = [0.5, 1.5, 2.5]
+    expected = struct.pack("3f", *vector)
+    assert _pack_vector(vector) == expected
+    assert _pack_vector(array.array("f", vector)) == expected
+    assert _pack_vector(_matrix(1, 3).cast("B").cast("f", [3, 1])) == struct.pack("3f", 0, 1, 2)
+
+
+def test_batch_object_keeps_float32_bytes() -> None:
+    obj = BatchObject(collection="Test", vector=array.array("f", [1.0, 2.0]))
+    assert obj._to_internal().vector == struct.pack("2f", 1.0, 2.0)
+
+    obj = BatchObject(collection="Test", vector={"named": array.array("f", [1.0]), "other": [2]})
+    assert obj._to_internal().vector == {"named": struct.pack("1f", 1.0), "other": [2.0]}
+
+
+def test_split_vectors() -> None:
+    assert _split_vectors(_matrix(2, 3), 2) == [
+        struct.pack("3f", 0, 1, 2),
+        struct.pack("3f", 3, 4, 5),
+    ]
+    assert _split_vectors([[1.0], [2.0]], 2) == [[1.0], [2.0]]
+    assert _split_vectors({"a": _matrix(2, 1), "b": [[1.0], [2.0]]}, 2) == [
+        {"a": struct.pack("1f", 0), "b": [1.0]},
+        {"a": struct.pack("1f", 1), "b": [2.0]},
+    ]
+
+    with pytest.raises(WeaviateInvalidInputError):
+        _split_vectors(_matrix(2, 3), 3)
+
+
+def _schema_property(name: str, data_type: str, nested: Optional[list] = None) -> dict:
+    prop = {
+        "name": name,
+        "dataType": [data_type],
+        "indexFilterable": True,
+        "indexSearchable": False,
+    }
+    if nested is not None:
+        prop["nestedProperties"] = nested
+    return prop
+
+
+_SCHEMA = _properties_from_config(
+    {
+        "properties": [
+            _schema_property("text", "text"),
+            _schema_property("int", "int"),
+            _schema_property("bool", "boolean"),
+            _schema_property("date", "date"),
+            _schema_property("uuid", "uuid"),
+            _schema_property("texts", "text[]"),
+            _schema_property("ints", "int[]"),
+            _schema_property("dates", "date[]"),
+            _schema_property(
+                "object",
+                "object",
+                [_schema_property("name", "text"), _schema_property("tags", "text[]")],
+            ),
+            _schema_property("objects", "object[]", [_schema_property("count", "int")]),
+        ]
+    }
+)
+
+
+def _encode(data: dict) -> batch_pb2.BatchObject.Properties:
+    properties = batch_pb2.BatchObject.Properties()
+    _encode_properties(properties, data, _schema_encoders(_SCHEMA))
+    return properties
+
+
+def test_schema_encoders_match_untyped_encoding() -> None:
+    data = {
+        "text": "a",
+        "int": 1,
+        "bool": True,
+        "date": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        "uuid": uuid.UUID(int=1),
+        "texts": ["a", "b"],
+        "ints": [],
+        "dates": [datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)],
+        "object": {"name": "a", "tags": ["b"]},
+        "objects": [{"count": 1}, {"count": 2}],
+        "unknown": 1.5,
+        "none": None,
+    }
+    assert _encode(data) == _translate_properties_from_python_to_grpc(data, {})
+
+    # values that do not have the type of the schema are inspected
+    mismatched = {"int": "a", "texts": [1, 2], "object": "a", "objects": [1]}
+    assert _encode(mismatched) == _translate_properties_from_python_to_grpc(mismatched, {})
+
+
+def test_schema_encoders_use_the_schema_type() -> None:
+    props = _properties_from_config({"properties": [_schema_property("numbers", "number[]")]})
+    properties = batch_pb2.BatchObject.Properties()
+    _encode_properties(properties, {"numbers": [1, 2.5]}, _schema_encoders(props))
+    assert properties.number_array_properties[0].values_bytes == struct.pack("2d", 1, 2.5)
+
+    with pytest.raises(WeaviateInsertInvalidPropertyError):
+        _encode({"id": 1})
@@ -1,3 +1,7 @@
+import pickle
+import sys
+import uuid
+
 import pytest
 from pydantic import ValidationError
 
@@ -9,6 +13,13 @@ from weaviate.collections.classes.grpc import (
 )
 
 from weaviate.collections.classes.filters import Filter
+from weaviate.collections.classes.internal import (
+    GenerativeObject,
+    GroupByMetadataReturn,
+    GroupByObject,
+    MetadataReturn,
+    Object,
+)
 
 
 def test_link_to_errors_on_extra_variable() -> None:
@@ -34,3 +45,36 @@ def test_direct_init_filter() -> None:
 def test_direct_init_sort() -> None:
     with pytest.raises(TypeError):
         Sort()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclasses support slots from 3.10 on")
+def test_result_objects_have_no_instance_dict() -> None:
+    obj = Object(
+        uuid=uuid.UUID(int=1),
+        metadata=MetadataReturn(distance=0.5),
+        properties={"name": "test"},
+        references=None,
+        vector={},
+        collection="Test",
+    )
+    generative = GenerativeObject(
+        uuid=uuid.UUID(int=1),
+        metadata=MetadataReturn(),
+        properties={},
+        references=None,
+        vector={},
+        collection="Test",
+        generated="generated",
+    )
+    group_by = GroupByObject(
+        uuid=uuid.UUID(int=1),
+        metadata=GroupByMetadataReturn(distance=0.5),
+        properties={},
+        references=None,
+        vector={},
+        collection="Test",
+        belongs_to_group="group",
+    )
+    for result in (obj, obj.metadata, generative, group_by, group_by.metadata):
+        assert not hasattr(result, "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
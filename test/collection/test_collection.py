@@ -0,0 +1,79 @@
+import threading
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from weaviate.collections import collection as collection_module
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.tenants import Tenant
+from weaviate.collections.collection import Collection
+from weaviate.collections.collection_async import _CollectionAsync
+from weaviate.collections.grpc.query import _QueryGRPC
+from weaviate.collections.queries import base as query_base
+from weaviate.connect import ConnectionV4
+
+
+def test_namespaces_are_created_on_first_access(connection: ConnectionV4) -> None:
+    with patch.object(query_base, "_QueryGRPC", wraps=_QueryGRPC) as query_grpc:
+        collection = Collection(connection, "dummy", True, tenant="tenant")
+        query_grpc.assert_not_called()
+        query = collection.query
+        assert collection.query is query
+        query_grpc.assert_called_once()
+    assert query._name == "Dummy"
+    assert collection.data._tenant == "tenant"
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_namespaces_are_created_once_when_accessed_concurrently(
+    connection: ConnectionV4, asynchronous: bool
+) -> None:
+    collection: Any = Collection(connection, "dummy", True)
+    if asynchronous:
+        collection = _CollectionAsync(collection)
+    barrier = threading.Barrier(8)
+    queries: List[Any] = []
+
+    def access() -> None:
+        barrier.wait()
+        queries.append(collection.query)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(query) for query in queries}) == 1
+
+
+def test_derived_handles_share_stateless_namespaces(connection: ConnectionV4) -> None:
+    collection = Collection(connection, "dummy", True)
+    handle = collection.with_tenant("tenant")
+    assert collection.with_tenant("tenant").query is handle.query
+    assert collection.with_tenant(Tenant(name="tenant")).data is handle.data
+    assert collection.with_tenant("other").query is not handle.query
+    # batches have state, every collection object has its own
+    assert collection.with_tenant("tenant").batch is not handle.batch
+    assert handle.batch is handle.batch
+
+    strong = handle.with_consistency_level(ConsistencyLevel.ALL)
+    assert (
+        collection.with_consistency_level(ConsistencyLevel.ALL).with_tenant("tenant").query
+        is strong.query
+    )
+    assert strong.data._tenant == "tenant"
+    assert strong.data._consistency_level == ConsistencyLevel.ALL
+
+
+def test_derived_handles_are_bounded(connection: ConnectionV4) -> None:
+    collection = Collection(connection, "dummy", True)
+    with patch.object(collection_module, "HANDLE_CACHE_SIZE", 2):
+        first = collection.with_tenant("a").query
+        collection.with_tenant("b")
+        assert collection.with_tenant("a").query is first
+        collection.with_tenant("c")  # evicts "b", the least recently used tenant
+        assert collection.with_tenant("a").query is first
+        second = collection.with_tenant("b").query
+        collection.with_tenant("c")
+        assert collection.with_tenant("b").query is second
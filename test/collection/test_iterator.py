@@ -0,0 +1,116 @@
+import threading
+import uuid
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from weaviate.collections.classes.internal import MetadataReturn, Object
+from weaviate.collections.iterator import _ObjectIterator, _ScanIterator
+
+OBJECTS = [
+    Object(
+        uuid=uuid.UUID(int=i),
+        metadata=MetadataReturn(),
+        properties={"index": i},
+        references=None,
+        vector={},
+        collection="Test",
+    )
+    for i in range(10)
+]
+
+
+class _FetchObjects:
+    def __init__(self) -> None:
+        self.calls: List[Optional[uuid.UUID]] = []
+        self.threads: List[threading.Thread] = []
+
+    def __call__(
+        self, limit: int, after: Optional[uuid.UUID]
+    ) -> List[Object[Dict[str, Any], None]]:
+        self.calls.append(after)
+        self.threads.append(threading.current_thread())
+        start = 0 if after is None else after.int + 1
+        return OBJECTS[start : start + limit]
+
+
+def test_iterator_pages() -> None:
+    fetch = _FetchObjects()
+    iterator = _ObjectIterator(fetch, None, page_size=3)
+
+    assert [obj.properties["index"] for obj in iterator] == list(range(10))
+    assert fetch.calls == [
+        None,
+        uuid.UUID(int=2),
+        uuid.UUID(int=5),
+        uuid.UUID(int=8),
+        uuid.UUID(int=9),
+    ]
+    # all pages after the first one are prefetched in the background
+    assert all(thread is not threading.main_thread() for thread in fetch.threads[1:])
+
+
+def test_iterator_restarts() -> None:
+    fetch = _FetchObjects()
+    iterator = _ObjectIterator(fetch, uuid.UUID(int=6), page_size=2)
+
+    assert [obj.properties["index"] for obj in iterator] == [7, 8, 9]
+    assert next(iter(iterator)).properties["index"] == 7
+
+
+@pytest.mark.parametrize("parallelism", [1, 2, 3, 7])
+def test_scan_reads_every_object_once(parallelism: int) -> None:
+    # spread the objects over the whole uuid keyspace
+    objects = sorted(
+        (
+            Object(
+                uuid=uuid.UUID(int=(i * 0x9E3779B97F4A7C15F39CC0605CEDC835) % (1 << 128)),
+                metadata=MetadataReturn(),
+                properties={"index": i},
+                references=None,
+                vector={},
+                collection="Test",
+            )
+            for i in range(50)
+        ),
+        key=lambda obj: obj.uuid.int,
+    )
+
+    def fetch(limit: int, after: Optional[uuid.UUID]) -> List[Object[Dict[str, Any], None]]:
+        remaining = [obj for obj in objects if after is None or obj.uuid.int > after.int]
+        return remaining[:limit]
+
+    scanned = [obj.properties["index"] for obj in _ScanIterator(fetch, parallelism, page_size=4)]
+    assert sorted(scanned) == list(range(50))
+
+
+def test_iterator_arrow_batches() -> None:
+    pa = pytest.importorskip("pyarrow")
+    calls: List[Optional[uuid.UUID]] = []
+
+    def fetch_arrow(limit: int, after: Optional[uuid.UUID]) -> Any:
+        calls.append(after)
+        objects = _FetchObjects()(limit, after)
+        return pa.table(
+            {
+                "uuid": pa.array([obj.uuid.bytes for obj in objects], type=pa.binary(16)),
+                "index": pa.array([obj.properties["index"] for obj in objects], type=pa.int64()),
+            }
+        )
+
+    queries: List[Any] = []
+
+    def arrow_query() -> Any:
+        queries.append(fetch_arrow)
+        return fetch_arrow
+
+    iterator = _ObjectIterator(_FetchObjects(), None, page_size=4, arrow_query_factory=arrow_query)
+    batches = list(iterator.to_arrow_batches())
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert [i for batch in batches for i in batch.column("index").to_pylist()] == list(range(10))
+    assert calls == [None, uuid.UUID(int=3), uuid.UUID(int=7), uuid.UUID(int=9)]
+    # the query of the pages is created once per iteration
+    assert len(queries) == 1
+    list(iterator.to_arrow_batches())
+    assert len(queries) == 2
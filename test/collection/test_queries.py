@@ -1,8 +1,32 @@
+import array
+import asyncio
+import copy
+import dataclasses
+import datetime
+import pickle
+import struct
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List
+from unittest.mock import Mock, PropertyMock, patch
+
 import pytest
-from typing import Callable
-from weaviate.connect import ConnectionV4
-from weaviate.collections.query import _QueryCollection
-from weaviate.exceptions import WeaviateInvalidInputError
+
+from weaviate.collections.classes.config import DataType, _Property
+from weaviate.collections.classes.filters import Filter
+from weaviate.collections.classes.grpc import HybridFusion, MetadataQuery
+from weaviate.collections.classes.internal import MetadataReturn, Object, _QueryOptions
+from weaviate.collections.classes.types import GeoCoordinate
+from weaviate.collections.collection import Collection
+from weaviate.collections.collection_async import _AsyncNamespace
+from weaviate.config import ConnectionConfig, Timeout
+from weaviate.connect import ConnectionParams, ConnectionV4
+from weaviate.collections.queries.base import _deserialize_properties
+from weaviate.collections.query import _GenerateCollection, _QueryCollection
+from weaviate.exceptions import WeaviateInvalidInputError, WeaviateQueryError
+from weaviate.proto.v1 import base_pb2, properties_pb2, search_get_pb2
 
 # TODO: re-enable tests once string syntax is re-enabled in the API
 
@@ -127,3 +151,609 @@ def test_bad_query_inputs(connection: ConnectionV4) -> None:
 
     # near image
     _test_query(lambda: query.near_image(42))
+
+
+@contextmanager
+def _answer_searches(
+    connection: ConnectionV4,
+    search: Callable[[search_get_pb2.SearchRequest], search_get_pb2.SearchReply],
+) -> Iterator[None]:
+    """Answer the searches that are sent over the gRPC stub of `connection` with `search`."""
+    stub = Mock()
+    stub.Search.with_call.side_effect = lambda request, **kwargs: (search(request), None)
+    with patch.object(
+        connection, "acquire_grpc_stub", return_value=nullcontext(stub)
+    ), patch.object(connection, "timeout_config", Timeout()):
+        yield
+
+
+def _search_reply(vectors: List[Dict[str, List[float]]]) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=i).bytes,
+                    vectors=[
+                        base_pb2.Vectors(name=name, vector_bytes=struct.pack(f"{len(v)}f", *v))
+                        for name, v in vecs.items()
+                    ],
+                )
+            )
+            for i, vecs in enumerate(vectors)
+        ]
+    )
+
+
+_OPTIONS = _QueryOptions(
+    include_metadata=False,
+    include_properties=False,
+    include_references=False,
+    include_vector=True,
+    is_group_by=False,
+)
+
+
+def test_vector_format_list(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    res = query._result_to_query_return(_search_reply([{"a": [1.0, 2.0]}]), _OPTIONS, None, None)
+    assert res.objects[0].vector == {"a": [1.0, 2.0]}
+    assert res.vectors == {}
+
+
+def test_vector_format_numpy(connection: ConnectionV4) -> None:
+    np = pytest.importorskip("numpy")
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True, "numpy")
+    res = query._result_to_query_return(
+        _search_reply([{"a": [1.0, 2.0], "b": [1.0]}, {"a": [3.0, 4.0], "b": [1.0, 2.0]}]),
+        _OPTIONS,
+        None,
+        None,
+    )
+    assert res.vectors["a"].shape == (2, 2)
+    assert res.vectors["a"].dtype == np.float32
+    assert res.vectors["a"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    # the object vectors are views of the stacked matrix
+    assert np.shares_memory(res.objects[1].vector["a"], res.vectors["a"])
+    # vectors with differing dimensions are not stacked
+    assert "b" not in res.vectors
+    assert res.objects[1].vector["b"].tolist() == [1.0, 2.0]
+
+
+def _legacy_search_reply(vectors: List[List[float]]) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=i).bytes, vector=vector
+                )
+            )
+            for i, vector in enumerate(vectors)
+        ]
+    )
+
+
+def test_vector_format_numpy_legacy_vector(connection: ConnectionV4) -> None:
+    np = pytest.importorskip("numpy")
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True, "numpy")
+    res = query._result_to_query_return(
+        _legacy_search_reply([[1.0, 2.0], [3.0, 4.0]]), _OPTIONS, None, None
+    )
+    assert res.vectors["default"].dtype == np.float32
+    assert res.vectors["default"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    assert res.objects[1].vector["default"].tolist() == [3.0, 4.0]
+
+
+def test_return_format_arrow_legacy_vector(connection: ConnectionV4) -> None:
+    pa = pytest.importorskip("pyarrow")
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    table = query._result_to_query_return(
+        _legacy_search_reply([[1.0, 2.0], [3.0, 4.0]]), _OPTIONS, None, None, return_format="arrow"
+    )
+    assert table.column("vector").type == pa.list_(pa.float32(), 2)
+    assert table.column("vector").to_pylist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_with_vector_format(connection: ConnectionV4) -> None:
+    collection = Collection(connection, "dummy", True)
+    with pytest.raises(WeaviateInvalidInputError):
+        collection.with_vector_format("wrong")  # type: ignore
+    assert collection.with_vector_format("list").query._vector_format == "list"
+
+
+def test_deserialize_properties() -> None:
+    properties = properties_pb2.Properties(
+        fields={
+            "text": properties_pb2.Value(string_value="hello"),
+            "int": properties_pb2.Value(int_value=1),
+            "number": properties_pb2.Value(number_value=0.5),
+            "bool": properties_pb2.Value(bool_value=True),
+            "blob": properties_pb2.Value(blob_value="YQ=="),
+            "uuid": properties_pb2.Value(uuid_value=str(uuid.UUID(int=1))),
+            "date": properties_pb2.Value(date_value="2023-01-01T00:00:00.123456789Z"),
+            "list": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    values=[properties_pb2.Value(int_value=1), properties_pb2.Value(int_value=2)]
+                )
+            ),
+            "object": properties_pb2.Value(
+                object_value=properties_pb2.Properties(
+                    fields={"nested": properties_pb2.Value(string_value="world")}
+                )
+            ),
+            "geo": properties_pb2.Value(
+                geo_value=properties_pb2.GeoCoordinate(latitude=1.0, longitude=2.0)
+            ),
+            "null": properties_pb2.Value(null_value=0),
+        }
+    )
+    assert _deserialize_properties(properties) == {
+        "text": "hello",
+        "int": 1,
+        "number": 0.5,
+        "bool": True,
+        "blob": "YQ==",
+        "uuid": uuid.UUID(int=1),
+        "date": datetime.datetime(2023, 1, 1, 0, 0, 0, 123456, tzinfo=datetime.timezone.utc),
+        "list": [1, 2],
+        "object": {"nested": "world"},
+        "geo": GeoCoordinate(latitude=1.0, longitude=2.0),
+        "null": None,
+    }
+
+
+def test_deserialize_unset_value() -> None:
+    properties = properties_pb2.Properties(fields={"unset": properties_pb2.Value()})
+    with pytest.warns(UserWarning):
+        assert _deserialize_properties(properties) == {"unset": None}
+
+
+def test_query_objects_are_decoded_lazily(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    reply = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    target_collection="Dummy",
+                    non_ref_props=properties_pb2.Properties(
+                        fields={"name": properties_pb2.Value(string_value="test")}
+                    ),
+                ),
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=1).bytes, distance=0.5, distance_present=True
+                ),
+            )
+        ]
+    )
+    options = _QueryOptions(
+        include_metadata=True,
+        include_properties=True,
+        include_references=False,
+        include_vector=False,
+        is_group_by=False,
+    )
+
+    def lazy() -> Object[Any, Any]:
+        return query._result_to_query_return(reply, options, None, None).objects[0]
+
+    obj = lazy()
+    assert obj.uuid == uuid.UUID(int=1)
+    assert obj.metadata.distance == 0.5
+    # fields that have not been accessed are not decoded, their slots are empty
+    with pytest.raises(AttributeError):
+        object.__getattribute__(obj, "properties")
+
+    expected = Object(
+        uuid=uuid.UUID(int=1),
+        metadata=MetadataReturn(distance=0.5),
+        properties={"name": "test"},
+        references=None,
+        vector={},
+        collection="Dummy",
+    )
+    assert obj == expected
+    assert expected == obj
+
+    unpickled = pickle.loads(pickle.dumps(obj))
+    assert type(unpickled) is Object
+    assert unpickled == expected
+
+    # the dataclass functions see all fields, also the ones that have not been decoded yet
+    assert dataclasses.asdict(lazy()) == dataclasses.asdict(expected)
+    assert dataclasses.astuple(lazy()) == dataclasses.astuple(expected)
+    replaced = dataclasses.replace(lazy(), collection="Other")
+    assert type(replaced) is Object
+    assert replaced == dataclasses.replace(expected, collection="Other")
+    for copied in (copy.copy(lazy()), copy.deepcopy(lazy())):
+        assert type(copied) is Object
+        assert copied == expected
+    assert isinstance(obj, Object)
+    assert repr(lazy()).startswith("Object(")
+
+
+def test_many_runs_queries_concurrently(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def run(i: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return i
+
+    results = query.many([lambda q, i=i: run(i) for i in range(12)], concurrency=4)
+    assert results == list(range(12))
+    assert 1 < max_running <= 4
+
+    assert query.many([]) == []
+    with pytest.raises(WeaviateInvalidInputError):
+        query.many([lambda q: None], concurrency=0)
+
+
+def test_many_raises_first_error(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+
+    def fail(q: _QueryCollection) -> None:
+        raise WeaviateQueryError("failed", "GRPC search")
+
+    with pytest.raises(WeaviateQueryError):
+        query.many([lambda q: None, fail, lambda q: None], concurrency=2)
+
+
+def test_return_format_arrow(connection: ConnectionV4) -> None:
+    pa = pytest.importorskip("pyarrow")
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    reply = search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    non_ref_props=properties_pb2.Properties(
+                        fields={
+                            "name": properties_pb2.Value(string_value=f"name{i}"),
+                            "count": properties_pb2.Value(int_value=i),
+                        }
+                    ),
+                ),
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=i).bytes,
+                    distance=i / 2,
+                    distance_present=True,
+                    vector_bytes=struct.pack("2f", i, i + 1),
+                ),
+            )
+            for i in range(2)
+        ]
+    )
+    options = _QueryOptions(
+        include_metadata=True,
+        include_properties=True,
+        include_references=False,
+        include_vector=True,
+        is_group_by=False,
+    )
+    # the connection of the fixture has no REST client, the columns are inferred from the reply
+    table = query._result_to_query_return(reply, options, None, None, return_format="arrow")
+
+    assert set(table.column_names) == {"uuid", "name", "count", "vector", "distance"}
+    assert table.column("uuid").to_pylist() == [uuid.UUID(int=i).bytes for i in range(2)]
+    assert table.column("name").to_pylist() == ["name0", "name1"]
+    assert table.column("count").type == pa.int64()
+    assert table.column("vector").type == pa.list_(pa.float32(), 2)
+    assert table.column("vector").to_pylist() == [[0.0, 1.0], [1.0, 2.0]]
+    assert table.column("distance").to_pylist() == [0.0, 0.5]
+
+
+def _schema_property(name: str, data_type: DataType) -> _Property:
+    return _Property(
+        name=name,
+        description=None,
+        data_type=data_type,
+        index_filterable=True,
+        index_searchable=False,
+        nested_properties=None,
+        tokenization=None,
+        vectorizer_config=None,
+        vectorizer=None,
+    )
+
+
+def test_return_format_arrow_columns_from_schema(connection: ConnectionV4) -> None:
+    pa = pytest.importorskip("pyarrow")
+    options = _QueryOptions(
+        include_metadata=False,
+        include_properties=True,
+        include_references=False,
+        include_vector=False,
+        is_group_by=False,
+    )
+
+    def page(fields: List[Dict[str, properties_pb2.Value]]) -> search_get_pb2.SearchReply:
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(fields=props)
+                    ),
+                    metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes),
+                )
+                for i, props in enumerate(fields)
+            ]
+        )
+
+    schema = [
+        _schema_property("name", DataType.TEXT),
+        _schema_property("count", DataType.INT),
+        _schema_property("tags", DataType.TEXT_ARRAY),
+        _schema_property("data", DataType.BLOB),
+    ]
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)._with_arrow_schema(
+        schema
+    )
+    # the first page has no counts and null tags, the second one no names
+    first = query._result_to_query_return(
+        page(
+            [
+                {
+                    "name": properties_pb2.Value(string_value="a"),
+                    "tags": properties_pb2.Value(null_value=0),
+                }
+            ]
+        ),
+        options,
+        None,
+        None,
+        return_format="arrow",
+    )
+    second = query._result_to_query_return(
+        page([{"count": properties_pb2.Value(int_value=1)}]),
+        options,
+        None,
+        None,
+        return_format="arrow",
+    )
+    selected = query._result_to_query_return(
+        page([{"count": properties_pb2.Value(int_value=1)}]),
+        options,
+        ["name", "count"],
+        None,
+        return_format="arrow",
+    )
+
+    assert first.schema == second.schema
+    assert first.column_names == ["uuid", "name", "count", "tags"]
+    assert first.column("count").type == pa.int64()
+    assert first.column("tags").type == pa.list_(pa.string())
+    assert first.column("count").to_pylist() == [None]
+    assert second.column("name").to_pylist() == [None]
+    assert selected.column_names == ["uuid", "name", "count"]
+
+
+def test_return_format_arrow_rejects_references_and_groups(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    with pytest.raises(WeaviateInvalidInputError):
+        query._result_to_query_return(
+            search_get_pb2.SearchReply(), _OPTIONS, None, [], return_format="arrow"
+        )
+    with pytest.raises(WeaviateInvalidInputError):
+        query._result_to_query_or_groupby_return(
+            search_get_pb2.SearchReply(),
+            _QueryOptions(
+                include_metadata=False,
+                include_properties=True,
+                include_references=False,
+                include_vector=False,
+                is_group_by=True,
+            ),
+            None,
+            None,
+            return_format="arrow",
+        )
+
+
+def test_prepared_query_builds_the_same_requests(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "dummy", None, None, None, None, True)
+    requests: List[search_get_pb2.SearchRequest] = []
+
+    def search(request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        requests.append(request)
+        return _search_reply([{"default": [1.0, 2.0]}])
+
+    options = {
+        "filters": Filter.by_property("name").equal("test"),
+        "return_metadata": MetadataQuery(distance=True),
+        "return_properties": ["name", "count"],
+        "target_vector": "default",
+    }
+    with _answer_searches(connection, search):
+        prepared = query.prepare(limit=10, **options)  # type: ignore
+        res = prepared.near_vector([1.0, 2.0], limit=3, distance=0.5)
+        prepared.near_vector(array.array("f", [1.0, 2.0]), limit=3, distance=0.5)
+        prepared.near_text("text")
+        prepared.bm25("text", query_properties=["name"])
+
+        query.near_vector([1.0, 2.0], limit=3, distance=0.5, **options)  # type: ignore
+        query.near_text("text", limit=10, **options)  # type: ignore
+        del options["target_vector"]
+        query.bm25("text", query_properties=["name"], limit=10, **options)  # type: ignore
+
+    assert requests[0] == requests[4]
+    assert requests[1] == requests[4]
+    assert requests[2] == requests[5]
+    assert requests[3] == requests[6]
+    assert len(res.objects) == 1
+    assert res.objects[0].uuid == uuid.UUID(int=0)
+
+
+def test_query_cache() -> None:
+    connection = ConnectionV4(
+        ConnectionParams.from_url("http://localhost:8080", 50051),
+        None,
+        (10, 60),
+        None,
+        True,
+        None,
+        ConnectionConfig(query_cache=True),
+        None,
+    )
+    connection._Connection__connected = True  # type: ignore
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+    requests: List[search_get_pb2.SearchRequest] = []
+
+    def search(request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        requests.append(request)
+        return _search_reply([{"default": [1.0, 2.0]}])
+
+    with _answer_searches(connection, search):
+        first = query.bm25("text", limit=3)
+        second = query.bm25("text", limit=3)
+        assert len(requests) == 1
+        assert second.objects[0].uuid == first.objects[0].uuid
+
+        query.bm25("text", limit=4)
+        assert len(requests) == 2
+
+        connection.invalidate_query_cache("Dummy")
+        query.bm25("text", limit=3)
+        assert len(requests) == 3
+
+        generate = _GenerateCollection(connection, "Dummy", None, None, None, None, True)
+        generate.bm25("text", limit=3, single_prompt="prompt")
+        generate.bm25("text", limit=3, single_prompt="prompt")
+        assert len(requests) == 5
+
+
+def _scored_reply(field: str, values: List[float]) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(
+        results=[
+            search_get_pb2.SearchResult(
+                metadata=search_get_pb2.MetadataResult(
+                    id_as_bytes=uuid.UUID(int=i).bytes, **{field: value, f"{field}_present": True}
+                )
+            )
+            for i, value in enumerate(values)
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "field,values,expected",
+    [
+        (
+            "distance",
+            {"a": [0.1, 0.4, 0.5], "b": [0.2, 0.3, 0.9], "c": []},
+            [("a", 0.1), ("b", 0.2), ("b", 0.3), ("a", 0.4)],
+        ),
+        (
+            "score",
+            {"a": [0.9, 0.4, 0.3], "b": [0.8, 0.7, 0.1], "c": []},
+            [("a", 0.9), ("b", 0.8), ("b", 0.7), ("a", 0.4)],
+        ),
+    ],
+)
+def test_query_across_tenants(
+    connection: ConnectionV4,
+    field: str,
+    values: Dict[str, List[float]],
+    expected: List[tuple],
+) -> None:
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+    requests: List[search_get_pb2.SearchRequest] = []
+    lock = threading.Lock()
+
+    def search(request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        with lock:
+            requests.append(request)
+        return _scored_reply(field, values[request.tenant])
+
+    with _answer_searches(connection, search):
+        res = query.across_tenants(
+            ["a", "b", "c", "a"],
+            lambda q: q.hybrid(
+                "text",
+                fusion_type=HybridFusion.RANKED,
+                limit=3,
+                return_metadata=MetadataQuery(score=True),
+            ),
+            limit=4,
+            concurrency=2,
+        )
+
+    assert sorted(request.tenant for request in requests) == ["a", "b", "c"]
+    assert list(zip(res.tenants, [getattr(obj.metadata, field) for obj in res.objects])) == [
+        (tenant, pytest.approx(value)) for tenant, value in expected
+    ]
+
+
+def test_query_across_tenants_requires_distance_or_score(connection: ConnectionV4) -> None:
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+    with _answer_searches(connection, lambda _: _search_reply([{}])):
+        with pytest.raises(WeaviateInvalidInputError):
+            query.across_tenants(["a", "b"], lambda q: q.fetch_objects(limit=1), limit=1)
+        with pytest.raises(WeaviateInvalidInputError):
+            query.across_tenants(["a"], lambda q: q.fetch_objects(limit=1), limit=0)
+
+
+@pytest.mark.parametrize(
+    "search",
+    [
+        lambda q: q.bm25("text", limit=1, return_metadata=MetadataQuery(score=True)),
+        lambda q: q.hybrid("text", limit=1, return_metadata=MetadataQuery(score=True)),
+        lambda q: q.hybrid(
+            "text",
+            fusion_type=HybridFusion.RELATIVE_SCORE,
+            limit=1,
+            return_metadata=MetadataQuery(score=True),
+        ),
+        # only the scores of a single search are ordered
+        lambda q: [
+            q.hybrid(
+                "text",
+                fusion_type=HybridFusion.RANKED,
+                limit=1,
+                return_metadata=MetadataQuery(score=True),
+            )
+            for _ in range(2)
+        ][-1],
+    ],
+)
+def test_query_across_tenants_rejects_incomparable_scores(
+    connection: ConnectionV4, search: Callable[[_QueryCollection], Any]
+) -> None:
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+    with _answer_searches(connection, lambda _: _scored_reply("score", [0.5])):
+        with pytest.raises(WeaviateInvalidInputError):
+            query.across_tenants(["a", "b"], search, limit=1)
+
+
+def test_async_query_builds_and_decodes_once(connection: ConnectionV4) -> None:
+    connection.timeout_config = Timeout()
+    query = _QueryCollection(connection, "Dummy", None, None, None, None, True)
+    namespace = _AsyncNamespace(query, frozenset(["near_vector"]), frozenset(["near_vector"]))
+    requests: List[search_get_pb2.SearchRequest] = []
+
+    class Stub:
+        async def Search(
+            self, request: search_get_pb2.SearchRequest, **kwargs: Any
+        ) -> search_get_pb2.SearchReply:
+            requests.append(request)
+            return _search_reply([{"default": [1.0, 2.0]}])
+
+    with patch.object(
+        ConnectionV4, "agrpc_stub", new_callable=PropertyMock, return_value=Stub()
+    ), patch.object(
+        _QueryCollection,
+        "_result_to_query_or_groupby_return",
+        autospec=True,
+        side_effect=_QueryCollection._result_to_query_or_groupby_return,
+    ) as decode:
+        res = asyncio.run(namespace.near_vector([1.0, 2.0], limit=3))
+
+    assert len(requests) == 1
+    assert requests[0].limit == 3
+    assert decode.call_count == 1
+    assert res.objects[0].uuid == uuid.UUID(int=0)
@@ -0,0 +1,58 @@
+from contextlib import ExitStack
+
+import grpc
+import pytest
+
+from weaviate.config import ConnectionConfig
+from weaviate.connect.grpc_pool import _GrpcChannelPool
+
+
+def _pool(selection: str) -> _GrpcChannelPool:
+    # channels connect lazily, no server is needed to select them
+    return _GrpcChannelPool(
+        [grpc.insecure_channel("localhost:1") for _ in range(3)], selection  # type: ignore
+    )
+
+
+def test_round_robin() -> None:
+    pool = _pool("round_robin")
+    stubs = []
+    for _ in range(6):
+        with pool.acquire() as stub:
+            stubs.append(stub)
+    assert stubs[:3] == stubs[3:]
+    assert len({id(stub) for stub in stubs}) == 3
+    assert pool.outstanding() == [0, 0, 0]
+    pool.close()
+
+
+def test_least_outstanding() -> None:
+    pool = _pool("least_outstanding")
+    with ExitStack() as stack:
+        first = stack.enter_context(pool.acquire())
+        second = stack.enter_context(pool.acquire())
+        assert first is not second
+        assert pool.outstanding() == [1, 1, 0]
+        with pool.acquire():
+            assert pool.outstanding() == [1, 1, 1]
+        with pool.acquire():
+            # the third channel is free again while the others are still busy
+            assert pool.outstanding() == [1, 1, 1]
+    assert pool.outstanding() == [0, 0, 0]
+    pool.close()
+
+
+def test_single_channel() -> None:
+    pool = _GrpcChannelPool([grpc.insecure_channel("localhost:1")], "least_outstanding")
+    with pool.acquire() as stub:
+        assert stub is pool.stub
+    pool.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"grpc_channels": 0}, {"grpc_channel_selection": "random"}],
+)
+def test_invalid_config(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        ConnectionConfig(**kwargs)
@@ -0,0 +1,100 @@
+import time
+
+import pytest
+
+from weaviate.config import ConnectionConfig
+from weaviate.connect.query_cache import _QueryCache
+from weaviate.proto.v1 import search_get_pb2
+
+
+def _reply(took: float = 1.0) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(took=took)
+
+
+def test_get_and_put() -> None:
+    cache = _QueryCache(max_entries=10, max_bytes=1024, ttl=60)
+    assert cache.get(b"a") is None
+    reply = _reply()
+    cache.put("Coll", b"a", reply, cache.generation("Coll"))
+    assert cache.get(b"a") is reply
+    assert len(cache) == 1
+    assert cache.size_bytes == reply.ByteSize() + 1
+
+
+def test_ttl() -> None:
+    cache = _QueryCache(max_entries=10, max_bytes=1024, ttl=0.01)
+    cache.put("Coll", b"a", _reply(), cache.generation("Coll"))
+    time.sleep(0.02)
+    assert cache.get(b"a") is None
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_evicts_least_recently_used_entries() -> None:
+    cache = _QueryCache(max_entries=2, max_bytes=1024, ttl=60)
+    cache.put("Coll", b"a", _reply(), 0)
+    cache.put("Coll", b"b", _reply(), 0)
+    cache.get(b"a")
+    cache.put("Coll", b"c", _reply(), 0)
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None
+    assert cache.get(b"c") is not None
+
+
+def test_evicts_entries_over_the_memory_budget() -> None:
+    size = _reply().ByteSize() + 1
+    cache = _QueryCache(max_entries=10, max_bytes=2 * size, ttl=60)
+    for key in [b"a", b"b", b"c"]:
+        cache.put("Coll", key, _reply(), 0)
+    assert len(cache) == 2
+    assert cache.get(b"a") is None
+    assert cache.size_bytes == 2 * size
+
+    # replies that are larger than the budget are not stored at all
+    small = _QueryCache(max_entries=10, max_bytes=size - 1, ttl=60)
+    small.put("Coll", b"a", _reply(), 0)
+    assert len(small) == 0
+
+
+def test_invalidate() -> None:
+    cache = _QueryCache(max_entries=10, max_bytes=1024, ttl=60)
+    cache.put("Coll", b"a", _reply(), 0)
+    cache.put("Other", b"b", _reply(), 0)
+    cache.invalidate("Coll")
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") is not None
+    assert cache.size_bytes == _reply().ByteSize() + 1
+
+
+def test_reply_of_search_overlapping_a_write_is_not_stored() -> None:
+    cache = _QueryCache(max_entries=10, max_bytes=1024, ttl=60)
+    generation = cache.generation("Coll")
+    cache.invalidate("Coll")  # a write finished while the search was in flight
+    cache.put("Coll", b"a", _reply(), generation)
+    assert cache.get(b"a") is None
+
+    cache.put("Coll", b"a", _reply(), cache.generation("Coll"))
+    assert cache.get(b"a") is not None
+
+
+def test_clear() -> None:
+    cache = _QueryCache(max_entries=10, max_bytes=1024, ttl=60)
+    cache.put("Coll", b"a", _reply(), 0)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs,error",
+    [
+        ({"query_cache": 1}, TypeError),
+        ({"query_cache_ttl": "60"}, TypeError),
+        ({"query_cache_ttl": 0}, ValueError),
+        ({"query_cache_max_entries": 0}, ValueError),
+        ({"query_cache_max_bytes": 1.5}, TypeError),
+    ],
+)
+def test_invalid_config(kwargs: dict, error: type) -> None:
+    with pytest.raises(error):
+        ConnectionConfig(**kwargs)
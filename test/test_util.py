@@ -1,5 +1,8 @@
+import base64
+import os
 import unittest
 import uuid as uuid_lib
+from pathlib import Path
 from copy import deepcopy
 from unittest.mock import patch, Mock
 import pytest
@@ -22,6 +25,10 @@ from weaviate.util import (
     is_weaviate_too_old,
     is_weaviate_client_too_old,
     MINIMUM_NO_WARNING_VERSION,
+    file_encoder_b64,
+    _EncodedFileCache,
+    _encode_media,
+    MAX_PATH_LENGTH,
 )
 
 schema_set = {
@@ -575,3 +582,55 @@ def test_is_weaviate_too_old(version: str, too_old: bool):
 )
 def test_is_weaviate_client_too_old(current_version: str, latest_version: str, too_old: bool):
     assert is_weaviate_client_too_old(current_version, latest_version) is too_old
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 65535, 65536, 200_001])
+def test_file_encoder_b64_sizes(tmp_path: Path, size: int) -> None:
+    content = os.urandom(size)
+    path = tmp_path / "file.bin"
+    path.write_bytes(content)
+    expected = base64.b64encode(content).decode("utf-8")
+
+    assert file_encoder_b64(str(path)) == expected
+    assert file_encoder_b64(path) == expected
+    with open(path, "rb") as file:
+        assert file_encoder_b64(file) == expected
+
+
+def test_encoded_file_cache(tmp_path: Path) -> None:
+    cache = _EncodedFileCache(max_bytes=16)
+    first, second = tmp_path / "first.bin", tmp_path / "second.bin"
+    first.write_bytes(b"123456")
+    second.write_bytes(b"abcdef")
+
+    encoded = cache.encode(first)
+    assert encoded == "MTIzNDU2"
+    assert cache.encode(str(first)) is encoded
+
+    # a modified file is encoded again
+    first.write_bytes(b"654321")
+    os.utime(first, ns=(0, 1))
+    assert cache.encode(first) == "NjU0MzIx"
+
+    # the least recently used encoding is dropped once the cache is full
+    cache.encode(second)
+    encoded = cache.encode(first)
+    third = tmp_path / "third.bin"
+    third.write_bytes(b"ghijkl")
+    cache.encode(third)
+    assert cache.encode(first) is encoded
+    assert cache.encode(second) == "YWJjZGVm"
+
+
+def test_encode_media_skips_the_file_system_for_encoded_media(tmp_path: Path) -> None:
+    path = tmp_path / "image.bin"
+    path.write_bytes(b"123456")
+    assert _encode_media(str(path)) == "MTIzNDU2"
+    assert _encode_media("MTIzNDU2") == "MTIzNDU2"
+
+    encoded = base64.b64encode(b"\xff" * MAX_PATH_LENGTH).decode("utf-8")
+    without_separators = "A" * 1024
+    with patch("os.path.isfile") as isfile:
+        assert _encode_media(encoded) == encoded
+        assert _encode_media(without_separators) == without_separators
+    isfile.assert_not_called()
@@ -2,6 +2,7 @@
 Client class definition.
 """
 
+import asyncio
 from typing import Generic, Optional, Tuple, TypeVar, Union, Dict, Any
 
 from httpx import HTTPError as HttpxError
@@ -15,6 +16,7 @@ from .backup import Backup
 from .batch import Batch
 from .classification import Classification
 from .cluster import Cluster
+from .collections.collection_async import _CollectionsAsync
 from .collections.collections import _Collections
 from .collections.batch.client import _BatchClientWrapper
 from .collections.cluster import _Cluster
@@ -25,6 +27,7 @@ from .connect.base import (
     ProtocolParams,
     TIMEOUT_TYPE_RETURN,
 )
+from .connect.metrics import RestEndpointMetrics
 from .connect.v4 import _ExpectedStatusCodes
 from .contextionary import Contextionary
 from .data import DataObject
@@ -290,6 +293,18 @@ class WeaviateClient(_ClientBase[ConnectionV4]):
         """
         return self._connection.is_connected()
 
+    def rest_metrics(self) -> Dict[str, RestEndpointMetrics]:
+        """Get the metrics of the REST requests that this client sent to Weaviate, e.g. to tune `ConnectionConfig`.
+
+        The metrics are grouped by endpoint, e.g. `batch`, `graphql`, `schema` or `schema/tenants`. Queries and batch
+        imports of objects are sent over gRPC and are not included.
+
+        Returns:
+            `Dict[str, RestEndpointMetrics]`
+                A copy of the metrics of every endpoint that a request was sent to.
+        """
+        return self._connection.rest_metrics()
+
     def is_live(self) -> bool:
         try:
             self._connection._ping_grpc()
@@ -345,6 +360,94 @@ class WeaviateClient(_ClientBase[ConnectionV4]):
         return _RawGQLReturn(aggregate={}, explore={}, get={}, errors=errors)
 
 
+class WeaviateAsyncClient:
+    """
+    The asyncio counterpart of `WeaviateClient` for use within a running event loop, e.g. in async web services.
+
+    The queries of the `query` and `generate` namespaces of its collections are sent over the async gRPC channel of
+    the connection and never block the event loop. All other methods are coroutines that run the corresponding
+    synchronous method in the default executor of the event loop. Connect and use the client within a single event loop.
+
+    Attributes:
+        `collections`
+            A `_CollectionsAsync` object instance connected to the same Weaviate instance as the Client.
+    """
+
+    def __init__(
+        self,
+        connection_params: Optional[ConnectionParams] = None,
+        embedded_options: Optional[EmbeddedOptions] = None,
+        auth_client_secret: Optional[AuthCredentials] = None,
+        additional_headers: Optional[dict] = None,
+        additional_config: Optional[AdditionalConfig] = None,
+        skip_init_checks: bool = False,
+    ) -> None:
+        """Initialise a WeaviateAsyncClient class instance, it takes the same arguments as `WeaviateClient`."""
+        self.__client = WeaviateClient(
+            connection_params=connection_params,
+            embedded_options=embedded_options,
+            auth_client_secret=auth_client_secret,
+            additional_headers=additional_headers,
+            additional_config=additional_config,
+            skip_init_checks=skip_init_checks,
+        )
+        self._connection = self.__client._connection
+        self.collections = _CollectionsAsync(self.__client.collections)
+        """This namespace contains all the functionality to manage Weaviate data collections. It is your main entry point for all collection-related functionality.
+
+        Use it to retrieve collection objects using `client.collections.get("MyCollection")` or to create new collections using `await client.collections.create("MyCollection", ...)`.
+        """
+
+    async def __aenter__(self) -> "WeaviateAsyncClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Connect to the Weaviate instance and open the async channels on the running event loop.
+
+        Raises:
+            `weaviate.WeaviateConnectionError`
+                If the network connection to weaviate fails.
+            `weaviate.UnexpectedStatusCodeException`
+                If weaviate reports a none OK status.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.__client.connect)
+        await self._connection.aopen()
+
+    async def close(self) -> None:
+        """In order to clean up any resources used by the client, call this method when you are done with it."""
+        await self._connection.aclose()
+        self.__client.close()
+
+    def is_connected(self) -> bool:
+        """Check if the client is connected to Weaviate.
+
+        Returns:
+            `bool`
+                `True` if the client is connected to Weaviate with an open connection pool, `False` otherwise.
+        """
+        return self.__client.is_connected()
+
+    def rest_metrics(self) -> Dict[str, RestEndpointMetrics]:
+        """Get the metrics of the REST requests that this client sent to Weaviate, see `WeaviateClient.rest_metrics`."""
+        return self.__client.rest_metrics()
+
+    async def is_ready(self) -> bool:
+        """Ping Weaviate's ready state, see `WeaviateClient.is_ready`."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.__client.is_ready)
+
+    async def is_live(self) -> bool:
+        """Ping Weaviate's live state, see `WeaviateClient.is_live`."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.__client.is_live)
+
+    async def get_meta(self) -> dict:
+        """Get the meta endpoint description of weaviate, see `WeaviateClient.get_meta`."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.__client.get_meta)
+
+
 class Client(_ClientBase[Connection]):
     """
     The v3 Python-native Weaviate Client class that encapsulates Weaviate functionalities in one object.
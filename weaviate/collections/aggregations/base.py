@@ -1,9 +1,10 @@
 import io
 import json
-import os
 import pathlib
 
-from typing import List, Optional, TypeVar, Union, cast
+from typing import Callable, List, Optional, Tuple, Type, TypeVar, Union, cast
+
+from httpx import Response
 from typing_extensions import ParamSpec
 
 from weaviate.collections.classes.aggregate import (
@@ -33,10 +34,11 @@ from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.filters import _Filters
 from weaviate.collections.classes.grpc import Move
 from weaviate.connect import ConnectionV4
+from weaviate.connect.v4 import _async_requests
 from weaviate.collections.filters import _FilterToREST
 from weaviate.exceptions import WeaviateInvalidInputError, WeaviateQueryError
 from weaviate.gql.aggregate import AggregateBuilder
-from weaviate.util import file_encoder_b64
+from weaviate.util import _decode_json_response_dict, _encode_media
 from weaviate.validator import _ValidateArgument, _validate_input
 from weaviate.types import NUMBER, UUID
 
@@ -44,6 +46,77 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+_PropertyParser = Callable[[dict], AggregateResult]
+
+
+def _parse_text(property_: dict) -> AggregateText:
+    return AggregateText(
+        count=property_.get("count"),
+        top_occurrences=[
+            TopOccurrence(count=top_occurrence.get("occurs"), value=top_occurrence.get("value"))
+            for top_occurrence in property_.get("topOccurrences", [])
+        ],
+    )
+
+
+def _parse_integer(property_: dict) -> AggregateInteger:
+    return AggregateInteger(
+        count=property_.get("count"),
+        maximum=property_.get("maximum"),
+        mean=property_.get("mean"),
+        median=property_.get("median"),
+        minimum=property_.get("minimum"),
+        mode=property_.get("mode"),
+        sum_=property_.get("sum"),
+    )
+
+
+def _parse_number(property_: dict) -> AggregateNumber:
+    return AggregateNumber(
+        count=property_.get("count"),
+        maximum=property_.get("maximum"),
+        mean=property_.get("mean"),
+        median=property_.get("median"),
+        minimum=property_.get("minimum"),
+        mode=property_.get("mode"),
+        sum_=property_.get("sum"),
+    )
+
+
+def _parse_boolean(property_: dict) -> AggregateBoolean:
+    return AggregateBoolean(
+        count=property_.get("count"),
+        percentage_false=property_.get("percentageFalse"),
+        percentage_true=property_.get("percentageTrue"),
+        total_false=property_.get("totalFalse"),
+        total_true=property_.get("totalTrue"),
+    )
+
+
+def _parse_date(property_: dict) -> AggregateDate:
+    return AggregateDate(
+        count=property_.get("count"),
+        maximum=property_.get("maximum"),
+        median=property_.get("median"),
+        minimum=property_.get("minimum"),
+        mode=property_.get("mode"),
+    )
+
+
+# Aggregate references currently bugged on Weaviate's side
+# def _parse_reference(property_: dict) -> AggregateReference:
+#     return AggregateReference(pointing_to=property_.get("pointingTo"))
+
+
+_PROPERTY_PARSERS: List[Tuple[Type[_Metrics], _PropertyParser]] = [
+    (_MetricsText, _parse_text),
+    (_MetricsInteger, _parse_integer),
+    (_MetricsNumber, _parse_number),
+    (_MetricsBoolean, _parse_boolean),
+    (_MetricsDate, _parse_date),
+]
+
+
 class _Aggregate:
     def __init__(
         self,
@@ -66,7 +139,11 @@ class _Aggregate:
         try:
             result: dict = response["data"]["Aggregate"][self.__name][0]
             return AggregateReturn(
-                properties=self.__parse_properties(result, metrics) if metrics is not None else {},
+                properties=(
+                    self.__parse_properties(result, self.__property_parsers(metrics))
+                    if metrics is not None
+                    else {}
+                ),
                 total_count=result["meta"]["count"] if result.get("meta") is not None else None,
             )
         except KeyError as e:
@@ -79,6 +156,7 @@ class _Aggregate:
     ) -> AggregateGroupByReturn:
         try:
             results: dict = response["data"]["Aggregate"][self.__name]
+            parsers = self.__property_parsers(metrics) if metrics is not None else []
             return AggregateGroupByReturn(
                 groups=[
                     AggregateGroup(
@@ -86,9 +164,7 @@ class _Aggregate:
                             prop=result["groupedBy"]["path"][0],
                             value=result["groupedBy"]["value"],
                         ),
-                        properties=(
-                            self.__parse_properties(result, metrics) if metrics is not None else {}
-                        ),
+                        properties=self.__parse_properties(result, parsers),
                         total_count=(
                             result["meta"]["count"] if result.get("meta") is not None else None
                         ),
@@ -101,71 +177,24 @@ class _Aggregate:
                 f"There was an error accessing the {e} key when parsing the GraphQL response: {response}"
             )
 
-    def __parse_properties(self, result: dict, metrics: List[_Metrics]) -> AProperties:
-        props: AProperties = {}
+    @staticmethod
+    def __property_parsers(metrics: List[_Metrics]) -> List[Tuple[str, _PropertyParser]]:
+        # resolve the parser of every metric once per response instead of once per metric and group
+        parsers: List[Tuple[str, _PropertyParser]] = []
         for metric in metrics:
-            if metric.property_name in result:
-                props[metric.property_name] = self.__parse_property(
-                    result[metric.property_name], metric
+            parser = next(
+                (parser for type_, parser in _PROPERTY_PARSERS if isinstance(metric, type_)), None
+            )
+            if parser is None:
+                raise ValueError(
+                    f"Unknown aggregation type {metric} encountered in _Aggregate.__property_parsers() for property {metric.property_name}"
                 )
-        return props
+            parsers.append((metric.property_name, parser))
+        return parsers
 
     @staticmethod
-    def __parse_property(property_: dict, metric: _Metrics) -> AggregateResult:
-        if isinstance(metric, _MetricsText):
-            return AggregateText(
-                count=property_.get("count"),
-                top_occurrences=[
-                    TopOccurrence(
-                        count=cast(dict, top_occurrence).get("occurs"),
-                        value=cast(dict, top_occurrence).get("value"),
-                    )
-                    for top_occurrence in property_.get("topOccurrences", [])
-                ],
-            )
-        elif isinstance(metric, _MetricsInteger):
-            return AggregateInteger(
-                count=property_.get("count"),
-                maximum=property_.get("maximum"),
-                mean=property_.get("mean"),
-                median=property_.get("median"),
-                minimum=property_.get("minimum"),
-                mode=property_.get("mode"),
-                sum_=property_.get("sum"),
-            )
-        elif isinstance(metric, _MetricsNumber):
-            return AggregateNumber(
-                count=property_.get("count"),
-                maximum=property_.get("maximum"),
-                mean=property_.get("mean"),
-                median=property_.get("median"),
-                minimum=property_.get("minimum"),
-                mode=property_.get("mode"),
-                sum_=property_.get("sum"),
-            )
-        elif isinstance(metric, _MetricsBoolean):
-            return AggregateBoolean(
-                count=property_.get("count"),
-                percentage_false=property_.get("percentageFalse"),
-                percentage_true=property_.get("percentageTrue"),
-                total_false=property_.get("totalFalse"),
-                total_true=property_.get("totalTrue"),
-            )
-        elif isinstance(metric, _MetricsDate):
-            return AggregateDate(
-                count=property_.get("count"),
-                maximum=property_.get("maximum"),
-                median=property_.get("median"),
-                minimum=property_.get("minimum"),
-                mode=property_.get("mode"),
-            )
-        # Aggregate references currently bugged on Weaviate's side
-        # elif isinstance(metric, _MetricsReference):
-        #     return AggregateReference(pointing_to=property_.get("pointingTo"))
-        else:
-            raise ValueError(
-                f"Unknown aggregation type {metric} encountered in _Aggregate.__parse_property() for property {property_}"
-            )
+    def __parse_properties(result: dict, parsers: List[Tuple[str, _PropertyParser]]) -> AProperties:
+        return {name: parser(result[name]) for name, parser in parsers if name in result}
 
     @staticmethod
     def _add_groupby_to_builder(
@@ -205,9 +234,23 @@ class _Aggregate:
             builder = builder.with_tenant(self._tenant)
         return builder
 
+    def _do(self, query: AggregateBuilder, decode: Callable[[dict], T]) -> T:
+        """Send the GraphQL query of `query` and decode its result with `decode`."""
+        if _async_requests.get():
+            return cast(T, self.__ado(query, decode))
+        response = self.__connection.post(path="/graphql", weaviate_object={"query": query.build()})
+        return decode(self.__result(query, response))
+
+    async def __ado(self, query: AggregateBuilder, decode: Callable[[dict], T]) -> T:
+        response = await self.__connection.apost(
+            path="/graphql", weaviate_object={"query": query.build()}
+        )
+        return decode(self.__result(query, response))
+
     @staticmethod
-    def _do(query: AggregateBuilder) -> dict:
-        res = query.do()
+    def __result(query: AggregateBuilder, response: Response) -> dict:
+        res = _decode_json_response_dict(response, "Query was not successful")
+        assert res is not None
         if (errs := res.get("errors")) is not None:
             if "Unexpected empty IN" in errs[0]["message"]:
                 raise WeaviateQueryError(
@@ -363,10 +406,5 @@ class _Aggregate:
 
 
 def _parse_media(media: Union[str, pathlib.Path, io.BufferedReader]) -> str:
-    if isinstance(media, str):  # if already encoded by user or string to path
-        if os.path.isfile(media):
-            return file_encoder_b64(media)
-        else:
-            return media
-    else:
-        return file_encoder_b64(media)
+    # strings are either encoded by the user or the path to a file
+    return _encode_media(media)
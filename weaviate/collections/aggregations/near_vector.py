@@ -100,9 +100,11 @@ class _NearVector(_Aggregate):
         builder = self._add_near_vector(
             builder, near_vector, certainty, distance, object_limit, target_vector
         )
-        res = self._do(builder)
-        return (
-            self._to_aggregate_result(res, return_metrics)
-            if group_by is None
-            else self._to_group_by_result(res, return_metrics)
+        return self._do(
+            builder,
+            lambda res: (
+                self._to_aggregate_result(res, return_metrics)
+                if group_by is None
+                else self._to_group_by_result(res, return_metrics)
+            ),
         )
@@ -90,11 +90,14 @@ class _CollectionsBase:
 
     def _delete(self, name: str) -> None:
         path = f"/schema/{name}"
-        self._connection.delete(
-            path=path,
-            error_msg="Collection may not have been deleted properly.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Delete collection"),
-        )
+        try:
+            self._connection.delete(
+                path=path,
+                error_msg="Collection may not have been deleted properly.",
+                status_codes=_ExpectedStatusCodes(ok_in=200, error="Delete collection"),
+            )
+        finally:
+            self._connection.invalidate_query_cache(name)
 
     def _get_all(
         self, simple: bool
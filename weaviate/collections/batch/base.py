@@ -4,15 +4,20 @@ import threading
 import time
 import uuid as uuid_package
 from abc import ABC
-from copy import copy
+from collections import deque
 from dataclasses import dataclass, field
 from typing import (
     Any,
+    Callable,
+    Deque,
     Dict,
     Generic,
+    Iterable,
     List,
     Optional,
+    Sequence,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -34,8 +39,10 @@ from weaviate.collections.classes.batch import (
     BatchObjectReturn,
     BatchReferenceReturn,
     Shard,
+    _split_vectors,
 )
 from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.internal import (
     ReferenceToMulti,
     ReferenceInput,
@@ -45,6 +52,7 @@ from weaviate.collections.classes.types import WeaviateProperties
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateBatchValidationError
 from weaviate.types import UUID, VECTORS
+from weaviate.util import _capitalize_first_letter
 from weaviate.warnings import _Warnings
 
 BatchResponse = List[Dict[str, Any]]
@@ -60,7 +68,7 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
     """`BatchRequest` abstract class used as a interface for batch requests."""
 
     def __init__(self) -> None:
-        self._items: List[TBatchInput] = []
+        self._items: Deque[TBatchInput] = deque()
         self._lock = threading.Lock()
 
     def __len__(self) -> int:
@@ -78,30 +86,56 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
         This is intended to be used when objects should be retries, eg. after a temporary error.
         """
         self._lock.acquire()
-        self._items = item + self._items
+        self._items.extendleft(reversed(item))
         self._lock.release()
 
 
 class ReferencesBatchRequest(BatchRequest[_BatchReference, BatchReferenceReturn]):
-    """Collect Weaviate-object references to add them in one request to Weaviate."""
+    """Collect Weaviate-object references to add them in one request to Weaviate.
+
+    References whose source object is still being sent are parked per source uuid, so that they do not have to be
+    scanned again on every pop. They are moved back to the front of the queue with `unpark` once their source object
+    has been processed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parked: Dict[str, List[_BatchReference]] = {}
+        self._num_parked = 0
+
+    def __len__(self) -> int:
+        return len(self._items) + self._num_parked
 
     def pop_items(self, pop_amount: int, uuid_lookup: Set[str]) -> List[_BatchReference]:
         """Pop the given number of items from the BatchRequest queue.
 
+        References whose source object is in `uuid_lookup` are parked and not returned.
+
         Returns
             `List[_BatchReference]` items from the BatchRequest.
         """
         ret: List[_BatchReference] = []
-        i = 0
         self._lock.acquire()
-        while len(ret) < pop_amount and len(self._items) > 0 and i < len(self._items):
-            if self._items[i].from_uuid not in uuid_lookup:
-                ret.append(self._items.pop(i))
+        while len(ret) < pop_amount and len(self._items) > 0:
+            item = self._items.popleft()
+            if item.from_uuid in uuid_lookup:
+                self._parked.setdefault(item.from_uuid, []).append(item)
+                self._num_parked += 1
             else:
-                i += 1
+                ret.append(item)
         self._lock.release()
         return ret
 
+    def unpark(self, uuids: Iterable[str]) -> None:
+        """Move the references of the given source objects back to the front of the queue."""
+        self._lock.acquire()
+        for uuid in uuids:
+            parked = self._parked.pop(uuid, None)
+            if parked is not None:
+                self._items.extendleft(reversed(parked))
+                self._num_parked -= len(parked)
+        self._lock.release()
+
 
 class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
     """Collect objects for one batch request to weaviate."""
@@ -113,13 +147,7 @@ class ObjectsBatchRequest(BatchRequest[_BatchObject, BatchObjectReturn]):
             `List[_BatchObject]` items from the BatchRequest.
         """
         self._lock.acquire()
-        if pop_amount >= len(self._items):
-            ret = copy(self._items)
-            self._items.clear()
-        else:
-            ret = copy(self._items[:pop_amount])
-            self._items = self._items[pop_amount:]
-
+        ret = [self._items.popleft() for _ in range(min(pop_amount, len(self._items)))]
         self._lock.release()
         return ret
 
@@ -160,7 +188,13 @@ class _BatchBase:
         batch_mode: _BatchMode,
         objects_: Optional[ObjectsBatchRequest] = None,
         references: Optional[ReferencesBatchRequest] = None,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> None:
+        self.__trusted = trusted
+        self.__keep_successful = keep_successful
+        self.__on_results = on_results
         self.__batch_objects = objects_ or ObjectsBatchRequest()
         self.__batch_references = references or ReferencesBatchRequest()
         self.__connection = connection
@@ -176,6 +210,8 @@ class _BatchBase:
         # we do not want that users can access the results directly as they are not thread-safe
         self.__results_for_wrapper_backup = results
         self.__results_for_wrapper = _BatchDataWrapper()
+        # the (collection, tenant) pairs of the imported shards, so a `Shard` is only created once for each of them
+        self.__shard_keys: Set[Tuple[str, Optional[str]]] = set()
 
         self.__results_lock = threading.Lock()
 
@@ -207,7 +243,10 @@ class _BatchBase:
         self.__recommended_num_refs: int = 50
 
         self.__active_requests = 0
-        self.__active_requests_lock = threading.Lock()
+
+        # guards the scheduling state (active requests, queue lengths, batch sizes). Producers, the sender thread and
+        # finished requests notify each other through it instead of polling
+        self.__batch_condition = threading.Condition()
 
         # dynamic batching
         self.__time_last_scale_up: float = 0
@@ -218,8 +257,9 @@ class _BatchBase:
         # do 62 secs to give us some buffer to the "per-minute" calculation
         self.__fix_rate_batching_base_time = 62
 
-        self.__bg_thread = self.__start_bg_threads()
         self.__bg_thread_exception: Optional[Exception] = None
+        self.__on_results_exception: Optional[Exception] = None
+        self.__bg_thread = self.__start_bg_threads()
 
     @property
     def number_errors(self) -> int:
@@ -228,8 +268,9 @@ class _BatchBase:
             self.__results_for_wrapper.failed_references
         )
 
-    def __run_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+    def __run_event_loop(self, loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
         try:
+            loop.call_soon(started.set)
             loop.run_forever()
         finally:
             # This is entered when loop.stop is scheduled from the main thread
@@ -238,28 +279,31 @@ class _BatchBase:
 
     def __start_new_event_loop(self) -> asyncio.AbstractEventLoop:
         loop = asyncio.new_event_loop()
+        started = threading.Event()
 
         event_loop = threading.Thread(
             target=self.__run_event_loop,
             daemon=True,
-            args=(loop,),
+            args=(loop, started),
             name="eventLoop",
         )
         event_loop.start()
-
-        while not loop.is_running():
-            time.sleep(0.01)
+        started.wait()
 
         return loop
 
+    def __notify_all(self) -> None:
+        with self.__batch_condition:
+            self.__batch_condition.notify_all()
+
     def _shutdown(self) -> None:
         """Shutdown the current batch and wait for all requests to be finished."""
         self.flush()
 
         # we are done, shut bg threads down and end the event loop
         self.__shut_background_thread_down.set()
-        while self.__bg_thread.is_alive():
-            time.sleep(0.01)
+        self.__notify_all()
+        self.__bg_thread.join()
 
         # copy the results to the public results
         self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
@@ -270,54 +314,74 @@ class _BatchBase:
         self.__results_for_wrapper_backup.imported_shards = (
             self.__results_for_wrapper.imported_shards
         )
+        if self.__on_results_exception is not None:
+            raise self.__on_results_exception
 
     def __batch_send(self) -> None:
         loop = self.__start_new_event_loop()
         future = asyncio.run_coroutine_threadsafe(self.__connection.aopen(), loop)
         future.result()  # Wait for self._connection.aopen() to finish
-        refresh_time: float = 0.01
-        while (
-            self.__shut_background_thread_down is not None
-            and not self.__shut_background_thread_down.is_set()
-        ):
+        while True:
+            with self.__batch_condition:
+                batch = self.__wait_for_next_batch()
+            if batch is None:
+                break
+
+            objs, refs = batch
+            # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
+            asyncio.run_coroutine_threadsafe(
+                self.__send_batch_async(
+                    objs,
+                    refs,
+                    readd_rate_limit=isinstance(self.__batching_mode, _RateLimitedBatching),
+                ),
+                loop,
+            )
+
+        future = asyncio.run_coroutine_threadsafe(self.__connection.aclose(), loop)
+        future.result()  # Wait for self._connection.aclose() to finish
+        loop.call_soon_threadsafe(loop.stop)
+
+    def __wait_for_next_batch(
+        self,
+    ) -> Optional[Tuple[List[_BatchObject], List[_BatchReference]]]:
+        """Block until a request can be sent and pop its objects and references from the queues.
+
+        Must be called while holding `self.__batch_condition`. Returns `None` once the batch is shut down.
+        """
+        while not self.__shut_background_thread_down.is_set():
             if isinstance(self.__batching_mode, _RateLimitedBatching):
-                if (
-                    time.time() - self.__time_stamp_last_request
-                    < self.__fix_rate_batching_base_time // self.__concurrent_requests
-                ):
-                    time.sleep(1)
+                wait_time = (
+                    self.__time_stamp_last_request
+                    + self.__fix_rate_batching_base_time // self.__concurrent_requests
+                    - time.time()
+                )
+                if wait_time > 0:
+                    self.__batch_condition.wait(wait_time)
                     continue
-                self.__time_stamp_last_request = time.time()
-                refresh_time = 0
 
             if self.__active_requests < self.__concurrent_requests and (
                 len(self.__batch_objects) > 0 or len(self.__batch_references) > 0
             ):
-                self.__active_requests_lock.acquire()
-                self.__active_requests += 1
-                self.__active_requests_lock.release()
-
                 objs = self.__batch_objects.pop_items(self.__recommended_num_objects)
                 self.__uuid_lookup_lock.acquire()
                 refs = self.__batch_references.pop_items(
                     self.__recommended_num_refs, uuid_lookup=self.__uuid_lookup
                 )
                 self.__uuid_lookup_lock.release()
-                # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
-                asyncio.run_coroutine_threadsafe(
-                    self.__send_batch_async(
-                        objs,
-                        refs,
-                        readd_rate_limit=isinstance(self.__batching_mode, _RateLimitedBatching),
-                    ),
-                    loop,
-                )
 
-            time.sleep(refresh_time)
+                # references can be queued while all of their source objects are still in flight. In that case there
+                # is nothing to send until one of the running requests finishes and wakes us up again.
+                if len(objs) > 0 or len(refs) > 0:
+                    self.__active_requests += 1
+                    if isinstance(self.__batching_mode, _RateLimitedBatching):
+                        self.__time_stamp_last_request = time.time()
+                    # the queues shrank, producers that are blocked on a full queue can continue
+                    self.__batch_condition.notify_all()
+                    return objs, refs
 
-        future = asyncio.run_coroutine_threadsafe(self.__connection.aclose(), loop)
-        future.result()  # Wait for self._connection.aclose() to finish
-        loop.call_soon_threadsafe(loop.stop)
+            self.__batch_condition.wait()
+        return None
 
     def dynamic_batch_rate_loop(self) -> None:
         refresh_time = 0.1
@@ -332,8 +396,10 @@ class _BatchBase:
                 self.__dynamic_batching()
             except Exception as e:
                 _Warnings.batch_refresh_failed(repr(e))
+            # batch sizes and the number of concurrent requests might have changed
+            self.__notify_all()
 
-            time.sleep(refresh_time)
+            self.__shut_background_thread_down.wait(refresh_time)
 
     def __start_bg_threads(self) -> threading.Thread:
         """Create a background thread that periodically checks how congested the batch queue is."""
@@ -344,6 +410,7 @@ class _BatchBase:
                 self.dynamic_batch_rate_loop()
             except Exception as e:
                 self.__bg_thread_exception = e
+                self.__notify_all()
 
         demonDynamic = threading.Thread(
             target=dynamic_batch_rate_wrapper,
@@ -357,6 +424,7 @@ class _BatchBase:
                 self.__batch_send()
             except Exception as e:
                 self.__bg_thread_exception = e
+                self.__notify_all()
 
         demonBatchSend = threading.Thread(
             target=batch_send_wrapper,
@@ -482,22 +550,26 @@ class _BatchBase:
 
                     self.__batch_objects.prepend(readd_objects)
 
+                    # the remaining objects are numbered without gaps, so the indices of the merged results
+                    # do not collide
+                    readded = set(readded_objects)
+                    all_responses = [
+                        res for i, res in enumerate(response_obj.all_responses) if i not in readded
+                    ]
                     new_errors = {
-                        i: err for i, err in response_obj.errors.items() if i not in readded_objects
+                        i: res
+                        for i, res in enumerate(all_responses)
+                        if isinstance(res, ErrorObject)
                     }
                     response_obj = BatchObjectReturn(
                         uuids={
-                            i: uid
-                            for i, uid in response_obj.uuids.items()
-                            if i not in readded_objects
+                            i: res
+                            for i, res in enumerate(all_responses)
+                            if not isinstance(res, ErrorObject)
                         },
                         errors=new_errors,
                         has_errors=len(new_errors) > 0,
-                        all_responses=[
-                            err
-                            for i, err in enumerate(response_obj.all_responses)
-                            if i not in readded_objects
-                        ],
+                        all_responses=all_responses,
                         elapsed_seconds=response_obj.elapsed_seconds,
                     )
                     self.__time_stamp_last_request = (
@@ -506,17 +578,26 @@ class _BatchBase:
                     self.__fix_rate_batching_base_time += (
                         1  # increase the base time as the current one is too low
                     )
+            processed_uuids = {obj.uuid for obj in objs if obj.uuid not in readded_uuids}
             self.__uuid_lookup_lock.acquire()
-            self.__uuid_lookup.difference_update(
-                obj.uuid for obj in objs if obj.uuid not in readded_uuids
-            )
+            self.__uuid_lookup.difference_update(processed_uuids)
+            self.__batch_references.unpark(processed_uuids)
             self.__uuid_lookup_lock.release()
 
             self.__results_lock.acquire()
-            self.__results_for_wrapper.results.objs += response_obj
+            results = self.__results_for_wrapper.results
+            results.objs._merge(response_obj, results.num_objects, self.__keep_successful)
+            results.num_objects += len(response_obj.all_responses)
             self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
             self.__results_lock.release()
 
+            if self.__on_results is not None:
+                try:
+                    self.__on_results(response_obj)
+                except Exception as e:
+                    # raised by the batch instead of being lost in the event loop
+                    self.__on_results_exception = e
+
         if len(refs) > 0:
             start = time.time()
             try:
@@ -534,23 +615,25 @@ class _BatchBase:
                 )
             self.__results_lock.acquire()
             self.__results_for_wrapper.results.refs += response_ref
+            self.__results_for_wrapper.results.num_references += len(refs)
             self.__results_for_wrapper.failed_references.extend(response_ref.errors.values())
             self.__results_lock.release()
 
-        self.__active_requests_lock.acquire()
-        self.__active_requests -= 1
-        self.__active_requests_lock.release()
+        with self.__batch_condition:
+            self.__active_requests -= 1
+            self.__batch_condition.notify_all()
 
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
         # bg thread is sending objs+refs automatically, so simply wait for everything to be done
-        while (
-            self.__active_requests > 0
-            or len(self.__batch_objects) > 0
-            or len(self.__batch_references) > 0
-        ):
-            time.sleep(0.01)
-            self.__check_bg_thread_alive()
+        with self.__batch_condition:
+            while (
+                self.__active_requests > 0
+                or len(self.__batch_objects) > 0
+                or len(self.__batch_references) > 0
+            ):
+                self.__check_bg_thread_alive()
+                self.__batch_condition.wait()
 
     def _add_object(
         self,
@@ -562,36 +645,82 @@ class _BatchBase:
         tenant: Optional[str] = None,
     ) -> UUID:
         self.__check_bg_thread_alive()
-        try:
-            batch_object = BatchObject(
-                collection=collection,
-                properties=properties,
-                references=references,
-                uuid=uuid,
+        if self.__trusted:
+            # the input is not validated, the vector is converted when the object is sent
+            uid: UUID = uuid if uuid is not None else uuid_package.uuid4()
+            internal = _BatchObject(
+                collection=_capitalize_first_letter(collection),
                 vector=vector,
+                uuid=str(uid),
+                properties=dict(properties) if properties is not None else None,
                 tenant=tenant,
+                references=references,
             )
+        else:
+            try:
+                batch_object = BatchObject(
+                    collection=collection,
+                    properties=properties,
+                    references=references,
+                    uuid=uuid,
+                    vector=vector,
+                    tenant=tenant,
+                )
+            except ValidationError as e:
+                raise WeaviateBatchValidationError(repr(e))
+            assert batch_object.uuid is not None
+            uid = batch_object.uuid
+            internal = batch_object._to_internal()
+        if (collection, tenant) not in self.__shard_keys:
+            self.__shard_keys.add((collection, tenant))
             self.__results_for_wrapper.imported_shards.add(
                 Shard(collection=collection, tenant=tenant)
             )
-        except ValidationError as e:
-            raise WeaviateBatchValidationError(repr(e))
         self.__uuid_lookup_lock.acquire()
-        self.__uuid_lookup.add(str(batch_object.uuid))
+        self.__uuid_lookup.add(internal.uuid)
         self.__uuid_lookup_lock.release()
-        self.__batch_objects.add(batch_object._to_internal())
+        self.__batch_objects.add(internal)
+
+        with self.__batch_condition:
+            self.__batch_condition.notify_all()
+            # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
+            # not need a long queue
+            while (
+                self.__recommended_num_objects == 0
+                or len(self.__batch_objects) >= self.__recommended_num_objects * 2
+            ):
+                self.__check_bg_thread_alive()
+                self.__batch_condition.wait()
 
-        # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
-        # not need a long queue
-        while (
-            self.__recommended_num_objects == 0
-            or len(self.__batch_objects) >= self.__recommended_num_objects * 2
-        ):
-            self.__check_bg_thread_alive()
-            time.sleep(0.01)
+        return uid
 
-        assert batch_object.uuid is not None
-        return batch_object.uuid
+    def _add_objects(
+        self,
+        collection: str,
+        objects: Sequence[Union[WeaviateProperties, DataObject[WeaviateProperties, Any]]],
+        vectors: Optional[Any] = None,
+        tenant: Optional[str] = None,
+    ) -> List[UUID]:
+        rows = (
+            _split_vectors(vectors, len(objects)) if vectors is not None else [None] * len(objects)
+        )
+        return [
+            (
+                self._add_object(
+                    collection=collection,
+                    properties=obj.properties,
+                    references=obj.references,
+                    uuid=obj.uuid,
+                    vector=row if row is not None else obj.vector,
+                    tenant=tenant,
+                )
+                if isinstance(obj, DataObject)
+                else self._add_object(
+                    collection=collection, properties=obj, vector=row, tenant=tenant
+                )
+            )
+            for obj, row in zip(objects, rows)
+        ]
 
     def _add_reference(
         self,
@@ -625,13 +754,17 @@ class _BatchBase:
                 raise WeaviateBatchValidationError(repr(e))
             self.__batch_references.add(batch_reference._to_internal())
 
-        # block if queue gets too long or weaviate is overloaded
-        while self.__recommended_num_objects == 0:
-            time.sleep(0.01)  # block if weaviate is overloaded, also do not send any refs
-            self.__check_bg_thread_alive()
+        with self.__batch_condition:
+            self.__batch_condition.notify_all()
+            # block if weaviate is overloaded, also do not send any refs
+            while self.__recommended_num_objects == 0:
+                self.__check_bg_thread_alive()
+                self.__batch_condition.wait()
 
     def __check_bg_thread_alive(self) -> None:
-        if self.__bg_thread.is_alive():
+        if self.__on_results_exception is not None:
+            raise self.__on_results_exception
+        if self.__bg_thread_exception is None and self.__bg_thread.is_alive():
             return
 
         raise self.__bg_thread_exception or Exception("Batch thread died unexpectedly")
@@ -1,5 +1,5 @@
 import time
-from typing import Generic, List, Optional, Any, TypeVar, cast
+from typing import Callable, Generic, List, Optional, Any, TypeVar, Union, cast
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -7,7 +7,14 @@ from weaviate.collections.batch.base import (
     _DynamicBatching,
     _BatchMode,
 )
-from weaviate.collections.classes.batch import BatchResult, ErrorObject, ErrorReference, Shard
+from weaviate.collections.batch.multiprocess import _BatchMultiprocess
+from weaviate.collections.classes.batch import (
+    BatchObjectReturn,
+    BatchResult,
+    ErrorObject,
+    ErrorReference,
+    Shard,
+)
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import ConnectionV4
 from weaviate.util import _capitalize_first_letter, _decode_json_response_list
@@ -22,6 +29,9 @@ class _BatchWrapper:
         self._current_batch: Optional[_BatchBase] = None
         # config options
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._trusted = False
+        self._keep_successful = True
+        self._on_results: Optional[Callable[[BatchObjectReturn], None]] = None
 
         self._batch_data = _BatchDataWrapper()
 
@@ -112,7 +122,7 @@ class _BatchWrapper:
         return self._batch_data.results
 
 
-T = TypeVar("T", bound=_BatchBase)
+T = TypeVar("T", bound=Union[_BatchBase, _BatchMultiprocess])
 
 
 class _ContextManagerWrapper(Generic[T]):
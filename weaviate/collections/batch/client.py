@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -12,10 +12,14 @@ from weaviate.collections.batch.batch_wrapper import (
     _BatchMode,
     _ContextManagerWrapper,
 )
+from weaviate.collections.batch.multiprocess import _BatchMultiprocess
+from weaviate.collections.classes.batch import BatchObjectReturn
 from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import WeaviateProperties
+from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.types import UUID, VECTORS
 
 
@@ -72,6 +76,52 @@ class _BatchClient(_BatchBase):
             tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
         )
 
+    def add_objects(
+        self,
+        collection: str,
+        objects: Sequence[Union[WeaviateProperties, DataObject[WeaviateProperties, Any]]],
+        vectors: Optional[Any] = None,
+        tenant: Optional[Union[str, Tenant]] = None,
+    ) -> List[UUID]:
+        """
+        Add multiple objects to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be
+        replaced by the new object.
+
+        Arguments:
+            `collection`
+                The name of the collection these objects belong to.
+            `objects`
+                The objects to add. This can be either a list of properties dictionaries or `DataObject`s.
+                Use `DataObject` to add references or UUIDs alongside the properties.
+            `vectors`:
+                The vectors of all objects at once, with one row per object in the same order as `objects`. These take
+                precedence over the vectors of the individual `DataObject`s.
+                Supported types are
+                - for single vectors: a 2-D `numpy.ndarray` or a list of any of the vector types supported by `add_object`.
+                    The rows of float32 arrays are sent without converting them to lists.
+                - for named vectors: Dict[str, *matrix above*], where the string is the name of the vector.
+            `tenant`
+                The tenant name or Tenant object to be used for this request.
+
+        Returns:
+            `List[str]`
+                The UUIDs of the added objects in the same order as `objects`.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the provided options are in the format required by Weaviate.
+            `WeaviateInvalidInputError`
+                If the number of vectors does not match the number of objects.
+        """
+        return super()._add_objects(
+            collection=collection,
+            objects=objects,
+            vectors=vectors,
+            tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
+        )
+
     def add_reference(
         self,
         from_uuid: UUID,
@@ -108,6 +158,146 @@ class _BatchClient(_BatchBase):
         )
 
 
+class _BatchClientMultiprocess(_BatchMultiprocess):
+    """A batch whose objects and references are serialized and sent by several worker processes.
+
+    Validation errors are raised by a later call to this batch, as the objects are validated in the workers.
+    """
+
+    def add_object(
+        self,
+        collection: str,
+        properties: Optional[WeaviateProperties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+        tenant: Optional[Union[str, Tenant]] = None,
+    ) -> UUID:
+        """
+        Add one object to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be
+        replaced by the new object.
+
+        Arguments:
+            `collection`
+                The name of the collection this object belongs to.
+            `properties`
+                The data properties of the object to be added as a dictionary.
+            `references`
+                The references of the object to be added as a dictionary.
+            `uuid`:
+                The UUID of the object as an uuid.UUID object or str. It can be a Weaviate beacon or Weaviate href.
+                If it is None an UUIDv4 will generated, by default None
+            `vector`:
+                The embedding of the object. Can be used when a collection does not have a vectorization module or the given
+                vector was generated using the _identical_ vectorization module that is configured for the class. In this
+                case this vector takes precedence.
+                Supported types are
+                - for single vectors: `list`, 'numpy.ndarray`, `torch.Tensor` and `tf.Tensor`, by default None.
+                - for named vectors: Dict[str, *list above*], where the string is the name of the vector.
+            `tenant`
+                The tenant name or Tenant object to be used for this request.
+
+        Returns:
+            `str`
+                The UUID of the added object. If one was not provided a UUIDv4 will be auto-generated for you and returned here.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If one of the previously added objects or references is not in the format required by Weaviate.
+        """
+        return super()._add_object(
+            collection=collection,
+            properties=properties,
+            references=references,
+            uuid=uuid,
+            vector=vector,
+            tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
+        )
+
+    def add_objects(
+        self,
+        collection: str,
+        objects: Sequence[Union[WeaviateProperties, DataObject[WeaviateProperties, Any]]],
+        vectors: Optional[Any] = None,
+        tenant: Optional[Union[str, Tenant]] = None,
+    ) -> List[UUID]:
+        """
+        Add multiple objects to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be
+        replaced by the new object.
+
+        Arguments:
+            `collection`
+                The name of the collection these objects belong to.
+            `objects`
+                The objects to add. This can be either a list of properties dictionaries or `DataObject`s.
+                Use `DataObject` to add references or UUIDs alongside the properties.
+            `vectors`:
+                The vectors of all objects at once, with one row per object in the same order as `objects`. These take
+                precedence over the vectors of the individual `DataObject`s.
+                Supported types are
+                - for single vectors: a 2-D `numpy.ndarray` or a list of any of the vector types supported by `add_object`.
+                    The rows of float32 arrays are sent without converting them to lists.
+                - for named vectors: Dict[str, *matrix above*], where the string is the name of the vector.
+            `tenant`
+                The tenant name or Tenant object to be used for this request.
+
+        Returns:
+            `List[str]`
+                The UUIDs of the added objects in the same order as `objects`.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If one of the previously added objects or references is not in the format required by Weaviate.
+            `WeaviateInvalidInputError`
+                If the number of vectors does not match the number of objects.
+        """
+        return super()._add_objects(
+            collection=collection,
+            objects=objects,
+            vectors=vectors,
+            tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
+        )
+
+    def add_reference(
+        self,
+        from_uuid: UUID,
+        from_collection: str,
+        from_property: str,
+        to: ReferenceInput,
+        tenant: Optional[Union[str, Tenant]] = None,
+    ) -> None:
+        """Add one reference to this batch.
+
+        Arguments:
+            `from_uuid`
+                The UUID of the object, as an uuid.UUID object or str, that should reference another object.
+            `from_collection`
+                The name of the collection that should reference another object.
+            `from_property`
+                The name of the property that contains the reference.
+            `to`
+                The UUID of the referenced object, as an uuid.UUID object or str, that is actually referenced.
+                For multi-target references use wvc.Reference.to_multi_target().
+            `tenant`
+                The tenant name or Tenant object to be used for this request.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If one of the previously added objects or references is not in the format required by Weaviate.
+        """
+        super()._add_reference(
+            from_object_uuid=from_uuid,
+            from_object_collection=from_collection,
+            from_property_name=from_property,
+            to=to,
+            tenant=tenant.name if isinstance(tenant, Tenant) else tenant,
+        )
+
+
 class _BatchClientWrapper(_BatchWrapper):
     def __create_batch_and_reset(self) -> _ContextManagerWrapper[_BatchClient]:
         self._batch_data = _BatchDataWrapper()  # clear old data
@@ -117,11 +307,18 @@ class _BatchClientWrapper(_BatchWrapper):
                 consistency_level=self._consistency_level,
                 results=self._batch_data,
                 batch_mode=self._batch_mode,
+                trusted=self._trusted,
+                keep_successful=self._keep_successful,
+                on_results=self._on_results,
             )
         )
 
     def dynamic(
-        self, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure dynamic batching.
 
@@ -130,9 +327,25 @@ class _BatchClientWrapper(_BatchWrapper):
         Arguments:
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `trusted`
+                Skip the validation of the objects that are added to the batch, which speeds up adding many small
+                objects. The collection name, UUID and vector of every object have to be valid, UUIDs have to be
+                `uuid.UUID`s or strings in their canonical form. If not provided, the default value is `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`. With `False` only the failed objects
+                and the number of sent objects are kept, so that long imports do not hold every UUID in memory. If not
+                provided, the default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that was sent, eg. to
+                stream the results of an import. It is called from the thread that sends the batches, an exception that
+                it raises is raised by the next call of the batch or when the context manager exits. If not provided,
+                the default value is `None`.
         """
         self._batch_mode: _BatchMode = _DynamicBatching()
         self._consistency_level = consistency_level
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
         return self.__create_batch_and_reset()
 
     def fixed_size(
@@ -140,6 +353,9 @@ class _BatchClientWrapper(_BatchWrapper):
         batch_size: int = 100,
         concurrent_requests: int = 2,
         consistency_level: Optional[ConsistencyLevel] = None,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -153,14 +369,35 @@ class _BatchClientWrapper(_BatchWrapper):
                 made to Weaviate and not the speed of batch creation within Python.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `trusted`
+                Skip the validation of the objects that are added to the batch, which speeds up adding many small
+                objects. The collection name, UUID and vector of every object have to be valid, UUIDs have to be
+                `uuid.UUID`s or strings in their canonical form. If not provided, the default value is `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`. With `False` only the failed objects
+                and the number of sent objects are kept, so that long imports do not hold every UUID in memory. If not
+                provided, the default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that was sent, eg. to
+                stream the results of an import. It is called from the thread that sends the batches, an exception that
+                it raises is raised by the next call of the batch or when the context manager exits. If not provided,
+                the default value is `None`.
 
         """
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
         self._consistency_level = consistency_level
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
         return self.__create_batch_and_reset()
 
     def rate_limit(
-        self, requests_per_minute: int, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        requests_per_minute: int,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> _ContextManagerWrapper[_BatchClient]:
         """Configure batches with a rate limited vectorizer.
 
@@ -171,7 +408,99 @@ class _BatchClientWrapper(_BatchWrapper):
                 The number of requests that the vectorizer can process per minute.
             `consistency_level`
                 The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `trusted`
+                Skip the validation of the objects that are added to the batch, which speeds up adding many small
+                objects. The collection name, UUID and vector of every object have to be valid, UUIDs have to be
+                `uuid.UUID`s or strings in their canonical form. If not provided, the default value is `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`. With `False` only the failed objects
+                and the number of sent objects are kept, so that long imports do not hold every UUID in memory. If not
+                provided, the default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that was sent, eg. to
+                stream the results of an import. It is called from the thread that sends the batches, an exception that
+                it raises is raised by the next call of the batch or when the context manager exits. If not provided,
+                the default value is `None`.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
         self._consistency_level = consistency_level
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
         return self.__create_batch_and_reset()
+
+    def multiprocess(
+        self,
+        workers: int = 4,
+        batch_size: Optional[int] = None,
+        concurrent_requests: int = 2,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
+    ) -> _ContextManagerWrapper[_BatchClientMultiprocess]:
+        """Configure batches that are serialized and sent by several worker processes.
+
+        Use this for large imports where building the requests in Python, rather than Weaviate, limits the import rate.
+        The objects are distributed over the workers by their UUID and every worker sends its objects over its own
+        connection with its own batch size. The results and failed objects of all workers are available once the
+        context manager is exited, which also sends the final batches.
+
+        The workers are started with the `spawn` method of `multiprocessing`, so a script that uses this batch has to
+        guard its entry point with `if __name__ == "__main__":`. Embedded Weaviate is not started by the workers, they
+        connect to the instance that was started by this client.
+
+        Arguments:
+            `workers`
+                The number of worker processes. If not provided, the default value is 4.
+            `batch_size`
+                The number of objects/references that every worker sends in one batch. If not provided, every worker
+                uses dynamic batching.
+            `concurrent_requests`
+                The number of concurrent requests of every worker when `batch_size` is provided.
+            `consistency_level`
+                The consistency level to be used to send batches. If not provided, the default value is `None`.
+            `trusted`
+                Skip the validation of the objects in the workers, see `dynamic`. If not provided, the default value is
+                `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`, see `dynamic`. If not provided, the
+                default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that a worker sent. The
+                results are passed from the workers to this process and the function is called from the thread that
+                adds objects to the batch, flushes it or exits the context manager, which also raises an exception that
+                it raised. If not provided, the default value is `None`.
+
+        Raises:
+            `WeaviateInvalidInputError`
+                If `workers` or `batch_size` is not a positive integer.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise WeaviateInvalidInputError(f"workers must be a positive integer, got {workers}")
+        if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+            raise WeaviateInvalidInputError(
+                f"batch_size must be a positive integer, got {batch_size}"
+            )
+        self._batch_mode = (
+            _DynamicBatching()
+            if batch_size is None
+            else _FixedSizeBatching(batch_size, concurrent_requests)
+        )
+        self._consistency_level = consistency_level
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
+        self._batch_data = _BatchDataWrapper()  # clear old data
+        return _ContextManagerWrapper(
+            _BatchClientMultiprocess(
+                connection=self._connection,
+                consistency_level=self._consistency_level,
+                results=self._batch_data,
+                batch_mode=self._batch_mode,
+                workers=workers,
+                trusted=self._trusted,
+                keep_successful=self._keep_successful,
+                on_results=self._on_results,
+            )
+        )
@@ -1,4 +1,4 @@
-from typing import Generic, List, Optional, Union
+from typing import Any, Callable, Generic, List, Optional, Sequence, Union
 
 from weaviate.collections.batch.base import (
     _BatchBase,
@@ -9,7 +9,9 @@ from weaviate.collections.batch.base import (
     _RateLimitedBatching,
 )
 from weaviate.collections.batch.batch_wrapper import _BatchWrapper, _ContextManagerWrapper
+from weaviate.collections.classes.batch import BatchObjectReturn
 from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.data import DataObject
 from weaviate.collections.classes.internal import ReferenceInputs, ReferenceInput
 from weaviate.collections.classes.types import Properties
 from weaviate.connect import ConnectionV4
@@ -25,12 +27,18 @@ class _BatchCollection(Generic[Properties], _BatchBase):
         batch_mode: _BatchMode,
         name: str,
         tenant: Optional[str] = None,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> None:
         super().__init__(
             connection=connection,
             consistency_level=consistency_level,
             results=results,
             batch_mode=batch_mode,
+            trusted=trusted,
+            keep_successful=keep_successful,
+            on_results=on_results,
         )
         self.__name = name
         self.__tenant = tenant
@@ -78,6 +86,44 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             tenant=self.__tenant,
         )
 
+    def add_objects(
+        self,
+        objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        vectors: Optional[Any] = None,
+    ) -> List[UUID]:
+        """Add multiple objects to this batch.
+
+        NOTE: If the UUID of one of the objects already exists then the existing object will be replaced by the new object.
+
+        Arguments:
+            `objects`
+                The objects to add. This can be either a list of `Properties` or `DataObject[Properties, ReferenceInputs]`.
+                Use `DataObject` to add references or UUIDs alongside the properties.
+            `vectors`:
+                The vectors of all objects at once, with one row per object in the same order as `objects`. These take
+                precedence over the vectors of the individual `DataObject`s.
+                Supported types are
+                - for single vectors: a 2-D `numpy.ndarray` or a list of any of the vector types supported by `add_object`.
+                    The rows of float32 arrays are sent without converting them to lists.
+                - for named vectors: Dict[str, *matrix above*], where the string is the name of the vector.
+
+        Returns:
+            `List[str]`
+                The UUIDs of the added objects in the same order as `objects`.
+
+        Raises:
+            `WeaviateBatchValidationError`
+                If the provided options are in the format required by Weaviate.
+            `WeaviateInvalidInputError`
+                If the number of vectors does not match the number of objects.
+        """
+        return self._add_objects(
+            collection=self.__name,
+            objects=objects,
+            vectors=vectors,
+            tenant=self.__tenant,
+        )
+
     def add_reference(
         self, from_uuid: UUID, from_property: str, to: Union[ReferenceInput, List[UUID]]
     ) -> None:
@@ -127,19 +173,50 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
                 batch_mode=self._batch_mode,
                 name=self.__name,
                 tenant=self.__tenant,
+                trusted=self._trusted,
+                keep_successful=self._keep_successful,
+                on_results=self._on_results,
             )
         )
 
-    def dynamic(self) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
+    def dynamic(
+        self,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
+    ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         """Configure dynamic batching.
 
         When you exit the context manager, the final batch will be sent automatically.
+
+        Arguments:
+            `trusted`
+                Skip the validation of the objects that are added to the batch, which speeds up adding many small
+                objects. The UUID and vector of every object have to be valid, UUIDs have to be
+                `uuid.UUID`s or strings in their canonical form. If not provided, the default value is `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`. With `False` only the failed objects
+                and the number of sent objects are kept, so that long imports do not hold every UUID in memory. If not
+                provided, the default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that was sent, eg. to
+                stream the results of an import. It is called from the thread that sends the batches, an exception that
+                it raises is raised by the next call of the batch or when the context manager exits. If not provided,
+                the default value is `None`.
         """
         self._batch_mode: _BatchMode = _DynamicBatching()
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
         return self.__create_batch_and_reset()
 
     def fixed_size(
-        self, batch_size: int = 100, concurrent_requests: int = 2
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -151,12 +228,32 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             `concurrent_requests`
                 The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
+            `trusted`
+                Skip the validation of the objects that are added to the batch, which speeds up adding many small
+                objects. The UUID and vector of every object have to be valid, UUIDs have to be
+                `uuid.UUID`s or strings in their canonical form. If not provided, the default value is `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`. With `False` only the failed objects
+                and the number of sent objects are kept, so that long imports do not hold every UUID in memory. If not
+                provided, the default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that was sent, eg. to
+                stream the results of an import. It is called from the thread that sends the batches, an exception that
+                it raises is raised by the next call of the batch or when the context manager exits. If not provided,
+                the default value is `None`.
         """
         self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
         return self.__create_batch_and_reset()
 
     def rate_limit(
-        self, requests_per_minute: int
+        self,
+        requests_per_minute: int,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
     ) -> _ContextManagerWrapper[_BatchCollection[Properties]]:
         """Configure batches with a rate limited vectorizer.
 
@@ -165,6 +262,22 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         Arguments:
             `requests_per_minute`
                 The number of requests that the vectorizer can process per minute.
+            `trusted`
+                Skip the validation of the objects that are added to the batch, which speeds up adding many small
+                objects. The UUID and vector of every object have to be valid, UUIDs have to be
+                `uuid.UUID`s or strings in their canonical form. If not provided, the default value is `False`.
+            `keep_successful`
+                Keep the UUIDs of the successfully imported objects in `results`. With `False` only the failed objects
+                and the number of sent objects are kept, so that long imports do not hold every UUID in memory. If not
+                provided, the default value is `True`.
+            `on_results`
+                A function that is called with the `BatchObjectReturn` of every batch of objects that was sent, eg. to
+                stream the results of an import. It is called from the thread that sends the batches, an exception that
+                it raises is raised by the next call of the batch or when the context manager exits. If not provided,
+                the default value is `None`.
         """
         self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._trusted = trusted
+        self._keep_successful = keep_successful
+        self._on_results = on_results
         return self.__create_batch_and_reset()
@@ -0,0 +1,266 @@
+import json
+import os
+import struct
+import uuid as uuid_package
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from weaviate.collections.classes.batch import _BatchObject
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.util import _import_pyarrow
+
+_ColumnSource = Union[str, "os.PathLike[str]", Any]
+
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+_JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+
+@dataclass
+class _ColumnChunk:
+    """A chunk of objects stored column by column, one list per property with one entry per object.
+
+    `None` entries are properties that are not set for the object. Vectors are stored as their float32 bytes.
+    """
+
+    collection: str
+    tenant: Optional[str]
+    num_rows: int
+    properties: Dict[str, List[Any]]
+    uuids: List[str]
+    vector: Optional[List[Optional[bytes]]] = None
+    named_vectors: Dict[str, List[Optional[bytes]]] = field(default_factory=dict)
+
+    def row(self, index: int) -> _BatchObject:
+        """Return the object at `index`, eg. to report it as failed."""
+        vector: Any = self.vector[index] if self.vector is not None else None
+        if len(self.named_vectors) > 0:
+            vector = {
+                name: rows[index]
+                for name, rows in self.named_vectors.items()
+                if rows[index] is not None
+            }
+        return _BatchObject(
+            collection=self.collection,
+            vector=vector,
+            uuid=self.uuids[index],
+            properties={
+                name: values[index]
+                for name, values in self.properties.items()
+                if values[index] is not None
+            },
+            tenant=self.tenant,
+            references=None,
+        )
+
+
+@dataclass
+class _ColumnMapping:
+    """Which columns of the source are read, and what they are imported as."""
+
+    properties: Optional[Mapping[str, str]]
+    uuid: Optional[str]
+    vector: Optional[str]
+    named_vectors: Mapping[str, str]
+
+    def property_names(self, columns: List[str]) -> Dict[str, str]:
+        """Return the property name of every column that is imported as a property."""
+        special = {self.uuid, self.vector, *self.named_vectors.values()}
+        if self.properties is None:
+            names = {column: column for column in columns if column not in special}
+        else:
+            missing = [column for column in self.properties if column not in columns]
+            if len(missing) > 0:
+                raise WeaviateInvalidInputError(
+                    f"The columns {missing} of the mapping are not present in the source, which has the columns {columns}"
+                )
+            names = dict(self.properties)
+        for column, name in names.items():
+            if name in ("id", "vector"):
+                raise WeaviateInvalidInputError(
+                    f"Column '{column}' cannot be imported as the property '{name}', which is reserved. Use `uuid_column` "
+                    "or `vector_columns` to import UUIDs and vectors, or map it to a different name with `mapping`."
+                )
+        return names
+
+    def columns(self) -> Optional[List[str]]:
+        """Return the columns that have to be read from the source, `None` if all of them are needed."""
+        if self.properties is None:
+            return None
+        needed = list(self.properties)
+        needed.extend(column for column in (self.uuid, self.vector) if column is not None)
+        needed.extend(self.named_vectors.values())
+        return needed
+
+
+def _read_chunks(
+    source: _ColumnSource,
+    mapping: _ColumnMapping,
+    collection: str,
+    tenant: Optional[str],
+    batch_size: int,
+) -> Iterator[_ColumnChunk]:
+    """Read `source` in chunks of at most `batch_size` objects.
+
+    Arrow and Parquet data is converted one column at a time, JSONL files are read line by line.
+    """
+    batches: Iterable[Any]
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix in _JSONL_SUFFIXES:
+            yield from _read_jsonl(path, mapping, collection, tenant, batch_size)
+            return
+        if suffix in _PARQUET_SUFFIXES or suffix in _ARROW_SUFFIXES:
+            batches = _read_file_batches(path, suffix in _PARQUET_SUFFIXES, mapping, batch_size)
+        else:
+            raise WeaviateInvalidInputError(
+                f"Cannot import '{path}', the file has to be a Parquet ({', '.join(_PARQUET_SUFFIXES)}), Arrow "
+                f"({', '.join(_ARROW_SUFFIXES)}) or JSONL ({', '.join(_JSONL_SUFFIXES)}) file."
+            )
+    else:
+        pa = _import_pyarrow()
+        if isinstance(source, pa.Table):
+            batches = source.to_batches(max_chunksize=batch_size)
+        elif isinstance(source, pa.RecordBatch):
+            batches = [source]
+        elif isinstance(source, pa.RecordBatchReader):
+            batches = source
+        else:
+            raise WeaviateInvalidInputError(
+                "The source has to be the path of a Parquet, Arrow or JSONL file, a `pyarrow.Table`, a "
+                f"`pyarrow.RecordBatch` or a `pyarrow.RecordBatchReader`, got {type(source)}"
+            )
+
+    for batch in batches:
+        for offset in range(0, batch.num_rows, batch_size):
+            yield _arrow_chunk(
+                batch.slice(offset, batch_size), mapping, collection, tenant, batch.schema.names
+            )
+
+
+def _read_file_batches(
+    path: str, is_parquet: bool, mapping: _ColumnMapping, batch_size: int
+) -> Iterator[Any]:
+    """Read the record batches of a Parquet or Arrow IPC file with the columns that `mapping` needs.
+
+    The file is closed once all batches were read or the iteration is stopped.
+    """
+    pa = _import_pyarrow()
+    columns = mapping.columns()
+    with pa.memory_map(path) as file:
+        if is_parquet:
+            parquet = _import_pyarrow("pyarrow.parquet")
+            yield from parquet.ParquetFile(file).iter_batches(
+                batch_size=batch_size, columns=columns
+            )
+            return
+        reader = _import_pyarrow("pyarrow.ipc").open_file(file)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            yield batch.select(columns) if columns is not None else batch
+
+
+def _arrow_chunk(
+    batch: Any, mapping: _ColumnMapping, collection: str, tenant: Optional[str], names: List[str]
+) -> _ColumnChunk:
+    return _ColumnChunk(
+        collection=collection,
+        tenant=tenant,
+        num_rows=batch.num_rows,
+        properties={
+            name: batch.column(column).to_pylist()
+            for column, name in mapping.property_names(names).items()
+        },
+        uuids=(
+            [_uuid_str(uid) for uid in batch.column(mapping.uuid).to_pylist()]
+            if mapping.uuid is not None
+            else _random_uuids(batch.num_rows)
+        ),
+        vector=(
+            _arrow_vectors(batch.column(mapping.vector)) if mapping.vector is not None else None
+        ),
+        named_vectors={
+            name: _arrow_vectors(batch.column(column))
+            for name, column in mapping.named_vectors.items()
+        },
+    )
+
+
+def _arrow_vectors(column: Any) -> List[Optional[bytes]]:
+    pa = _import_pyarrow()
+    if (
+        pa.types.is_fixed_size_list(column.type)
+        and pa.types.is_float32(column.type.value_type)
+        and column.null_count == 0
+        and column.values.null_count == 0
+    ):
+        # the float32 values of all rows are stored next to each other, every row is a slice of them
+        row_length = column.type.list_size * 4
+        start = (column.offset * column.type.list_size + column.values.offset) * 4
+        data = memoryview(column.values.buffers()[1])[start : start + len(column) * row_length]
+        return [data[i : i + row_length].tobytes() for i in range(0, len(data), row_length)]
+    return [_pack_floats(row) for row in column.to_pylist()]
+
+
+def _read_jsonl(
+    path: str, mapping: _ColumnMapping, collection: str, tenant: Optional[str], batch_size: int
+) -> Iterator[_ColumnChunk]:
+    lines: List[Dict[str, Any]] = []
+    with open(path, "rb") as file:
+        for line in file:
+            if line.strip():
+                lines.append(json.loads(line))
+            if len(lines) == batch_size:
+                yield _jsonl_chunk(lines, mapping, collection, tenant)
+                lines = []
+    if len(lines) > 0:
+        yield _jsonl_chunk(lines, mapping, collection, tenant)
+
+
+def _jsonl_chunk(
+    lines: List[Dict[str, Any]], mapping: _ColumnMapping, collection: str, tenant: Optional[str]
+) -> _ColumnChunk:
+    columns: List[str] = list(dict.fromkeys(key for line in lines for key in line))
+    if mapping.properties is not None:
+        # a key can be missing in all lines of a chunk, which is the same as a column with only nulls
+        columns.extend(column for column in mapping.properties if column not in columns)
+    return _ColumnChunk(
+        collection=collection,
+        tenant=tenant,
+        num_rows=len(lines),
+        properties={
+            name: [line.get(column) for line in lines]
+            for column, name in mapping.property_names(columns).items()
+        },
+        uuids=(
+            [_uuid_str(line.get(mapping.uuid)) for line in lines]
+            if mapping.uuid is not None
+            else _random_uuids(len(lines))
+        ),
+        vector=(
+            [_pack_floats(line.get(mapping.vector)) for line in lines]
+            if mapping.vector is not None
+            else None
+        ),
+        named_vectors={
+            name: [_pack_floats(line.get(column)) for line in lines]
+            for name, column in mapping.named_vectors.items()
+        },
+    )
+
+
+def _pack_floats(vector: Optional[List[float]]) -> Optional[bytes]:
+    return struct.pack(f"{len(vector)}f", *vector) if vector is not None else None
+
+
+def _uuid_str(uid: Any) -> str:
+    if uid is None:
+        return str(uuid_package.uuid4())
+    if isinstance(uid, bytes):
+        return str(uuid_package.UUID(bytes=uid))
+    return str(uuid_package.UUID(str(uid)))
+
+
+def _random_uuids(num: int) -> List[str]:
+    return [str(uuid_package.uuid4()) for _ in range(num)]
@@ -2,19 +2,27 @@ import datetime
 import struct
 import time
 import uuid as uuid_package
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 
 import grpc  # type: ignore
 from google.protobuf.struct_pb2 import Struct
+from typing_extensions import TypeAlias
 
+from weaviate.collections.batch.columns import _ColumnChunk
 from weaviate.collections.classes.batch import (
     ErrorObject,
     _BatchObject,
     BatchObjectReturn,
 )
-from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.config import (
+    ConsistencyLevel,
+    DataType,
+    _NestedProperty,
+    _Property,
+)
 from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
 from weaviate.collections.classes.internal import ReferenceToMulti, ReferenceInputs
+from weaviate.collections.config import _aget_schema_properties, _get_schema_properties
 from weaviate.collections.grpc.shared import _BaseGRPC
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import (
@@ -24,19 +32,228 @@ from weaviate.exceptions import (
     WeaviateInvalidInputError,
 )
 from weaviate.proto.v1 import batch_pb2, base_pb2
-from weaviate.util import _datetime_to_string, _get_vector_v4
+from weaviate.util import _datetime_to_string, _get_vector_bytes_v4, _get_vector_v4
+
 
+def _pack_vector(vector: Any) -> bytes:
+    if isinstance(vector, bytes):  # already packed, see _BatchObject
+        return vector
+    vector_bytes = _get_vector_bytes_v4(vector)
+    if vector_bytes is not None:
+        return vector_bytes
+    vector_list = _get_vector_v4(vector)
+    return struct.pack("{}f".format(len(vector_list)), *vector_list)
 
-def _pack_named_vectors(vectors: Dict[str, List[float]]) -> List[base_pb2.Vectors]:
+
+def _pack_named_vectors(vectors: Dict[str, Any]) -> List[base_pb2.Vectors]:
     return [
-        base_pb2.Vectors(
-            name=name,
-            vector_bytes=struct.pack("{}f".format(len(vector)), *vector),
-        )
+        base_pb2.Vectors(name=name, vector_bytes=_pack_vector(vector))
         for name, vector in vectors.items()
     ]
 
 
+# the encoders are also used for nested objects, whose values have the same fields as the properties of an object
+_Properties: TypeAlias = Union[batch_pb2.BatchObject.Properties, base_pb2.ObjectPropertiesValue]
+_PropertyEncoder: TypeAlias = Callable[[_Properties, str, Any], None]
+
+
+def _encode_text(properties: _Properties, name: str, value: Any) -> None:
+    properties.non_ref_properties.fields[name].string_value = value
+
+
+def _encode_bool(properties: _Properties, name: str, value: Any) -> None:
+    properties.non_ref_properties.fields[name].bool_value = value
+
+
+def _encode_number(properties: _Properties, name: str, value: Any) -> None:
+    properties.non_ref_properties.fields[name].number_value = value
+
+
+def _encode_datetime(properties: _Properties, name: str, value: Any) -> None:
+    properties.non_ref_properties.fields[name].string_value = _datetime_to_string(value)
+
+
+def _encode_date(properties: _Properties, name: str, value: Any) -> None:
+    # dates without a time, eg. Arrow date32 columns, are sent as midnight UTC
+    properties.non_ref_properties.fields[name].string_value = _datetime_to_string(
+        datetime.datetime.combine(value, datetime.time(), tzinfo=datetime.timezone.utc)
+    )
+
+
+def _encode_uuid(properties: _Properties, name: str, value: Any) -> None:
+    properties.non_ref_properties.fields[name].string_value = str(value)
+
+
+def _encode_text_array(properties: _Properties, name: str, value: Any) -> None:
+    if len(value) == 0:
+        properties.empty_list_props.append(name)
+    else:
+        properties.text_array_properties.add(prop_name=name, values=value)
+
+
+def _encode_bool_array(properties: _Properties, name: str, value: Any) -> None:
+    if len(value) == 0:
+        properties.empty_list_props.append(name)
+    else:
+        properties.boolean_array_properties.add(prop_name=name, values=value)
+
+
+def _encode_int_array(properties: _Properties, name: str, value: Any) -> None:
+    if len(value) == 0:
+        properties.empty_list_props.append(name)
+    else:
+        properties.int_array_properties.add(prop_name=name, values=value)
+
+
+def _encode_number_array(properties: _Properties, name: str, value: Any) -> None:
+    if len(value) == 0:
+        properties.empty_list_props.append(name)
+    else:
+        properties.number_array_properties.add(
+            prop_name=name, values_bytes=struct.pack(f"{len(value)}d", *value)
+        )
+
+
+# the order matters, bool is a subclass of int and datetime a subclass of date
+_VALUE_ENCODERS: List[Tuple[type, _PropertyEncoder]] = [
+    (str, _encode_text),
+    (bool, _encode_bool),
+    (int, _encode_number),
+    (float, _encode_number),
+    (datetime.datetime, _encode_datetime),
+    (datetime.date, _encode_date),
+    (uuid_package.UUID, _encode_uuid),
+]
+_ARRAY_ENCODERS: List[Tuple[type, _PropertyEncoder]] = [
+    (str, _encode_text_array),
+    (bool, _encode_bool_array),
+    (int, _encode_int_array),
+    (float, _encode_number_array),
+]
+
+
+def _encode_datetime_array(properties: _Properties, name: str, value: Any) -> None:
+    _encode_text_array(properties, name, [_datetime_to_string(val) for val in value])
+
+
+def _encode_uuid_array(properties: _Properties, name: str, value: Any) -> None:
+    _encode_text_array(properties, name, [str(val) for val in value])
+
+
+def _encode_untyped(properties: _Properties, name: str, value: Any) -> None:
+    """Encode a value whose wire type is not known up front by inspecting it."""
+    parsed = _translate_properties_from_python_to_grpc({name: value}, {})
+    if isinstance(properties, batch_pb2.BatchObject.Properties):
+        properties.MergeFrom(parsed)
+    else:
+        properties.MergeFrom(
+            base_pb2.ObjectPropertiesValue(
+                non_ref_properties=parsed.non_ref_properties,
+                int_array_properties=parsed.int_array_properties,
+                text_array_properties=parsed.text_array_properties,
+                number_array_properties=parsed.number_array_properties,
+                boolean_array_properties=parsed.boolean_array_properties,
+                object_properties=parsed.object_properties,
+                object_array_properties=parsed.object_array_properties,
+                empty_list_props=parsed.empty_list_props,
+            )
+        )
+
+
+# the encoders of the data types of a schema, by the exact type of the value or, for arrays, of their first element.
+# Values of any other type, eg. subclasses or numpy scalars, are encoded by `_encode_untyped`.
+_SCHEMA_VALUE_ENCODERS: Dict[DataType, Dict[type, _PropertyEncoder]] = {
+    DataType.TEXT: {str: _encode_text},
+    DataType.INT: {int: _encode_number},
+    DataType.NUMBER: {float: _encode_number, int: _encode_number},
+    DataType.BOOL: {bool: _encode_bool},
+    DataType.DATE: {datetime.datetime: _encode_datetime, str: _encode_text},
+    DataType.UUID: {uuid_package.UUID: _encode_uuid, str: _encode_text},
+    DataType.BLOB: {str: _encode_text},
+}
+_SCHEMA_ARRAY_ENCODERS: Dict[DataType, Dict[type, _PropertyEncoder]] = {
+    DataType.TEXT_ARRAY: {str: _encode_text_array},
+    DataType.INT_ARRAY: {int: _encode_int_array},
+    DataType.NUMBER_ARRAY: {float: _encode_number_array, int: _encode_number_array},
+    DataType.BOOL_ARRAY: {bool: _encode_bool_array},
+    DataType.DATE_ARRAY: {datetime.datetime: _encode_datetime_array, str: _encode_text_array},
+    DataType.UUID_ARRAY: {uuid_package.UUID: _encode_uuid_array, str: _encode_text_array},
+}
+
+# the schema of a collection is only requested for inserts of at least this many objects, as the request costs more
+# than it saves for a few objects. Once it is known it is used for all inserts into the collection.
+SCHEMA_ENCODER_MIN_OBJECTS = 100
+
+
+def _schema_encoders(
+    properties: Sequence[Union[_Property, _NestedProperty]]
+) -> Dict[str, _PropertyEncoder]:
+    """Compile the properties of a schema into the encoder of each property, by name."""
+    return {
+        prop.name: _schema_encoder(prop.data_type, prop.nested_properties) for prop in properties
+    }
+
+
+def _schema_encoder(
+    data_type: DataType, nested_properties: Optional[List[_NestedProperty]]
+) -> _PropertyEncoder:
+    if data_type == DataType.OBJECT or data_type == DataType.OBJECT_ARRAY:
+        nested = _schema_encoders(nested_properties or [])
+
+        def encode_object(properties: _Properties, name: str, value: Any) -> None:
+            if type(value) is not dict:
+                return _encode_untyped(properties, name, value)
+            _encode_properties(
+                properties.object_properties.add(prop_name=name).value, value, nested
+            )
+
+        def encode_object_array(properties: _Properties, name: str, value: Any) -> None:
+            if type(value) is not list or any(type(val) is not dict for val in value):
+                return _encode_untyped(properties, name, value)
+            if len(value) == 0:
+                properties.empty_list_props.append(name)
+                return
+            values = properties.object_array_properties.add(prop_name=name).values
+            for val in value:
+                _encode_properties(values.add(), val, nested)
+
+        return encode_object if data_type == DataType.OBJECT else encode_object_array
+
+    if data_type in _SCHEMA_ARRAY_ENCODERS:
+        by_element = _SCHEMA_ARRAY_ENCODERS[data_type]
+
+        def encode_array(properties: _Properties, name: str, value: Any) -> None:
+            if type(value) is list:
+                if len(value) == 0:
+                    properties.empty_list_props.append(name)
+                    return
+                encoder = by_element.get(type(value[0]))
+                if encoder is not None:
+                    return encoder(properties, name, value)
+            _encode_untyped(properties, name, value)
+
+        return encode_array
+
+    if data_type in _SCHEMA_VALUE_ENCODERS:
+        by_type = _SCHEMA_VALUE_ENCODERS[data_type]
+
+        def encode_value(properties: _Properties, name: str, value: Any) -> None:
+            by_type.get(type(value), _encode_untyped)(properties, name, value)
+
+        return encode_value
+
+    # geo coordinates and phone numbers are sent as structs
+    return _encode_untyped
+
+
+def _encode_properties(
+    properties: _Properties, data: Dict[str, Any], encoders: Dict[str, _PropertyEncoder]
+) -> None:
+    _validate_props(data)
+    for name, value in data.items():
+        encoders.get(name, _encode_untyped)(properties, name, value)
+
+
 class _BatchGRPC(_BaseGRPC):
     """This class is used to insert multiple objects into Weaviate using the gRPC API.
 
@@ -46,29 +263,75 @@ class _BatchGRPC(_BaseGRPC):
 
     def __init__(self, connection: ConnectionV4, consistency_level: Optional[ConsistencyLevel]):
         super().__init__(connection, consistency_level)
+        # the property encoders of each collection, `None` if its schema could not be retrieved
+        self.__schema_encoders: Dict[str, Optional[Dict[str, _PropertyEncoder]]] = {}
 
-    def __grpc_objects(self, objects: List[_BatchObject]) -> List[batch_pb2.BatchObject]:
-        def pack_vector(vector: Any) -> bytes:
-            vector_list = _get_vector_v4(vector)
-            return struct.pack("{}f".format(len(vector_list)), *vector_list)
+    def __encoders(
+        self, collections: Set[str], num_objects: int
+    ) -> Dict[str, Optional[Dict[str, _PropertyEncoder]]]:
+        """Return the property encoders compiled from the schema of every collection, `None` if it is not known.
 
+        The schema is requested once per collection. If it does not exist yet, eg. because it is created by
+        auto-schema, or cannot be retrieved, the types of the values are inspected instead.
+        """
+        for collection in self.__unknown_schemas(collections, num_objects):
+            self.__set_schema(collection, _get_schema_properties(self._connection, collection))
+        return {collection: self.__schema_encoders.get(collection) for collection in collections}
+
+    async def __aencoders(
+        self, collections: Set[str], num_objects: int
+    ) -> Dict[str, Optional[Dict[str, _PropertyEncoder]]]:
+        """Return the property encoders like `__encoders`, the schemas are requested over the async client."""
+        for collection in self.__unknown_schemas(collections, num_objects):
+            self.__set_schema(
+                collection, await _aget_schema_properties(self._connection, collection)
+            )
+        return {collection: self.__schema_encoders.get(collection) for collection in collections}
+
+    def __unknown_schemas(self, collections: Set[str], num_objects: int) -> List[str]:
+        if num_objects < SCHEMA_ENCODER_MIN_OBJECTS:
+            return []
+        return [
+            collection for collection in collections if collection not in self.__schema_encoders
+        ]
+
+    def __set_schema(self, collection: str, properties: Optional[List[_Property]]) -> None:
+        self.__schema_encoders[collection] = (
+            _schema_encoders(properties) if properties is not None else None
+        )
+
+    def __grpc_properties(
+        self,
+        obj: _BatchObject,
+        encoders: Optional[Dict[str, _PropertyEncoder]],
+    ) -> Optional[batch_pb2.BatchObject.Properties]:
+        if obj.properties is None:
+            return None
+        if encoders is None:
+            return _translate_properties_from_python_to_grpc(
+                obj.properties, obj.references if obj.references is not None else {}
+            )
+        properties = batch_pb2.BatchObject.Properties()
+        _encode_properties(properties, obj.properties, encoders)
+        if obj.references is not None:
+            properties.MergeFrom(_translate_properties_from_python_to_grpc({}, obj.references))
+        return properties
+
+    def __grpc_objects(
+        self,
+        objects: List[_BatchObject],
+        encoders: Dict[str, Optional[Dict[str, _PropertyEncoder]]],
+    ) -> List[batch_pb2.BatchObject]:
         return [
             batch_pb2.BatchObject(
                 collection=obj.collection,
                 vector_bytes=(
-                    pack_vector(obj.vector)
-                    if obj.vector is not None and isinstance(obj.vector, list)
+                    _pack_vector(obj.vector)
+                    if obj.vector is not None and not isinstance(obj.vector, dict)
                     else None
                 ),
                 uuid=str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4()),
-                properties=(
-                    self.__translate_properties_from_python_to_grpc(
-                        obj.properties,
-                        obj.references if obj.references is not None else {},
-                    )
-                    if obj.properties is not None
-                    else None
-                ),
+                properties=self.__grpc_properties(obj, encoders[obj.collection]),
                 tenant=obj.tenant,
                 vectors=(
                     _pack_named_vectors(obj.vector)
@@ -91,12 +354,87 @@ class _BatchGRPC(_BaseGRPC):
             `tenant`
                 The tenant to be used for this batch operation
         """
-        weaviate_objs = self.__grpc_objects(objects)
+        encoders = self.__encoders({obj.collection for obj in objects}, len(objects))
+        return self.__insert(self.__grpc_objects(objects, encoders), objects.__getitem__, timeout)
+
+    def columns(self, chunk: _ColumnChunk, timeout: int) -> BatchObjectReturn:
+        """Insert a chunk of objects that is stored column by column into Weaviate through the gRPC API.
+
+        The serialization of every property is chosen once per column instead of once per value, and the objects are
+        only converted to `_BatchObject`s if they fail to be inserted.
+
+        Parameters:
+            `chunk`
+                The objects to insert.
+            `timeout`
+                The timeout of the request in seconds.
+        """
+        encoders = [
+            (name, values, self.__column_encoder(values))
+            for name, values in chunk.properties.items()
+        ]
+        weaviate_objs: List[batch_pb2.BatchObject] = []
+        for i in range(chunk.num_rows):
+            properties = batch_pb2.BatchObject.Properties()
+            for name, values, encode in encoders:
+                if values[i] is not None:
+                    encode(properties, name, values[i])
+            weaviate_objs.append(
+                batch_pb2.BatchObject(
+                    collection=chunk.collection,
+                    vector_bytes=chunk.vector[i] if chunk.vector is not None else None,
+                    uuid=chunk.uuids[i],
+                    properties=properties,
+                    tenant=chunk.tenant,
+                    vectors=[
+                        base_pb2.Vectors(name=name, vector_bytes=rows[i])
+                        for name, rows in chunk.named_vectors.items()
+                        if rows[i] is not None
+                    ],
+                )
+            )
+        return self.__insert(weaviate_objs, chunk.row, timeout)
+
+    def __column_encoder(self, values: List[Any]) -> _PropertyEncoder:
+        """Return the function that adds the values of a column to the properties of their objects.
 
+        The function is chosen by the first value that is set, so all values of a column need to have the same type.
+        """
+        first = next((value for value in values if value is not None), None)
+        if isinstance(first, list):
+            element = next(
+                (value[0] for value in values if value is not None and len(value) > 0), None
+            )
+            for type_, encoder in _ARRAY_ENCODERS:
+                if isinstance(element, type_):
+                    return encoder
+        else:
+            for type_, encoder in _VALUE_ENCODERS:
+                if isinstance(first, type_):
+                    return encoder
+
+        return _encode_untyped
+
+    def __insert(
+        self,
+        weaviate_objs: List[batch_pb2.BatchObject],
+        batch_object: Callable[[int], _BatchObject],
+        timeout: int,
+    ) -> BatchObjectReturn:
         start = time.time()
-        errors = self.__send_batch(weaviate_objs, timeout=timeout)
+        try:
+            errors = self.__send_batch(weaviate_objs, timeout=timeout)
+        finally:
+            self._connection.invalidate_query_cache(*{obj.collection for obj in weaviate_objs})
         elapsed_time = time.time() - start
 
+        self.__raise_if_all_failed(weaviate_objs, errors)
+        return self.__to_return(weaviate_objs, batch_object, errors, elapsed_time)
+
+    @staticmethod
+    def __raise_if_all_failed(
+        weaviate_objs: List[batch_pb2.BatchObject], errors: Dict[int, str]
+    ) -> None:
         if len(errors) == len(weaviate_objs):
             # Escape sequence (backslash) not allowed in expression portion of f-string prior to Python 3.12: pylance
             raise WeaviateInsertManyAllFailedError(
@@ -105,6 +443,13 @@ class _BatchGRPC(_BaseGRPC):
                 )
             )
 
+    @staticmethod
+    def __to_return(
+        weaviate_objs: List[batch_pb2.BatchObject],
+        batch_object: Callable[[int], _BatchObject],
+        errors: Dict[int, str],
+        elapsed_time: float,
+    ) -> BatchObjectReturn:
         all_responses: List[Union[uuid_package.UUID, ErrorObject]] = cast(
             List[Union[uuid_package.UUID, ErrorObject]], list(range(len(weaviate_objs)))
         )
@@ -113,7 +458,8 @@ class _BatchGRPC(_BaseGRPC):
 
         for idx, obj in enumerate(weaviate_objs):
             if idx in errors:
-                error = ErrorObject(errors[idx], objects[idx], original_uuid=objects[idx].uuid)
+                failed = batch_object(idx)
+                error = ErrorObject(errors[idx], failed, original_uuid=failed.uuid)
                 return_errors[idx] = error
                 all_responses[idx] = error
             else:
@@ -132,16 +478,16 @@ class _BatchGRPC(_BaseGRPC):
     def __send_batch(self, batch: List[batch_pb2.BatchObject], timeout: int) -> Dict[int, str]:
         metadata = self._get_metadata()
         try:
-            assert self._connection.grpc_stub is not None
             res: batch_pb2.BatchObjectsReply
-            res, _ = self._connection.grpc_stub.BatchObjects.with_call(
-                batch_pb2.BatchObjectsRequest(
-                    objects=batch,
-                    consistency_level=self._consistency_level,
-                ),
-                metadata=metadata,
-                timeout=timeout,
-            )
+            with self._connection.acquire_grpc_stub() as stub:
+                res, _ = stub.BatchObjects.with_call(
+                    batch_pb2.BatchObjectsRequest(
+                        objects=batch,
+                        consistency_level=self._consistency_level,
+                    ),
+                    metadata=metadata,
+                    timeout=timeout,
+                )
 
             objects: Dict[int, str] = {}
             for result in res.errors:
@@ -150,8 +496,10 @@ class _BatchGRPC(_BaseGRPC):
         except grpc.RpcError as e:
             raise WeaviateBatchError(e.details())  # pyright: ignore
 
-    async def aobjects(self, objects: List[_BatchObject], timeout: int) -> BatchObjectReturn:
-        """Insert multiple objects into Weaviate through the gRPC API.
+    async def aobjects(
+        self, objects: List[_BatchObject], timeout: int, all_failed_raises: bool = False
+    ) -> BatchObjectReturn:
+        """Insert multiple objects into Weaviate through the async gRPC API.
 
         Parameters:
             `objects`
@@ -159,38 +507,25 @@ class _BatchGRPC(_BaseGRPC):
                 provided for each object, and the UUID is optional. If no UUID is provided, one will be generated for each object.
                 The UUIDs of the inserted objects will be returned in the `uuids` attribute of the returned `_BatchReturn` object.
                 The UUIDs of the objects that failed to be inserted will be returned in the `errors` attribute of the returned `_BatchReturn` object.
-            `tenant`
-                The tenant to be used for this batch operation
+            `timeout`
+                The timeout of the request in seconds.
+            `all_failed_raises`
+                Raise a `WeaviateInsertManyAllFailedError` if all objects failed, like `objects`. The batches collect
+                the errors instead.
         """
-        weaviate_objs = self.__grpc_objects(objects)
+        encoders = await self.__aencoders({obj.collection for obj in objects}, len(objects))
+        weaviate_objs = self.__grpc_objects(objects, encoders)
 
         start = time.time()
-        errors = await self.__send_batch_async(weaviate_objs, timeout=timeout)
+        try:
+            errors = await self.__send_batch_async(weaviate_objs, timeout=timeout)
+        finally:
+            self._connection.invalidate_query_cache(*{obj.collection for obj in weaviate_objs})
         elapsed_time = time.time() - start
 
-        all_responses: List[Union[uuid_package.UUID, ErrorObject]] = cast(
-            List[Union[uuid_package.UUID, ErrorObject]], list(range(len(weaviate_objs)))
-        )
-        return_success: Dict[int, uuid_package.UUID] = {}
-        return_errors: Dict[int, ErrorObject] = {}
-
-        for idx, obj in enumerate(weaviate_objs):
-            if idx in errors:
-                error = ErrorObject(errors[idx], objects[idx], original_uuid=objects[idx].uuid)
-                return_errors[idx] = error
-                all_responses[idx] = error
-            else:
-                success = uuid_package.UUID(obj.uuid)
-                return_success[idx] = success
-                all_responses[idx] = success
-
-        return BatchObjectReturn(
-            uuids=return_success,
-            errors=return_errors,
-            has_errors=len(errors) > 0,
-            all_responses=all_responses,
-            elapsed_seconds=elapsed_time,
-        )
+        if all_failed_raises:
+            self.__raise_if_all_failed(weaviate_objs, errors)
+        return self.__to_return(weaviate_objs, objects.__getitem__, errors, elapsed_time)
 
     async def __send_batch_async(
         self, batch: List[batch_pb2.BatchObject], timeout: int
@@ -215,49 +550,69 @@ class _BatchGRPC(_BaseGRPC):
         except grpc.RpcError as e:
             raise WeaviateBatchError(e.details())  # pyright: ignore
 
-    def __translate_properties_from_python_to_grpc(
-        self, data: Dict[str, Any], refs: ReferenceInputs
-    ) -> batch_pb2.BatchObject.Properties:
-        _validate_props(data)
-
-        multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
-        single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
-        non_ref_properties: Struct = Struct()
-        bool_arrays: List[base_pb2.BooleanArrayProperties] = []
-        text_arrays: List[base_pb2.TextArrayProperties] = []
-        int_arrays: List[base_pb2.IntArrayProperties] = []
-        float_arrays: List[base_pb2.NumberArrayProperties] = []
-        object_properties: List[base_pb2.ObjectProperties] = []
-        object_array_properties: List[base_pb2.ObjectArrayProperties] = []
-        empty_lists: List[str] = []
-
-        for key, ref in refs.items():
-            if isinstance(ref, ReferenceToMulti):
-                multi_target.append(
-                    batch_pb2.BatchObject.MultiTargetRefProps(
-                        uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
-                    )
+
+def _translate_properties_from_python_to_grpc(
+    data: Dict[str, Any], refs: ReferenceInputs
+) -> batch_pb2.BatchObject.Properties:
+    _validate_props(data)
+
+    multi_target: List[batch_pb2.BatchObject.MultiTargetRefProps] = []
+    single_target: List[batch_pb2.BatchObject.SingleTargetRefProps] = []
+    non_ref_properties: Struct = Struct()
+    bool_arrays: List[base_pb2.BooleanArrayProperties] = []
+    text_arrays: List[base_pb2.TextArrayProperties] = []
+    int_arrays: List[base_pb2.IntArrayProperties] = []
+    float_arrays: List[base_pb2.NumberArrayProperties] = []
+    object_properties: List[base_pb2.ObjectProperties] = []
+    object_array_properties: List[base_pb2.ObjectArrayProperties] = []
+    empty_lists: List[str] = []
+
+    for key, ref in refs.items():
+        if isinstance(ref, ReferenceToMulti):
+            multi_target.append(
+                batch_pb2.BatchObject.MultiTargetRefProps(
+                    uuids=ref.uuids_str, target_collection=ref.target_collection, prop_name=key
                 )
-            elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
+            )
+        elif isinstance(ref, str) or isinstance(ref, uuid_package.UUID):
+            single_target.append(
+                batch_pb2.BatchObject.SingleTargetRefProps(uuids=[str(ref)], prop_name=key)
+            )
+        elif isinstance(ref, list):
+            single_target.append(
+                batch_pb2.BatchObject.SingleTargetRefProps(
+                    uuids=[str(v) for v in ref], prop_name=key
                 )
-            elif isinstance(ref, list):
-                single_target.append(
-                    batch_pb2.BatchObject.SingleTargetRefProps(
-                        uuids=[str(v) for v in ref], prop_name=key
-                    )
+            )
+        else:
+            raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
+
+    for key, entry in data.items():
+        if isinstance(entry, dict):
+            parsed = _translate_properties_from_python_to_grpc(entry, {})
+            object_properties.append(
+                base_pb2.ObjectProperties(
+                    prop_name=key,
+                    value=base_pb2.ObjectPropertiesValue(
+                        non_ref_properties=parsed.non_ref_properties,
+                        int_array_properties=parsed.int_array_properties,
+                        text_array_properties=parsed.text_array_properties,
+                        number_array_properties=parsed.number_array_properties,
+                        boolean_array_properties=parsed.boolean_array_properties,
+                        object_properties=parsed.object_properties,
+                        object_array_properties=parsed.object_array_properties,
+                        empty_list_props=parsed.empty_list_props,
+                    ),
                 )
-            else:
-                raise WeaviateInvalidInputError(f"Invalid reference: {ref}")
-
-        for key, entry in data.items():
-            if isinstance(entry, dict):
-                parsed = self.__translate_properties_from_python_to_grpc(entry, {})
-                object_properties.append(
-                    base_pb2.ObjectProperties(
-                        prop_name=key,
-                        value=base_pb2.ObjectPropertiesValue(
+            )
+        elif isinstance(entry, list) and len(entry) == 0:
+            empty_lists.append(key)
+        elif isinstance(entry, list) and isinstance(entry[0], dict):
+            entry = cast(List[Dict[str, Any]], entry)
+            object_array_properties.append(
+                base_pb2.ObjectArrayProperties(
+                    values=[
+                        base_pb2.ObjectPropertiesValue(
                             non_ref_properties=parsed.non_ref_properties,
                             int_array_properties=parsed.int_array_properties,
                             text_array_properties=parsed.text_array_properties,
@@ -266,72 +621,53 @@ class _BatchGRPC(_BaseGRPC):
                             object_properties=parsed.object_properties,
                             object_array_properties=parsed.object_array_properties,
                             empty_list_props=parsed.empty_list_props,
-                        ),
-                    )
-                )
-            elif isinstance(entry, list) and len(entry) == 0:
-                empty_lists.append(key)
-            elif isinstance(entry, list) and isinstance(entry[0], dict):
-                entry = cast(List[Dict[str, Any]], entry)
-                object_array_properties.append(
-                    base_pb2.ObjectArrayProperties(
-                        values=[
-                            base_pb2.ObjectPropertiesValue(
-                                non_ref_properties=parsed.non_ref_properties,
-                                int_array_properties=parsed.int_array_properties,
-                                text_array_properties=parsed.text_array_properties,
-                                number_array_properties=parsed.number_array_properties,
-                                boolean_array_properties=parsed.boolean_array_properties,
-                                object_properties=parsed.object_properties,
-                                object_array_properties=parsed.object_array_properties,
-                                empty_list_props=parsed.empty_list_props,
-                            )
-                            for v in entry
-                            if (parsed := self.__translate_properties_from_python_to_grpc(v, {}))
-                        ],
-                        prop_name=key,
-                    )
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], bool):
-                bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], str):
-                text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(
-                        prop_name=key, values=[_datetime_to_string(x) for x in entry]
-                    )
+                        )
+                        for v in entry
+                        if (parsed := _translate_properties_from_python_to_grpc(v, {}))
+                    ],
+                    prop_name=key,
                 )
-            elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
-                text_arrays.append(
-                    base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
-                )
-            elif isinstance(entry, list) and isinstance(entry[0], int):
-                int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=entry))
-            elif isinstance(entry, list) and isinstance(entry[0], float):
-                values_bytes = struct.pack("{}d".format(len(entry)), *entry)
-                float_arrays.append(
-                    base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+            )
+        elif isinstance(entry, list) and isinstance(entry[0], bool):
+            bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=entry))
+        elif isinstance(entry, list) and isinstance(entry[0], str):
+            text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=entry))
+        elif isinstance(entry, list) and isinstance(entry[0], datetime.datetime):
+            text_arrays.append(
+                base_pb2.TextArrayProperties(
+                    prop_name=key, values=[_datetime_to_string(x) for x in entry]
                 )
-            elif isinstance(entry, GeoCoordinate):
-                non_ref_properties.update({key: entry._to_dict()})
-            elif isinstance(entry, PhoneNumber):
-                non_ref_properties.update({key: entry._to_dict()})
-            else:
-                non_ref_properties.update({key: _serialize_primitive(entry)})
-
-        return batch_pb2.BatchObject.Properties(
-            non_ref_properties=non_ref_properties,
-            multi_target_ref_props=multi_target,
-            single_target_ref_props=single_target,
-            text_array_properties=text_arrays,
-            number_array_properties=float_arrays,
-            int_array_properties=int_arrays,
-            boolean_array_properties=bool_arrays,
-            object_properties=object_properties,
-            object_array_properties=object_array_properties,
-            empty_list_props=empty_lists,
-        )
+            )
+        elif isinstance(entry, list) and isinstance(entry[0], uuid_package.UUID):
+            text_arrays.append(
+                base_pb2.TextArrayProperties(prop_name=key, values=[str(x) for x in entry])
+            )
+        elif isinstance(entry, list) and isinstance(entry[0], int):
+            int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=entry))
+        elif isinstance(entry, list) and isinstance(entry[0], float):
+            values_bytes = struct.pack("{}d".format(len(entry)), *entry)
+            float_arrays.append(
+                base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+            )
+        elif isinstance(entry, GeoCoordinate):
+            non_ref_properties.update({key: entry._to_dict()})
+        elif isinstance(entry, PhoneNumber):
+            non_ref_properties.update({key: entry._to_dict()})
+        else:
+            non_ref_properties.update({key: _serialize_primitive(entry)})
+
+    return batch_pb2.BatchObject.Properties(
+        non_ref_properties=non_ref_properties,
+        multi_target_ref_props=multi_target,
+        single_target_ref_props=single_target,
+        text_array_properties=text_arrays,
+        number_array_properties=float_arrays,
+        int_array_properties=int_arrays,
+        boolean_array_properties=bool_arrays,
+        object_properties=object_properties,
+        object_array_properties=object_array_properties,
+        empty_list_props=empty_lists,
+    )
 
 
 def _validate_props(props: Dict[str, Any]) -> None:
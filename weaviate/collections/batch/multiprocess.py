@@ -0,0 +1,394 @@
+import multiprocessing
+import pickle
+import queue
+import uuid as uuid_package
+from multiprocessing.context import SpawnProcess
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from weaviate.collections.batch.base import (
+    _BatchBase,
+    _BatchDataWrapper,
+    _BatchMode,
+)
+from weaviate.collections.classes.batch import BatchObjectReturn, _split_vectors
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.data import DataObject
+from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
+from weaviate.collections.classes.types import WeaviateProperties
+from weaviate.connect import ConnectionV4
+from weaviate.exceptions import WeaviateBatchError
+from weaviate.types import UUID, VECTORS
+from weaviate.util import _capitalize_first_letter, get_valid_uuid
+
+# the number of objects and references that are sent to a worker at once, sending them one by one would make the
+# transfer between the processes the bottleneck
+WORKER_CHUNK_SIZE = 100
+# the number of chunks that can be queued for a worker before adding objects blocks
+WORKER_QUEUE_SIZE = 8
+POLL_INTERVAL = 0.1
+
+_Operation = Tuple[str, Dict[str, Any]]
+
+_ADD_OBJECT = "add_object"
+_ADD_REFERENCE = "add_reference"
+_ADD = "add"
+_FLUSH = "flush"
+_SHUTDOWN = "shutdown"
+_ERROR = "error"
+_RESULTS = "results"
+_FLUSHED = "flushed"
+_DONE = "done"
+
+
+def _picklable(e: Exception) -> Exception:
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return WeaviateBatchError(repr(e))
+
+
+def _run_worker(
+    index: int,
+    connection: ConnectionV4,
+    consistency_level: Optional[ConsistencyLevel],
+    batch_mode: _BatchMode,
+    trusted: bool,
+    keep_successful: bool,
+    forward_results: bool,
+    operations: "multiprocessing.Queue[Tuple[str, List[_Operation]]]",
+    replies: "multiprocessing.Queue[Tuple[int, str, Any]]",
+) -> None:
+    """Run the batch of one worker process.
+
+    Objects and references arrive in chunks and are added to a regular batch, which validates and serializes them and
+    sends them over the gRPC channel and the http clients of this process. With `forward_results` the results of every
+    batch of objects that was sent are passed to the parent process, which calls its `on_results` with them.
+    """
+
+    def on_results(results: BatchObjectReturn) -> None:
+        replies.put((index, _RESULTS, results))
+
+    try:
+        connection.connect(skip_init_checks=True)
+        data = _BatchDataWrapper()
+        batch = _BatchBase(
+            connection=connection,
+            consistency_level=consistency_level,
+            results=data,
+            batch_mode=batch_mode,
+            trusted=trusted,
+            keep_successful=keep_successful,
+            on_results=on_results if forward_results else None,
+        )
+    except Exception as e:
+        replies.put((index, _ERROR, _picklable(e)))
+        connection.close()
+        return
+
+    try:
+        while True:
+            command, chunk = operations.get()
+            if command == _ADD:
+                for kind, kwargs in chunk:
+                    try:
+                        if kind == _ADD_OBJECT:
+                            batch._add_object(**kwargs)
+                        else:
+                            batch._add_reference(**kwargs)
+                    except Exception as e:
+                        # the following objects are still added, like in a batch that is used from a single process
+                        replies.put((index, _ERROR, _picklable(e)))
+            elif command == _FLUSH:
+                batch.flush()
+                replies.put((index, _FLUSHED, batch.number_errors))
+            else:
+                assert command == _SHUTDOWN
+                batch._shutdown()
+                replies.put((index, _DONE, data))
+                return
+    except Exception as e:
+        replies.put((index, _ERROR, _picklable(e)))
+    finally:
+        connection.close()
+
+
+class _BatchMultiprocess:
+    """Shards the objects and references of a batch across worker processes.
+
+    Every worker opens its own connection and runs a regular batch with its own dynamic-batching state, so the
+    validation and serialization of the objects is spread over several cores. Objects are assigned to a worker by their
+    UUID and references by the UUID of their source object, so a reference is always sent by the same worker as its
+    source object and after it. The results of the workers are merged into `results` once the batch is shut down.
+    """
+
+    def __init__(
+        self,
+        connection: ConnectionV4,
+        consistency_level: Optional[ConsistencyLevel],
+        results: _BatchDataWrapper,
+        batch_mode: _BatchMode,
+        workers: int,
+        trusted: bool = False,
+        keep_successful: bool = True,
+        on_results: Optional[Callable[[BatchObjectReturn], None]] = None,
+    ) -> None:
+        # workers are spawned instead of forked as the gRPC channels and threads of this process must not be copied
+        context = multiprocessing.get_context("spawn")
+        self.__connection = connection
+        self.__results = results
+        self.__keep_successful = keep_successful
+        self.__on_results = on_results
+        self.__replies: "multiprocessing.Queue[Tuple[int, str, Any]]" = context.Queue()
+        self.__queues: List["multiprocessing.Queue[Tuple[str, List[_Operation]]]"] = []
+        self.__processes: List[SpawnProcess] = []
+        for index in range(workers):
+            operations: "multiprocessing.Queue[Tuple[str, List[_Operation]]]" = context.Queue(
+                WORKER_QUEUE_SIZE
+            )
+            process = context.Process(
+                target=_run_worker,
+                args=(
+                    index,
+                    connection,
+                    consistency_level,
+                    batch_mode,
+                    trusted,
+                    keep_successful,
+                    on_results is not None,
+                    operations,
+                    self.__replies,
+                ),
+                daemon=True,
+                name=f"BatchWorker-{index}",
+            )
+            process.start()
+            self.__queues.append(operations)
+            self.__processes.append(process)
+
+        self.__chunks: List[List[_Operation]] = [[] for _ in range(workers)]
+        self.__number_errors = 0
+        self.__worker_error: Optional[Exception] = None
+        self.__closed = False
+        # the collections that objects or references were added to, the workers write them on their own connections
+        self.__collections: Set[str] = set()
+
+    @property
+    def number_errors(self) -> int:
+        """Return the number of errors in the batch as of the last flush."""
+        return self.__number_errors
+
+    def __worker_for(self, uuid: UUID) -> int:
+        return uuid_package.UUID(str(uuid)).int % len(self.__processes)
+
+    def __add(self, worker: int, operation: _Operation) -> None:
+        self.__check_workers()
+        chunk = self.__chunks[worker]
+        chunk.append(operation)
+        if len(chunk) >= WORKER_CHUNK_SIZE:
+            self.__send(worker, _ADD, chunk)
+            self.__chunks[worker] = []
+
+    def __send(self, worker: int, command: str, chunk: List[_Operation]) -> None:
+        # the queues are bounded, so a slow worker blocks the producer instead of buffering the whole import
+        while True:
+            try:
+                self.__queues[worker].put((command, chunk), timeout=POLL_INTERVAL)
+                return
+            except queue.Full:
+                self.__check_workers()
+
+    def __send_chunks(self) -> None:
+        for worker, chunk in enumerate(self.__chunks):
+            if len(chunk) > 0:
+                self.__send(worker, _ADD, chunk)
+        self.__chunks = [[] for _ in self.__processes]
+
+    def __handle_reply(self, kind: str, payload: Any) -> None:
+        if kind == _RESULTS:
+            assert self.__on_results is not None
+            try:
+                self.__on_results(payload)
+            except Exception as e:
+                # raised by the next call of the batch, like an error of a worker
+                if self.__worker_error is None:
+                    self.__worker_error = e
+        elif kind == _ERROR and self.__worker_error is None:
+            self.__worker_error = payload
+
+    def __check_workers(self) -> None:
+        """Raise the first error that a worker reported since the last check."""
+        while True:
+            try:
+                _, kind, payload = self.__replies.get_nowait()
+            except queue.Empty:
+                break
+            self.__handle_reply(kind, payload)
+        self.__raise_worker_error()
+        for process in self.__processes:
+            if not process.is_alive():
+                raise WeaviateBatchError(f"Batch worker {process.name} died unexpectedly")
+
+    def __raise_worker_error(self) -> None:
+        if self.__worker_error is not None:
+            error, self.__worker_error = self.__worker_error, None
+            raise error
+
+    def __wait_for_workers(self, command: str, expected: str) -> List[Any]:
+        """Send `command` to every worker and wait until each has answered with `expected`."""
+        self.__send_chunks()
+        for worker in range(len(self.__processes)):
+            self.__send(worker, command, [])
+        answers: Dict[int, Any] = {}
+        while len(answers) < len(self.__processes):
+            try:
+                index, kind, payload = self.__replies.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                dead = [
+                    process.name
+                    for i, process in enumerate(self.__processes)
+                    if i not in answers and not process.is_alive()
+                ]
+                if len(dead) > 0:
+                    raise WeaviateBatchError(f"Batch worker {dead[0]} died unexpectedly")
+                continue
+            if kind == expected:
+                answers[index] = payload
+            else:
+                self.__handle_reply(kind, payload)
+        return [answers[index] for index in range(len(self.__processes))]
+
+    def __invalidate_query_cache(self) -> None:
+        # invalid names are reported by the workers
+        self.__connection.invalidate_query_cache(
+            *(_capitalize_first_letter(name) for name in self.__collections if len(name) > 0)
+        )
+
+    def flush(self) -> None:
+        """Send all objects and references to the workers and wait for all their requests to be finished."""
+        try:
+            self.__number_errors = sum(self.__wait_for_workers(_FLUSH, _FLUSHED))
+        finally:
+            self.__invalidate_query_cache()
+        self.__raise_worker_error()
+
+    def _shutdown(self) -> None:
+        """Shut the workers down and merge their results."""
+        if self.__closed:
+            return
+        self.__closed = True
+        try:
+            worker_data: List[_BatchDataWrapper] = self.__wait_for_workers(_SHUTDOWN, _DONE)
+        finally:
+            self.__invalidate_query_cache()
+            for process in self.__processes:
+                process.join(timeout=POLL_INTERVAL)
+                if process.is_alive():
+                    process.terminate()
+
+        merged = _BatchDataWrapper()
+        for data in worker_data:
+            # the indices of the objects of a worker follow the objects of the previous workers
+            merged.results.objs._merge(
+                data.results.objs, merged.results.num_objects, self.__keep_successful
+            )
+            merged.results.refs += data.results.refs
+            merged.results.num_objects += data.results.num_objects
+            merged.results.num_references += data.results.num_references
+            merged.failed_objects.extend(data.failed_objects)
+            merged.failed_references.extend(data.failed_references)
+            merged.imported_shards.update(data.imported_shards)
+        self.__results.results = merged.results
+        self.__results.failed_objects = merged.failed_objects
+        self.__results.failed_references = merged.failed_references
+        self.__results.imported_shards = merged.imported_shards
+        self.__number_errors = len(merged.failed_objects) + len(merged.failed_references)
+        self.__raise_worker_error()
+
+    def _add_object(
+        self,
+        collection: str,
+        properties: Optional[WeaviateProperties] = None,
+        references: Optional[ReferenceInputs] = None,
+        uuid: Optional[UUID] = None,
+        vector: Optional[VECTORS] = None,
+        tenant: Optional[str] = None,
+    ) -> UUID:
+        # the UUID is created here as it is returned to the caller and decides which worker sends the object
+        uid: UUID = get_valid_uuid(uuid) if uuid is not None else uuid_package.uuid4()
+        self.__collections.add(collection)
+        self.__add(
+            self.__worker_for(uid),
+            (
+                _ADD_OBJECT,
+                {
+                    "collection": collection,
+                    "properties": properties,
+                    "references": references,
+                    "uuid": uid,
+                    "vector": _picklable_vector(vector),
+                    "tenant": tenant,
+                },
+            ),
+        )
+        return uid
+
+    def _add_objects(
+        self,
+        collection: str,
+        objects: Sequence[Union[WeaviateProperties, DataObject[WeaviateProperties, Any]]],
+        vectors: Optional[Any] = None,
+        tenant: Optional[str] = None,
+    ) -> List[UUID]:
+        rows = (
+            _split_vectors(vectors, len(objects)) if vectors is not None else [None] * len(objects)
+        )
+        return [
+            (
+                self._add_object(
+                    collection=collection,
+                    properties=obj.properties,
+                    references=obj.references,
+                    uuid=obj.uuid,
+                    vector=row if row is not None else obj.vector,
+                    tenant=tenant,
+                )
+                if isinstance(obj, DataObject)
+                else self._add_object(
+                    collection=collection, properties=obj, vector=row, tenant=tenant
+                )
+            )
+            for obj, row in zip(objects, rows)
+        ]
+
+    def _add_reference(
+        self,
+        from_object_uuid: UUID,
+        from_object_collection: str,
+        from_property_name: str,
+        to: ReferenceInput,
+        tenant: Optional[str] = None,
+    ) -> None:
+        self.__collections.add(from_object_collection)
+        self.__add(
+            self.__worker_for(get_valid_uuid(from_object_uuid)),
+            (
+                _ADD_REFERENCE,
+                {
+                    "from_object_uuid": from_object_uuid,
+                    "from_object_collection": from_object_collection,
+                    "from_property_name": from_property_name,
+                    "to": to,
+                    "tenant": tenant,
+                },
+            ),
+        )
+
+
+def _picklable_vector(vector: Any) -> Any:
+    # memoryviews cannot be sent to another process, their float32 data is sent as bytes like in a regular batch
+    if isinstance(vector, memoryview):
+        return vector.tobytes() if vector.format == "f" else vector.tolist()
+    if isinstance(vector, dict):
+        return {name: _picklable_vector(value) for name, value in vector.items()}
+    return vector
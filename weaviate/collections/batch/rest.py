@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from weaviate.collections.classes.batch import (
     ErrorReference,
@@ -8,11 +8,17 @@ from weaviate.collections.classes.batch import (
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import UnexpectedStatusCodeError
+from weaviate.types import BEACON
 from weaviate.util import _decode_json_response_list
 
 from weaviate.connect.v4 import _ExpectedStatusCodes
 
 
+def _source_collections(references: List[_BatchReference]) -> Set[str]:
+    """Return the collections of the objects that the references are added to."""
+    return {ref.from_[len(BEACON) :].split("/", 1)[0] for ref in references}
+
+
 class _BatchREST:
     def __init__(
         self, connection: ConnectionV4, consistency_level: Optional[ConsistencyLevel]
@@ -34,12 +40,15 @@ class _BatchREST:
             for ref in references
         ]
 
-        response = self.__connection.post(
-            path="/batch/references",
-            weaviate_object=refs,
-            params=params,
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Send ref batch"),
-        )
+        try:
+            response = self.__connection.post(
+                path="/batch/references",
+                weaviate_object=refs,
+                params=params,
+                status_codes=_ExpectedStatusCodes(ok_in=200, error="Send ref batch"),
+            )
+        finally:
+            self.__connection.invalidate_query_cache(*_source_collections(references))
 
         payload = _decode_json_response_list(response, "batch ref")
         assert payload is not None
@@ -79,9 +88,12 @@ class _BatchRESTAsync:
             for ref in references
         ]
 
-        response = await self.__connection.apost(
-            path="/batch/references", weaviate_object=refs, params=params
-        )
+        try:
+            response = await self.__connection.apost(
+                path="/batch/references", weaviate_object=refs, params=params
+            )
+        finally:
+            self.__connection.invalidate_query_cache(*_source_collections(references))
         if response.status_code == 200:
             payload = response.json()
             errors = {
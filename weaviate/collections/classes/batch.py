@@ -1,19 +1,54 @@
 import uuid as uuid_package
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, cast
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 from weaviate.collections.classes.internal import ReferenceInputs
 from weaviate.collections.classes.types import WeaviateField
+from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.types import BEACON, UUID, VECTORS
-from weaviate.util import _capitalize_first_letter, get_valid_uuid, _get_vector_v4
+from weaviate.util import (
+    _capitalize_first_letter,
+    get_valid_uuid,
+    _get_vector_bytes_v4,
+    _get_vector_rows_v4,
+    _get_vector_v4,
+)
+
+# vectors that expose float32 data through the buffer protocol (eg. numpy arrays) are kept as their raw bytes instead
+# of being converted to a list of floats
+_BatchVector = Union[List[float], bytes]
+_BatchVectors = Union[VECTORS, _BatchVector, Dict[str, _BatchVector]]
+
+
+def _to_batch_vector(vector: Any) -> _BatchVector:
+    if isinstance(vector, bytes):
+        return vector
+    vector_bytes = _get_vector_bytes_v4(vector)
+    if vector_bytes is not None:
+        return vector_bytes
+    return _get_vector_v4(vector)
+
+
+def _split_vectors(vectors: Any, num_objects: int) -> List[Any]:
+    """Split a matrix of vectors, or a dictionary of matrices for named vectors, into one entry per object."""
+    if isinstance(vectors, dict):
+        named_rows = {name: _split_vectors(matrix, num_objects) for name, matrix in vectors.items()}
+        return [{name: rows[i] for name, rows in named_rows.items()} for i in range(num_objects)]
+
+    rows = _get_vector_rows_v4(vectors)
+    if len(rows) != num_objects:
+        raise WeaviateInvalidInputError(
+            f"Got {len(rows)} vectors for {num_objects} objects, there has to be exactly one vector per object."
+        )
+    return rows
 
 
 @dataclass
 class _BatchObject:
     collection: str
-    vector: Optional[VECTORS]
+    vector: Optional[_BatchVectors]
     uuid: str
     properties: Optional[Dict[str, WeaviateField]]
     tenant: Optional[str]
@@ -34,14 +69,15 @@ class BatchObject(BaseModel):
     A Weaviate object to be added to the database.
 
     Performs validation on the class name and UUID, and automatically generates a UUID if one is not provided.
-    Also converts the vector to a list of floats if it is provided as a numpy array.
+    Also converts the vector to its float32 bytes if it is provided as a float32 numpy array, and to a list of floats
+    for all other supported types.
     """
 
     collection: str = Field(min_length=1)
     properties: Optional[Dict[str, Any]] = Field(default=None)
     references: Optional[ReferenceInputs] = Field(default=None)
     uuid: Optional[UUID] = Field(default=None)
-    vector: Optional[VECTORS] = Field(default=None)
+    vector: Optional[_BatchVectors] = Field(default=None)
     tenant: Optional[str] = Field(default=None)
 
     def __init__(self, **data: Any) -> None:
@@ -49,10 +85,10 @@ class BatchObject(BaseModel):
         if v is not None:
             if isinstance(v, dict):  # named vector
                 for key, val in v.items():
-                    v[key] = _get_vector_v4(val)
+                    v[key] = _to_batch_vector(val)
                 data["vector"] = v
             else:
-                data["vector"] = _get_vector_v4(v)
+                data["vector"] = _to_batch_vector(v)
 
         data["uuid"] = (
             get_valid_uuid(u) if (u := data.get("uuid")) is not None else uuid_package.uuid4()
@@ -62,7 +98,7 @@ class BatchObject(BaseModel):
     def _to_internal(self) -> _BatchObject:
         return _BatchObject(
             collection=self.collection,
-            vector=cast(list, self.vector),
+            vector=self.vector,
             uuid=str(self.uuid),
             properties=self.properties,
             tenant=self.tenant,
@@ -172,16 +208,23 @@ class BatchObjectReturn:
     has_errors: bool = False
 
     def __add__(self, other: "BatchObjectReturn") -> "BatchObjectReturn":
-        self.all_responses += other.all_responses
-
-        prev_max = max(self.errors.keys()) if len(self.errors) > 0 else -1
-        for k1, v1 in other.errors.items():
-            self.errors[prev_max + k1] = v1
-
-        prev_max = max(self.uuids.keys()) if len(self.uuids) > 0 else -1
-        for k1, v2 in other.uuids.items():
-            self.uuids[prev_max + k1] = v2
-
+        return self._merge(other, offset=len(self.all_responses), keep_successful=True)
+
+    def _merge(
+        self, other: "BatchObjectReturn", offset: int, keep_successful: bool
+    ) -> "BatchObjectReturn":
+        """Append the results of `other`, whose indices start at `offset`.
+
+        Without `keep_successful` only the errors of `other` are added, so the merged results do not grow with the
+        number of successfully imported objects.
+        """
+        for index, error in other.errors.items():
+            self.errors[offset + index] = error
+        if keep_successful:
+            self.all_responses += other.all_responses
+            for index, uid in other.uuids.items():
+                self.uuids[offset + index] = uid
+        self.elapsed_seconds += other.elapsed_seconds
         self.has_errors = self.has_errors or other.has_errors
         return self
 
@@ -225,11 +268,17 @@ class BatchResult:
             The results of the batch object operation.
         `refs`
             The results of the batch reference operation.
+        `num_objects`
+            The number of objects that were sent, including the failed ones.
+        `num_references`
+            The number of references that were sent, including the failed ones.
     """
 
     def __init__(self) -> None:
         self.objs: BatchObjectReturn = BatchObjectReturn([], 0.0, {}, {})
         self.refs: BatchReferenceReturn = BatchReferenceReturn(0.0, {})
+        self.num_objects = 0
+        self.num_references = 0
 
 
 @dataclass
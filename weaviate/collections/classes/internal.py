@@ -1,8 +1,9 @@
 import datetime
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     List,
@@ -52,8 +53,12 @@ from weaviate.types import INCLUDE_VECTOR, UUID, UUIDS
 
 from weaviate.proto.v1 import search_get_pb2
 
+# the classes of the objects returned by queries have no instance dict, which makes them smaller and faster to create.
+# Dataclasses support slots from Python 3.10 on, on older versions they keep their instance dict.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class MetadataReturn:
     """Metadata of an object returned by a query."""
 
@@ -81,14 +86,14 @@ class MetadataReturn:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GroupByMetadataReturn:
     """Metadata of an object returned by a group by query."""
 
     distance: Optional[float] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class _Object(Generic[P, R, M]):
     uuid: uuid_package.UUID
     metadata: M
@@ -98,14 +103,51 @@ class _Object(Generic[P, R, M]):
     collection: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Object(Generic[P, R], _Object[P, R, MetadataReturn]):
     """A single Weaviate object returned by a query within the `.query` namespace of a collection."""
 
     pass
 
 
-@dataclass
+class _LazyObject(Generic[P, R], Object[P, R]):
+    """An `Object` that decodes its fields from the gRPC search result only when they are first accessed.
+
+    Decoded fields are stored in the slots of the instance, so every field is decoded at most once. The object keeps a
+    reference to the search result until it is garbage collected. Its `__class__` is `Object`, so that copies and
+    `dataclasses.replace` create plain `Object`s with all fields decoded, only `type()` returns this class.
+    """
+
+    __slots__ = ("__loader",)
+
+    def __init__(self, loader: Callable[[str], Any]) -> None:
+        self.__loader = loader
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> Type[Object[Any, Any]]:  # type: ignore[override]
+        return Object
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for fields that have not been decoded yet, decoded fields are found in their slots
+        if name not in _OBJECT_FIELDS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self.__loader(name)
+        setattr(self, name, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not Object and type(other) is not _LazyObject:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _OBJECT_FIELDS)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Object, tuple(getattr(self, name) for name in _OBJECT_FIELDS))
+
+
+_OBJECT_FIELDS = tuple(f.name for f in fields(Object))
+
+
+@dataclass(**_SLOTS)
 class MetadataSingleObjectReturn:
     """Metadata of an object returned by the `fetch_object_by_id` query."""
 
@@ -114,21 +156,21 @@ class MetadataSingleObjectReturn:
     is_consistent: Optional[bool]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ObjectSingleReturn(Generic[P, R], _Object[P, R, MetadataSingleObjectReturn]):
     """A single Weaviate object returned by the `fetch_object_by_id` query."""
 
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GroupByObject(Generic[P, R], _Object[P, R, GroupByMetadataReturn]):
     """A single Weaviate object returned by a query with the `group_by` argument specified."""
 
     belongs_to_group: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GenerativeObject(Generic[P, R], Object[P, R]):
     """A single Weaviate object returned by a query within the `generate` namespace of a collection."""
 
@@ -184,6 +226,22 @@ class QueryReturn(Generic[P, R]):
     """The return type of a query within the `.query` namespace of a collection."""
 
     objects: List[Object[P, R]]
+    vectors: Dict[str, Any] = field(default_factory=dict)
+    """The vectors of all objects stacked into one `(n, d)` float32 `numpy.ndarray` per vector name.
+
+    Only populated if the collection was obtained with `.with_vector_format("numpy")` and every returned object has a
+    vector of the same dimensionality under that name. The vectors of the individual objects are rows of these matrices.
+    """
+
+
+@dataclass
+class TenantsQueryReturn(Generic[P, R]):
+    """The return type of a query of several tenants with `.query.across_tenants` of a collection."""
+
+    objects: List[Object[P, R]]
+    """The best objects of all tenants together, ordered by their distance or score."""
+    tenants: List[str]
+    """The tenant of every object in `objects`."""
 
 
 _GQLEntryReturnType: TypeAlias = Dict[str, List[Dict[str, Any]]]
@@ -582,3 +640,6 @@ QueryNearMediaReturnType = Union[
     QueryReturnType[Properties, References, TProperties, TReferences],
     GroupByReturnType[Properties, References, TProperties, TReferences],
 ]
+
+# results that are returned with `return_format="arrow"` are a `pyarrow.Table`, pyarrow is an optional dependency
+_ArrowTable: TypeAlias = Any
@@ -1,7 +1,22 @@
 import json
+import threading
 import uuid as uuid_package
+from collections import OrderedDict
 from dataclasses import asdict
-from typing import Generic, Literal, Optional, Type, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 from weaviate.collections.aggregate import _AggregateCollection
 from weaviate.collections.backups import _CollectionBackup
@@ -20,14 +35,64 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import Properties, TProperties
-from weaviate.collections.config import _ConfigCollection
+from weaviate.collections.config import _ConfigCollection, _get_schema_properties
 from weaviate.collections.data import _DataCollection
-from weaviate.collections.iterator import _ObjectIterator
+from weaviate.collections.iterator import ITERATOR_CACHE_SIZE, _ObjectIterator, _ScanIterator
 from weaviate.collections.query import _GenerateCollection, _QueryCollection
 from weaviate.collections.tenants import _Tenants
 from weaviate.connect import ConnectionV4
-from weaviate.types import UUID
-from weaviate.validator import _validate_input, _ValidateArgument
+from weaviate.types import UUID, VECTOR_FORMAT
+from weaviate.util import _import_numpy
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.validator import _validate_input, _validate_positive_int, _ValidateArgument
+
+# the number of tenant, consistency level and vector format combinations whose namespaces are kept per collection
+HANDLE_CACHE_SIZE = 1024
+
+_HandleKey = Tuple[Optional[str], Optional[ConsistencyLevel], str]
+_N = TypeVar("_N")
+
+
+class _Namespaces:
+    """Namespaces that are created on first access, at most once even if they are first accessed concurrently."""
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__namespaces: Dict[str, Any] = {}
+
+    def get(self, name: str, create: Callable[[], _N]) -> _N:
+        namespace = self.__namespaces.get(name)
+        if namespace is None:
+            with self.__lock:
+                namespace = self.__namespaces.get(name)
+                if namespace is None:
+                    namespace = self.__namespaces[name] = create()
+        return cast(_N, namespace)
+
+
+class _CollectionHandles:
+    """The stateless namespaces of the collection objects derived by `with_tenant` and the other `with_` methods.
+
+    They are kept by tenant, consistency level and vector format and are shared by all objects derived from the same collection object. The namespaces of the least recently used
+    keys are dropped once there are more than `HANDLE_CACHE_SIZE`. Namespaces with state, like `batch`, are not shared
+    and belong to a single collection object.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__namespaces: "OrderedDict[_HandleKey, _Namespaces]" = OrderedDict()
+
+    def get(self, key: _HandleKey) -> _Namespaces:
+        """Return the namespaces of `key`."""
+        with self.__lock:
+            namespaces = self.__namespaces.get(key)
+            if namespaces is not None:
+                self.__namespaces.move_to_end(key)
+                return namespaces
+            namespaces = self.__namespaces[key] = _Namespaces()
+            if len(self.__namespaces) > HANDLE_CACHE_SIZE:
+                self.__namespaces.popitem(last=False)
+            return namespaces
 
 
 class Collection(_CollectionBase, Generic[Properties, References]):
@@ -67,53 +132,127 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         tenant: Optional[str] = None,
         properties: Optional[Type[Properties]] = None,
         references: Optional[Type[References]] = None,
+        vector_format: VECTOR_FORMAT = "list",
+        handles: Optional["_CollectionHandles"] = None,
     ) -> None:
         super().__init__(connection, name, validate_arguments)
 
-        self.aggregate = _AggregateCollection(
-            self._connection, self.name, consistency_level, tenant
-        )
+        self.__tenant = tenant
+        self.__consistency_level = consistency_level
+        self.__properties = properties
+        self.__references = references
+        self.__vector_format: VECTOR_FORMAT = vector_format
+        self.__handles = handles if handles is not None else _CollectionHandles()
+        self.__shared = self.__handles.get((tenant, consistency_level, vector_format))
+        self.__own = _Namespaces()
+
+    # The namespaces are created on first access, so that handles that are only used for a few calls, eg. one per
+    # tenant and request, do not create the namespaces they do not use. The stateless namespaces are shared with the
+    # other collection objects of the same tenant, consistency level and vector format.
+
+    @property
+    def aggregate(self) -> _AggregateCollection:
         """This namespace includes all the querying methods available to you when using Weaviate's standard aggregation capabilities."""
-        self.batch = _BatchCollectionWrapper[Properties](
-            connection, consistency_level, self.name, tenant
+        return self.__shared.get(
+            "aggregate",
+            lambda: _AggregateCollection(
+                self._connection, self.name, self.__consistency_level, self.__tenant
+            ),
         )
+
+    @property
+    def batch(self) -> _BatchCollectionWrapper[Properties]:
         """This namespace contains all the functionality to upload data in batches to Weaviate for this specific collection."""
-        self.config = _ConfigCollection(self._connection, self.name, tenant)
+        return self.__own.get(
+            "batch",
+            lambda: _BatchCollectionWrapper[Properties](
+                self._connection, self.__consistency_level, self.name, self.__tenant
+            ),
+        )
+
+    @property
+    def config(self) -> _ConfigCollection:
         """This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate."""
-        self.data = _DataCollection[Properties](
-            connection, self.name, consistency_level, tenant, validate_arguments, properties
+        return self.__shared.get(
+            "config", lambda: _ConfigCollection(self._connection, self.name, self.__tenant)
         )
+
+    @property
+    def data(self) -> _DataCollection[Properties]:
         """This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate."""
-        self.generate = _GenerateCollection(
-            connection,
-            self.name,
-            consistency_level,
-            tenant,
-            properties,
-            references,
-            validate_arguments,
+        return self.__shared.get(
+            "data",
+            lambda: _DataCollection[Properties](
+                self._connection,
+                self.name,
+                self.__consistency_level,
+                self.__tenant,
+                self._validate_arguments,
+                self.__properties,
+            ),
         )
+
+    @property
+    def generate(self) -> _GenerateCollection[Properties, References]:
         """This namespace includes all the querying methods available to you when using Weaviate's generative capabilities."""
-        self.query = _QueryCollection[Properties, References](
-            connection,
-            self.name,
-            consistency_level,
-            tenant,
-            properties,
-            references,
-            validate_arguments,
+        return self.__shared.get(
+            "generate",
+            lambda: _GenerateCollection(
+                self._connection,
+                self.name,
+                self.__consistency_level,
+                self.__tenant,
+                self.__properties,
+                self.__references,
+                self._validate_arguments,
+                self.__vector_format,
+            ),
         )
+
+    @property
+    def query(self) -> _QueryCollection[Properties, References]:
         """This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities."""
-        self.tenants = _Tenants(connection, self.name)
+        return self.__shared.get(
+            "query",
+            lambda: _QueryCollection[Properties, References](
+                self._connection,
+                self.name,
+                self.__consistency_level,
+                self.__tenant,
+                self.__properties,
+                self.__references,
+                self._validate_arguments,
+                self.__vector_format,
+            ),
+        )
+
+    @property
+    def tenants(self) -> _Tenants:
         """This namespace includes all the CRUD methods available to you when modifying the tenants of a multi-tenancy-enabled collection in Weaviate."""
+        return self.__shared.get("tenants", lambda: _Tenants(self._connection, self.name))
 
-        self.backup = _CollectionBackup(connection, self.name)
+    @property
+    def backup(self) -> _CollectionBackup:
         """This namespace includes all the backup methods available to you when backing up a collection in Weaviate."""
+        return self.__shared.get("backup", lambda: _CollectionBackup(self._connection, self.name))
 
-        self.__tenant = tenant
-        self.__consistency_level = consistency_level
-        self.__properties = properties
-        self.__references = references
+    def __handle(
+        self,
+        tenant: Optional[str],
+        consistency_level: Optional[ConsistencyLevel],
+        vector_format: VECTOR_FORMAT,
+    ) -> "Collection[Properties, References]":
+        return Collection[Properties, References](
+            self._connection,
+            self.name,
+            self._validate_arguments,
+            consistency_level,
+            tenant,
+            self.__properties,
+            self.__references,
+            vector_format,
+            self.__handles,
+        )
 
     def with_tenant(
         self, tenant: Optional[Union[str, Tenant]] = None
@@ -123,7 +262,8 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         If multi-tenancy is not configured for this collection then Weaviate will throw an error.
 
         This method does not send a request to Weaviate. It only returns a new collection object that is specific
-        to the tenant you specify.
+        to the tenant you specify. The namespaces of recently used tenants are cached, except for `batch`, so the
+        objects of the same tenant share their `query`, `data` and other stateless namespaces.
 
         Arguments:
             `tenant`
@@ -132,14 +272,10 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         _validate_input(
             [_ValidateArgument(expected=[str, Tenant, None], name="tenant", value=tenant)]
         )
-        return Collection[Properties, References](
-            self._connection,
-            self.name,
-            self._validate_arguments,
-            self.__consistency_level,
+        return self.__handle(
             tenant.name if isinstance(tenant, Tenant) else tenant,
-            self.__properties,
-            self.__references,
+            self.__consistency_level,
+            self.__vector_format,
         )
 
     def with_consistency_level(
@@ -166,15 +302,39 @@ class Collection(_CollectionBase, Generic[Properties, References]):
                     )
                 ]
             )
-        return Collection[Properties, References](
-            self._connection,
-            self.name,
-            self._validate_arguments,
-            consistency_level,
-            self.__tenant,
-            self.__properties,
-            self.__references,
-        )
+        return self.__handle(self.__tenant, consistency_level, self.__vector_format)
+
+    def with_vector_format(
+        self, vector_format: VECTOR_FORMAT = "list"
+    ) -> "Collection[Properties, References]":
+        """Use this method to return a collection object that returns the vectors of query results in a specific format.
+
+        With `"numpy"` the vectors of the objects returned by the `query` and `generate` namespaces are read-only float32
+        `numpy.ndarray` views of the received bytes instead of lists of floats. In addition, `QueryReturn.vectors`
+        contains the vectors of all returned objects stacked into one `(n, d)` matrix per vector name. This avoids
+        creating a Python float for every dimension of every vector, which dominates the time of queries returning many
+        vectors.
+
+        This method does not send a request to Weaviate. It only returns a new collection object that returns vectors
+        in the format you specify.
+
+        Arguments:
+            `vector_format`
+                The format of the returned vectors, either `"list"` (the default) or `"numpy"`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the format is not supported.
+            `ImportError`:
+                If the format is `"numpy"` and numpy is not installed.
+        """
+        if vector_format not in ("list", "numpy"):
+            raise WeaviateInvalidInputError(
+                f'vector_format must be either "list" or "numpy", got {vector_format}'
+            )
+        if vector_format == "numpy":
+            _import_numpy()
+        return self.__handle(self.__tenant, self.__consistency_level, vector_format)
 
     def __len__(self) -> int:
         total = self.aggregate.over_all(total_count=True).total_count
@@ -195,6 +355,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> _ObjectIterator[Properties, References]:
         ...
 
@@ -207,6 +368,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> _ObjectIterator[Properties, CrossReferences]:
         ...
 
@@ -219,6 +381,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> _ObjectIterator[Properties, TReferences]:
         ...
 
@@ -231,6 +394,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> _ObjectIterator[TProperties, References]:
         ...
 
@@ -243,6 +407,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> _ObjectIterator[TProperties, CrossReferences]:
         ...
 
@@ -255,6 +420,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> _ObjectIterator[TProperties, TReferences]:
         ...
 
@@ -267,6 +433,7 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
         after: Optional[UUID] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
     ) -> Union[
         _ObjectIterator[Properties, References],
         _ObjectIterator[Properties, CrossReferences],
@@ -278,13 +445,16 @@ class Collection(_CollectionBase, Generic[Properties, References]):
         """Use this method to return an iterator over the objects in the collection.
 
         This iterator keeps a record of the last object that it returned to be used in each subsequent call to
-        Weaviate. Once the collection is exhausted, the iterator exits.
+        Weaviate. Once the collection is exhausted, the iterator exits. Objects are fetched in pages of `page_size`
+        objects and the next page is requested in the background while the current one is consumed.
 
         If `return_properties` is not provided, all the properties of each object will be
         requested from Weaviate except for its vector as this is an expensive operation. Specify `include_vector`
         to request the vector back as well. In addition, if `return_references=None` then none of the references
         are returned. Use `wvc.QueryReference` to specify which references to return.
 
+        Use `to_arrow_batches()` of the iterator to receive the pages as `pyarrow.RecordBatch`es instead of objects.
+
         Arguments:
             `include_vector`
                 Whether to include the vector in the metadata of the returned objects.
@@ -296,11 +466,16 @@ class Collection(_CollectionBase, Generic[Properties, References]):
                 The references to return with each object.
             `after`
                 The cursor to use to mark the initial starting point of the iterator in the collection.
+            `page_size`
+                The number of objects to fetch from Weaviate per request.
 
         Raises:
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `page_size` is not a positive integer.
         """
+        _validate_positive_int(page_size, "page_size")
         return _ObjectIterator(  # type: ignore
             lambda limit, after: self.query.fetch_objects(  # pyright: ignore # problems with invariance of list
                 limit=limit,
@@ -313,4 +488,163 @@ class Collection(_CollectionBase, Generic[Properties, References]):
             after
             if after is None or isinstance(after, uuid_package.UUID)
             else uuid_package.UUID(after),
+            page_size,
+            lambda: self.__arrow_query(
+                include_vector, return_metadata, return_properties, return_references
+            ),
+        )
+
+    def __arrow_query(
+        self,
+        include_vector: bool,
+        return_metadata: Optional[METADATA],
+        return_properties: Optional[ReturnProperties[TProperties]],
+        return_references: Optional[ReturnReferences[TReferences]],
+    ) -> Callable[[int, Optional[uuid_package.UUID]], Any]:
+        """Return the query of the Arrow pages of an iterator, which types their columns by the current schema."""
+        query = self.query._with_arrow_schema(_get_schema_properties(self._connection, self.name))
+        return lambda limit, after: query.fetch_objects(  # type: ignore # references are rejected at runtime
+            limit=limit,
+            after=after,
+            include_vector=include_vector,
+            return_format="arrow",
+            return_metadata=return_metadata,
+            return_properties=return_properties,
+            return_references=return_references,
+        )
+
+    @overload
+    def scan(
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> _ScanIterator[Properties, References]:
+        ...
+
+    @overload
+    def scan(
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: REFERENCES,
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> _ScanIterator[Properties, CrossReferences]:
+        ...
+
+    @overload
+    def scan(
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Type[TReferences],
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> _ScanIterator[Properties, TReferences]:
+        ...
+
+    @overload
+    def scan(
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> _ScanIterator[TProperties, References]:
+        ...
+
+    @overload
+    def scan(
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> _ScanIterator[TProperties, CrossReferences]:
+        ...
+
+    @overload
+    def scan(
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        *,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> _ScanIterator[TProperties, TReferences]:
+        ...
+
+    def scan(  # type: ignore
+        self,
+        parallelism: int = 4,
+        include_vector: bool = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> Union[
+        _ScanIterator[Properties, References],
+        _ScanIterator[Properties, CrossReferences],
+        _ScanIterator[Properties, TReferences],
+        _ScanIterator[TProperties, References],
+        _ScanIterator[TProperties, CrossReferences],
+        _ScanIterator[TProperties, TReferences],
+    ]:
+        """Use this method to read all objects of the collection with several concurrent cursors.
+
+        The uuid keyspace is split into `parallelism` disjoint ranges and each range is read with its own cursor, like
+        the one used by `iterator`. The ranges are fetched concurrently and their objects are returned as one stream
+        in the order in which the pages arrive, not ordered by uuid. The ranges are of equal size, so the work is
+        only evenly spread if the uuids are uniformly distributed, which is the case for random and generated uuids.
+
+        Arguments:
+            `parallelism`
+                The number of ranges that are read concurrently.
+            `include_vector`
+                Whether to include the vector in the metadata of the returned objects.
+            `return_metadata`
+                The metadata to return with each object.
+            `return_properties`
+                The properties to return with each object.
+            `return_references`
+                The references to return with each object.
+            `page_size`
+                The number of objects to fetch from Weaviate per request.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCQueryError`:
+                If the request to the Weaviate server fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `parallelism` or `page_size` is not a positive integer.
+        """
+        _validate_positive_int(parallelism, "parallelism")
+        _validate_positive_int(page_size, "page_size")
+        return _ScanIterator(  # type: ignore
+            lambda limit, after: self.query.fetch_objects(  # pyright: ignore # problems with invariance of list
+                limit=limit,
+                after=after,
+                include_vector=include_vector,
+                return_metadata=return_metadata,
+                return_properties=return_properties,
+                return_references=return_references,
+            ).objects,
+            parallelism,
+            page_size,
         )
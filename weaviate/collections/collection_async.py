@@ -0,0 +1,271 @@
+import asyncio
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from weaviate.collections.aggregate import _AggregateCollection
+from weaviate.collections.backups import _CollectionBackup
+from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.internal import QueryReturn, References, TenantsQueryReturn
+from weaviate.collections.classes.tenants import Tenant
+from weaviate.collections.classes.types import Properties, TProperties
+from weaviate.collections.collection import Collection, _Namespaces
+from weaviate.collections.collections import _Collections
+from weaviate.collections.config import _ConfigCollection
+from weaviate.collections.data import _DataCollection
+from weaviate.collections.queries.tenants import _merge_tenant_results, _tenant_names
+from weaviate.collections.query import _GenerateCollection, _QueryCollection
+from weaviate.collections.tenants import _Tenants
+from weaviate.connect.v4 import _async_requests
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.types import VECTOR_FORMAT
+from weaviate.validator import _validate_positive_int
+
+
+def _public_methods(cls: type, exclude: FrozenSet[str] = frozenset()) -> FrozenSet[str]:
+    return frozenset(
+        name
+        for name in dir(cls)
+        if not name.startswith("_") and callable(getattr(cls, name)) and name not in exclude
+    )
+
+
+_AGGREGATE_METHODS = _public_methods(_AggregateCollection)
+_BACKUP_METHODS = _public_methods(_CollectionBackup)
+_CONFIG_METHODS = _public_methods(_ConfigCollection)
+_DATA_METHODS = _public_methods(_DataCollection, exclude=frozenset(["with_data_model"]))
+_GENERATE_METHODS = _public_methods(_GenerateCollection)
+_QUERY_METHODS = _public_methods(
+    _QueryCollection, exclude=frozenset(["across_tenants", "many", "prepare"])
+)
+_TENANTS_METHODS = _public_methods(_Tenants)
+
+
+class _AsyncNamespace:
+    """Exposes the public methods of a synchronous namespace as coroutines.
+
+    Calling one of the `native` methods validates its arguments and builds its requests exactly like the synchronous
+    method, without blocking. The returned coroutine sends the requests over the async clients of the connection and
+    decodes their responses. The other methods are run in the default executor of the running event loop, so they do
+    not block it.
+    """
+
+    def __init__(self, namespace: Any, methods: FrozenSet[str], native: FrozenSet[str]) -> None:
+        self.__namespace = namespace
+        self.__methods = methods
+        self.__native = native
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        if name not in self.__methods:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        method = getattr(self.__namespace, name)
+
+        if name in self.__native:
+
+            async def run(*args: Any, **kwargs: Any) -> Any:
+                token = _async_requests.set(True)
+                try:
+                    sending = method(*args, **kwargs)
+                finally:
+                    _async_requests.reset(token)
+                return await sending
+
+            return run
+
+        async def run_in_executor(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, partial(method, *args, **kwargs)
+            )
+
+        return run_in_executor
+
+    def __dir__(self) -> Any:
+        return sorted(self.__methods)
+
+
+class _AsyncDataNamespace(_AsyncNamespace):
+    """The async `data` namespace."""
+
+    def __init__(self, namespace: _DataCollection[Any]) -> None:
+        super().__init__(namespace, _DATA_METHODS, _DATA_METHODS - {"import_from"})
+        self.__data = namespace
+
+    def with_data_model(self, data_model: Type[TProperties]) -> "_AsyncDataNamespace":
+        """Return the namespace with another data model, see `_DataCollection.with_data_model`."""
+        return _AsyncDataNamespace(self.__data.with_data_model(data_model))
+
+
+class _AsyncQueryCollectionNamespace(_AsyncNamespace):
+    """The async `query` namespace, which can also query several tenants concurrently."""
+
+    def __init__(self, namespace: _QueryCollection[Any, Any]) -> None:
+        super().__init__(namespace, _QUERY_METHODS, _QUERY_METHODS)
+        self.__query = namespace
+
+    async def across_tenants(
+        self,
+        tenants: Sequence[Union[str, Tenant]],
+        query: Callable[["_AsyncQueryCollectionNamespace"], Awaitable[QueryReturn[Any, Any]]],
+        *,
+        limit: int,
+        concurrency: int = 16,
+    ) -> TenantsQueryReturn[Any, Any]:
+        """Run the same query on several tenants concurrently and merge their best objects, see `_QueryCollection.across_tenants`.
+
+        The query is a function that receives this namespace for one tenant and returns the awaitable of a single
+        search, e.g. `lambda q: q.near_vector(vector, limit=10, return_metadata=MetadataQuery(distance=True))`. The
+        searches are sent over the async gRPC channel.
+        """
+        names = _tenant_names(tenants)
+        _validate_positive_int(limit, "limit")
+        _validate_positive_int(concurrency, "concurrency")
+        semaphore = asyncio.Semaphore(concurrency)
+        searches: List[List[search_get_pb2.SearchRequest]] = [[] for _ in names]
+
+        async def run(
+            name: str, tenant_searches: List[search_get_pb2.SearchRequest]
+        ) -> QueryReturn[Any, Any]:
+            async with semaphore:
+                namespace = self.__query._with_tenant(name, tenant_searches.append)
+                return await query(_AsyncQueryCollectionNamespace(namespace))
+
+        results = await asyncio.gather(
+            *(run(name, tenant_searches) for name, tenant_searches in zip(names, searches))
+        )
+        return _merge_tenant_results(names, results, limit, searches)
+
+
+class _CollectionAsync(Generic[Properties, References]):
+    """The asyncio counterpart of `Collection`, returned by `WeaviateAsyncClient.collections`.
+
+    The methods of the `query`, `generate`, `aggregate` and `data` namespaces send their requests over the async HTTP
+    client and gRPC channel of the client, except `data.import_from`, which reads its source in between. The methods of
+    the `config`, `tenants` and `backup` namespaces, and `data.import_from`, are coroutines that still run the
+    corresponding method of `Collection` in the default executor of the event loop.
+    """
+
+    def __init__(self, collection: Collection[Properties, References]) -> None:
+        self.__collection = collection
+        self.name = collection.name
+        # like the namespaces of `Collection`, the namespaces are created once on first access
+        self.__namespaces = _Namespaces()
+
+    @property
+    def aggregate(self) -> _AsyncNamespace:
+        """This namespace includes all the querying methods available to you when using Weaviate's standard aggregation capabilities."""
+        return self.__namespaces.get(
+            "aggregate",
+            lambda: _AsyncNamespace(
+                self.__collection.aggregate, _AGGREGATE_METHODS, _AGGREGATE_METHODS
+            ),
+        )
+
+    @property
+    def backup(self) -> _AsyncNamespace:
+        """This namespace includes all the backup methods available to you when backing up a collection in Weaviate."""
+        return self.__namespaces.get(
+            "backup",
+            lambda: _AsyncNamespace(self.__collection.backup, _BACKUP_METHODS, frozenset()),
+        )
+
+    @property
+    def config(self) -> _AsyncNamespace:
+        """This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate."""
+        return self.__namespaces.get(
+            "config",
+            lambda: _AsyncNamespace(self.__collection.config, _CONFIG_METHODS, frozenset()),
+        )
+
+    @property
+    def data(self) -> _AsyncDataNamespace:
+        """This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate."""
+        return self.__namespaces.get("data", lambda: _AsyncDataNamespace(self.__collection.data))
+
+    @property
+    def generate(self) -> _AsyncNamespace:
+        """This namespace includes all the querying methods available to you when using Weaviate's generative capabilities."""
+        return self.__namespaces.get(
+            "generate",
+            lambda: _AsyncNamespace(
+                self.__collection.generate, _GENERATE_METHODS, _GENERATE_METHODS
+            ),
+        )
+
+    @property
+    def query(self) -> _AsyncQueryCollectionNamespace:
+        """This namespace includes all the querying methods available to you when using Weaviate's standard query capabilities."""
+        return self.__namespaces.get(
+            "query", lambda: _AsyncQueryCollectionNamespace(self.__collection.query)
+        )
+
+    @property
+    def tenants(self) -> _AsyncNamespace:
+        """This namespace includes all the CRUD methods available to you when modifying the tenants of a multi-tenancy-enabled collection in Weaviate."""
+        return self.__namespaces.get(
+            "tenants",
+            lambda: _AsyncNamespace(self.__collection.tenants, _TENANTS_METHODS, frozenset()),
+        )
+
+    def with_tenant(
+        self, tenant: Optional[Union[str, Tenant]] = None
+    ) -> "_CollectionAsync[Properties, References]":
+        """Use this method to return a collection object specific to a single tenant, see `Collection.with_tenant`."""
+        return _CollectionAsync(self.__collection.with_tenant(tenant))
+
+    def with_consistency_level(
+        self, consistency_level: Optional[ConsistencyLevel] = None
+    ) -> "_CollectionAsync[Properties, References]":
+        """Use this method to return a collection object specific to a consistency level, see `Collection.with_consistency_level`."""
+        return _CollectionAsync(self.__collection.with_consistency_level(consistency_level))
+
+    def with_vector_format(
+        self, vector_format: VECTOR_FORMAT = "list"
+    ) -> "_CollectionAsync[Properties, References]":
+        """Use this method to return a collection object with a specific vector format, see `Collection.with_vector_format`."""
+        return _CollectionAsync(self.__collection.with_vector_format(vector_format))
+
+
+class _CollectionsAsync(_AsyncNamespace):
+    """The asyncio counterpart of the `collections` namespace of `WeaviateClient`."""
+
+    def __init__(self, collections: _Collections) -> None:
+        super().__init__(collections, _public_methods(_Collections), frozenset())
+        self.__collections = collections
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        method = super().__getattr__(name)
+
+        async def run(*args: Any, **kwargs: Any) -> Any:
+            result = await method(*args, **kwargs)
+            # create, create_from_dict and create_from_config return the created collection
+            return _CollectionAsync(result) if isinstance(result, Collection) else result
+
+        return run
+
+    def get(
+        self,
+        name: str,
+        data_model_properties: Optional[Type[Properties]] = None,
+        data_model_references: Optional[Type[References]] = None,
+        skip_argument_validation: bool = False,
+    ) -> _CollectionAsync[Properties, References]:
+        """Use this method to return a collection object to be used when interacting with your Weaviate collection.
+
+        This method does not send a request to Weaviate, see `client.collections.get` for the arguments.
+        """
+        return _CollectionAsync(
+            self.__collections.get(
+                name, data_model_properties, data_model_references, skip_argument_validation
+            )
+        )
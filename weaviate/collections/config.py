@@ -28,6 +28,7 @@ from weaviate.collections.classes.config_methods import (
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import (
+    WeaviateBaseError,
     WeaviateInvalidInputError,
 )
 from weaviate.util import _decode_json_response_dict, _decode_json_response_list
@@ -36,6 +37,33 @@ from weaviate.warnings import _Warnings
 from weaviate.connect.v4 import _ExpectedStatusCodes
 
 
+def _schema_request(name: str) -> Dict[str, Any]:
+    """Return the arguments of the request of the schema of collection `name`."""
+    return {
+        "path": f"/schema/{name}",
+        "error_msg": "Collection configuration could not be retrieved.",
+        "status_codes": _ExpectedStatusCodes(ok_in=200, error="Get collection configuration"),
+    }
+
+
+def _get_schema_properties(connection: ConnectionV4, name: str) -> Optional[List[_Property]]:
+    """Return the properties of collection `name`, or `None` if its schema does not exist or cannot be retrieved."""
+    try:
+        return _ConfigBase(connection, name, None).get(simple=True).properties
+    except (WeaviateBaseError, ValueError):
+        # ValueError if the schema has a data type that this client does not know
+        return None
+
+
+async def _aget_schema_properties(connection: ConnectionV4, name: str) -> Optional[List[_Property]]:
+    """Return the properties of collection `name` like `_get_schema_properties`, over the async client."""
+    try:
+        response = await connection.arequest("GET", **_schema_request(name))
+        return _collection_config_simple_from_json(response.json()).properties
+    except (WeaviateBaseError, ValueError):
+        return None
+
+
 class _ConfigBase:
     def __init__(self, connection: ConnectionV4, name: str, tenant: Optional[str]) -> None:
         self.__connection = connection
@@ -43,11 +71,7 @@ class _ConfigBase:
         self.__tenant = tenant
 
     def __get(self) -> Dict[str, Any]:
-        response = self.__connection.get(
-            path=f"/schema/{self._name}",
-            error_msg="Collection configuration could not be retrieved.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="Get collection configuration"),
-        )
+        response = self.__connection.get(**_schema_request(self._name))
         return cast(Dict[str, Any], response.json())
 
     @overload
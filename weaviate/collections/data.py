@@ -1,9 +1,14 @@
 import datetime
 import uuid as uuid_package
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import (
+    Callable,
     Dict,
     Any,
+    Iterator,
     Literal,
+    NamedTuple,
     Optional,
     List,
     Mapping,
@@ -11,14 +16,18 @@ from typing import (
     Sequence,
     Generic,
     Type,
+    TypeVar,
     Union,
     cast,
     overload,
 )
 
+from httpx import Response
+
+from weaviate.collections.batch.columns import _ColumnMapping, _ColumnSource, _read_chunks
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
 from weaviate.collections.batch.grpc_batch_objects import _BatchGRPC
-from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.batch.rest import _BatchREST, _BatchRESTAsync
 from weaviate.collections.classes.batch import (
     DeleteManyObject,
     _BatchObject,
@@ -26,6 +35,7 @@ from weaviate.collections.classes.batch import (
     _BatchReference,
     BatchReferenceReturn,
     DeleteManyReturn,
+    _split_vectors,
 )
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.data import DataObject, DataReferences
@@ -47,7 +57,8 @@ from weaviate.collections.classes.types import (
     _check_properties_generic,
 )
 from weaviate.connect import ConnectionV4
-from weaviate.connect.v4 import _ExpectedStatusCodes
+from weaviate.connect.base import JSONPayload
+from weaviate.connect.v4 import _ExpectedStatusCodes, _async_requests
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.types import BEACON, UUID, VECTORS
 from weaviate.util import (
@@ -56,6 +67,21 @@ from weaviate.util import (
 )
 from weaviate.validator import _validate_input, _ValidateArgument
 
+_T = TypeVar("_T")
+
+
+class _Request(NamedTuple):
+    method: Literal["DELETE", "HEAD", "PATCH", "POST", "PUT"]
+    path: str
+    params: Dict[str, Any]
+    error_msg: str
+    status_codes: _ExpectedStatusCodes
+    weaviate_object: Optional[JSONPayload] = None
+
+
+def _no_result(responses: List[Response]) -> None:
+    return None
+
 
 class _Data:
     def __init__(
@@ -74,31 +100,42 @@ class _Data:
         self._batch_grpc = _BatchGRPC(connection, consistency_level)
         self._batch_delete_grpc = _BatchDeleteGRPC(connection, consistency_level)
         self._batch_rest = _BatchREST(connection, consistency_level)
+        self._batch_rest_async = _BatchRESTAsync(connection, consistency_level)
 
     def _insert(self, weaviate_obj: Dict[str, Any]) -> uuid_package.UUID:
         path = "/objects"
 
         params, weaviate_obj = self.__apply_context_to_params_and_object({}, weaviate_obj)
-        self._connection.post(
-            path=path,
-            weaviate_object=weaviate_obj,
-            params=params,
-            error_msg="Object was not added",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="insert object"),
+        return self._send(
+            [
+                _Request(
+                    "POST",
+                    path=path,
+                    weaviate_object=weaviate_obj,
+                    params=params,
+                    error_msg="Object was not added",
+                    status_codes=_ExpectedStatusCodes(ok_in=200, error="insert object"),
+                )
+            ],
+            lambda _: uuid_package.UUID(weaviate_obj["id"]),
         )
-        return uuid_package.UUID(weaviate_obj["id"])
 
     def _exists(self, uuid: str) -> bool:
         path = "/objects/" + self.name + "/" + uuid
 
         params = self.__apply_context({})
-        request = self._connection.head(
-            path=path,
-            params=params,
-            error_msg="object existence",
-            status_codes=_ExpectedStatusCodes(ok_in=[204, 404], error="object existence"),
+        return self._send(
+            [
+                _Request(
+                    "HEAD",
+                    path=path,
+                    params=params,
+                    error_msg="object existence",
+                    status_codes=_ExpectedStatusCodes(ok_in=[204, 404], error="object existence"),
+                )
+            ],
+            lambda responses: responses[0].status_code == 204,
         )
-        return request.status_code == 204
 
     def delete_by_id(self, uuid: UUID) -> bool:
         """Delete an object from the collection based on its UUID.
@@ -109,17 +146,25 @@ class _Data:
         """
         path = f"/objects/{self.name}/{uuid}"
 
-        response = self._connection.delete(
-            path=path,
-            params=self.__apply_context({}),
-            error_msg="Object could not be deleted.",
-            status_codes=_ExpectedStatusCodes(ok_in=[204, 404], error="delete object"),
+        def deleted(responses: List[Response]) -> bool:
+            if responses[0].status_code == 204:
+                return True  # Successfully deleted
+            else:
+                assert responses[0].status_code == 404
+                return False  # did not exist
+
+        return self._send(
+            [
+                _Request(
+                    "DELETE",
+                    path=path,
+                    params=self.__apply_context({}),
+                    error_msg="Object could not be deleted.",
+                    status_codes=_ExpectedStatusCodes(ok_in=[204, 404], error="delete object"),
+                )
+            ],
+            deleted,
         )
-        if response.status_code == 204:
-            return True  # Successfully deleted
-        else:
-            assert response.status_code == 404
-            return False  # did not exist
 
     @overload
     def delete_many(
@@ -159,6 +204,13 @@ class _Data:
                 If Weaviate reports a non-OK status.
         """
         _ValidateArgument(expected=[_Filters], name="where", value=where)
+        if _async_requests.get():
+            return cast(
+                Union[DeleteManyReturn[List[DeleteManyObject]], DeleteManyReturn[None]],
+                self._batch_delete_grpc.abatch_delete(
+                    self.name, where, verbose, dry_run, self._tenant
+                ),
+            )
         return self._batch_delete_grpc.batch_delete(
             self.name, where, verbose, dry_run, self._tenant
         )
@@ -169,24 +221,36 @@ class _Data:
 
         weaviate_obj["id"] = str(uuid)  # must add ID to payload for PUT request
 
-        self._connection.put(
-            path=path,
-            weaviate_object=weaviate_obj,
-            params=params,
-            error_msg="Object was not replaced.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="replace object"),
+        return self._send(
+            [
+                _Request(
+                    "PUT",
+                    path=path,
+                    weaviate_object=weaviate_obj,
+                    params=params,
+                    error_msg="Object was not replaced.",
+                    status_codes=_ExpectedStatusCodes(ok_in=200, error="replace object"),
+                )
+            ],
+            _no_result,
         )
 
     def _update(self, weaviate_obj: Dict[str, Any], uuid: UUID) -> None:
         path = f"/objects/{self.name}/{uuid}"
         params, weaviate_obj = self.__apply_context_to_params_and_object({}, weaviate_obj)
 
-        self._connection.patch(
-            path=path,
-            weaviate_object=weaviate_obj,
-            params=params,
-            error_msg="Object was not updated.",
-            status_codes=_ExpectedStatusCodes(ok_in=[200, 204], error="update object"),
+        return self._send(
+            [
+                _Request(
+                    "PATCH",
+                    path=path,
+                    weaviate_object=weaviate_obj,
+                    params=params,
+                    error_msg="Object was not updated.",
+                    status_codes=_ExpectedStatusCodes(ok_in=[200, 204], error="update object"),
+                )
+            ],
+            _no_result,
         )
 
     def _reference_add(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
@@ -198,14 +262,20 @@ class _Data:
             raise WeaviateInvalidInputError(
                 "reference_add does not support adding multiple objects to a reference at once. Use reference_add_many or reference_replace instead."
             )
-        for beacon in ref._to_beacons():
-            self._connection.post(
-                path=path,
-                weaviate_object=beacon,
-                params=self.__apply_context(params),
-                error_msg="Reference was not added.",
-                status_codes=_ExpectedStatusCodes(ok_in=200, error="add reference to object"),
-            )
+        return self._send(
+            [
+                _Request(
+                    "POST",
+                    path=path,
+                    weaviate_object=beacon,
+                    params=self.__apply_context(params),
+                    error_msg="Reference was not added.",
+                    status_codes=_ExpectedStatusCodes(ok_in=200, error="add reference to object"),
+                )
+                for beacon in ref._to_beacons()
+            ],
+            _no_result,
+        )
 
     def _reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
         batch = [
@@ -218,6 +288,8 @@ class _Data:
             for ref in refs
             for beacon in ref._to_beacons()
         ]
+        if _async_requests.get():
+            return cast(BatchReferenceReturn, self._batch_rest_async.references(list(batch)))
         return self._batch_rest.references(list(batch))
 
     def _reference_delete(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
@@ -229,27 +301,65 @@ class _Data:
             raise WeaviateInvalidInputError(
                 "reference_delete does not support deleting multiple objects from a reference at once. Use reference_replace instead."
             )
-        for beacon in ref._to_beacons():
-            self._connection.delete(
-                path=path,
-                weaviate_object=beacon,
-                params=self.__apply_context(params),
-                error_msg="Reference was not deleted.",
-                status_codes=_ExpectedStatusCodes(ok_in=204, error="delete reference from object"),
-            )
+        return self._send(
+            [
+                _Request(
+                    "DELETE",
+                    path=path,
+                    weaviate_object=beacon,
+                    params=self.__apply_context(params),
+                    error_msg="Reference was not deleted.",
+                    status_codes=_ExpectedStatusCodes(
+                        ok_in=204, error="delete reference from object"
+                    ),
+                )
+                for beacon in ref._to_beacons()
+            ],
+            _no_result,
+        )
 
     def _reference_replace(self, from_uuid: UUID, from_property: str, ref: _Reference) -> None:
         params: Dict[str, str] = {}
 
         path = f"/objects/{self.name}/{from_uuid}/references/{from_property}"
-        self._connection.put(
-            path=path,
-            weaviate_object=ref._to_beacons(),
-            params=self.__apply_context(params),
-            error_msg="Reference was not replaced.",
-            status_codes=_ExpectedStatusCodes(ok_in=200, error="replace reference on object"),
+        return self._send(
+            [
+                _Request(
+                    "PUT",
+                    path=path,
+                    weaviate_object=ref._to_beacons(),
+                    params=self.__apply_context(params),
+                    error_msg="Reference was not replaced.",
+                    status_codes=_ExpectedStatusCodes(
+                        ok_in=200, error="replace reference on object"
+                    ),
+                )
+            ],
+            _no_result,
         )
 
+    def _send(self, requests: List[_Request], decode: Callable[[List[Response]], _T]) -> _T:
+        """Send `requests` one after the other and decode their responses with `decode`."""
+        if _async_requests.get():
+            return cast(_T, self.__asend(requests, decode))
+        with self.__write(requests):
+            return decode([self._connection.request(**request._asdict()) for request in requests])
+
+    async def __asend(self, requests: List[_Request], decode: Callable[[List[Response]], _T]) -> _T:
+        with self.__write(requests):
+            return decode(
+                [await self._connection.arequest(**request._asdict()) for request in requests]
+            )
+
+    @contextmanager
+    def __write(self, requests: List[_Request]) -> Iterator[None]:
+        """Drop the cached searches of the collection after a write, also if it failed as it may have been applied."""
+        try:
+            yield
+        finally:
+            if any(request.method != "HEAD" for request in requests):
+                self._connection.invalidate_query_cache(self.name)
+
     def __apply_context(self, params: Dict[str, Any]) -> Dict[str, Any]:
         if self._tenant is not None:
             params["tenant"] = self._tenant
@@ -393,6 +503,7 @@ class _DataCollection(Generic[Properties], _Data):
     def insert_many(
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
+        vectors: Optional[Any] = None,
     ) -> BatchObjectReturn:
         """Insert multiple objects into the collection.
 
@@ -401,6 +512,13 @@ class _DataCollection(Generic[Properties], _Data):
                 The objects to insert. This can be either a list of `Properties` or `DataObject[Properties, ReferenceInputs]`
                     If you didn't set `data_model` then `Properties` will be `Data[str, Any]` in which case you can insert simple dictionaries here.
                         If you want to insert references, vectors, or UUIDs alongside your properties, you will have to use `DataObject` instead.
+            `vectors`
+                The vectors of all objects at once, with one row per object in the same order as `objects`. These take
+                precedence over the vectors of the individual `DataObject`s.
+                Supported types are
+                - for single vectors: a 2-D `numpy.ndarray` or a list of any of the vector types supported by `insert`.
+                    The rows of float32 arrays are sent without converting them to lists.
+                - for named vectors: Dict[str, *matrix above*], where the string is the name of the vector.
 
         Raises:
             `weaviate.exceptions.WeaviateGRPCBatchError`:
@@ -410,32 +528,128 @@ class _DataCollection(Generic[Properties], _Data):
             `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
                 If every object in the batch fails to be inserted. The exception message contains details about the failure.
         """
-        return self._batch_grpc.objects(
-            [
-                (
-                    _BatchObject(
-                        collection=self.name,
-                        vector=obj.vector,
-                        uuid=str(obj.uuid if obj.uuid is not None else uuid_package.uuid4()),
-                        properties=cast(dict, obj.properties),
-                        tenant=self._tenant,
-                        references=obj.references,
-                    )
-                    if isinstance(obj, DataObject)
-                    else _BatchObject(
-                        collection=self.name,
-                        vector=None,
-                        uuid=str(uuid_package.uuid4()),
-                        properties=cast(dict, obj),
-                        tenant=self._tenant,
-                        references=None,
-                    )
+        batch_objects = [
+            (
+                _BatchObject(
+                    collection=self.name,
+                    vector=obj.vector,
+                    uuid=str(obj.uuid if obj.uuid is not None else uuid_package.uuid4()),
+                    properties=cast(dict, obj.properties),
+                    tenant=self._tenant,
+                    references=obj.references,
                 )
-                for obj in objects
-            ],
+                if isinstance(obj, DataObject)
+                else _BatchObject(
+                    collection=self.name,
+                    vector=None,
+                    uuid=str(uuid_package.uuid4()),
+                    properties=cast(dict, obj),
+                    tenant=self._tenant,
+                    references=None,
+                )
+            )
+            for obj in objects
+        ]
+        if vectors is not None:
+            for batch_object, vector in zip(
+                batch_objects, _split_vectors(vectors, len(batch_objects))
+            ):
+                batch_object.vector = vector
+        if _async_requests.get():
+            return cast(
+                BatchObjectReturn,
+                self._batch_grpc.aobjects(
+                    batch_objects,
+                    timeout=self._connection.timeout_config.insert,
+                    all_failed_raises=True,
+                ),
+            )
+        return self._batch_grpc.objects(
+            batch_objects,
             timeout=self._connection.timeout_config.insert,
         )
 
+    def import_from(
+        self,
+        source: _ColumnSource,
+        *,
+        mapping: Optional[Mapping[str, str]] = None,
+        uuid_column: Optional[str] = None,
+        vector_columns: Optional[Union[str, Mapping[str, str]]] = None,
+        batch_size: int = 1000,
+    ) -> BatchObjectReturn:
+        """Import all rows of a Parquet, Arrow or JSONL source into the collection, one object per row.
+
+        The source is read in chunks of `batch_size` rows and every chunk is inserted with one gRPC request, while the
+        next chunk is read. Arrow and Parquet data is converted column by column, without creating a dictionary per row,
+        and float32 vector columns (`FixedSizeList<float32>`) are sent as they are stored.
+
+        Reading Arrow and Parquet data requires `pyarrow` to be installed.
+
+        Arguments:
+            `source`
+                The path of a Parquet (`.parquet`), Arrow IPC (`.arrow`, `.feather`) or JSONL (`.jsonl`, `.ndjson`) file,
+                or a `pyarrow.Table`, `pyarrow.RecordBatch` or `pyarrow.RecordBatchReader`.
+            `mapping`
+                The columns to import as properties, mapped to the name of their property. If not provided, all columns
+                except the UUID and vector columns are imported as properties of the same name.
+            `uuid_column`
+                The column that contains the UUIDs of the objects, as strings or 16 bytes. If not provided, or if the
+                value of a row is null, a UUIDv4 is generated.
+            `vector_columns`
+                The column that contains the vectors of the objects, or a dictionary of vector names to the columns of
+                named vectors.
+            `batch_size`
+                The number of objects that are inserted with one request.
+
+        Returns:
+            `BatchObjectReturn`
+                The results of all requests combined.
+
+        Raises:
+            `weaviate.exceptions.WeaviateGRPCBatchError`:
+                If any unexpected error occurs during the batch operation.
+            `weaviate.exceptions.WeaviateInsertManyAllFailedError`:
+                If every object of a chunk fails to be inserted. The exception message contains details about the failure.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If the source is not supported or a column of the mapping does not exist.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(expected=[Mapping, None], name="mapping", value=mapping),
+                    _ValidateArgument(expected=[str, None], name="uuid_column", value=uuid_column),
+                    _ValidateArgument(
+                        expected=[str, Mapping, None], name="vector_columns", value=vector_columns
+                    ),
+                    _ValidateArgument(expected=[int], name="batch_size", value=batch_size),
+                ]
+            )
+        if batch_size < 1:
+            raise WeaviateInvalidInputError(
+                f"batch_size must be a positive integer, got {batch_size}"
+            )
+        columns = _ColumnMapping(
+            properties=mapping,
+            uuid=uuid_column,
+            vector=vector_columns if isinstance(vector_columns, str) else None,
+            named_vectors=vector_columns if isinstance(vector_columns, Mapping) else {},
+        )
+        timeout = self._connection.timeout_config.insert
+
+        ret = BatchObjectReturn(
+            all_responses=[], elapsed_seconds=0, errors={}, uuids={}, has_errors=False
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sending: Optional["Future[BatchObjectReturn]"] = None
+            for chunk in _read_chunks(source, columns, self.name, self._tenant, batch_size):
+                if sending is not None:
+                    ret += sending.result()
+                sending = executor.submit(self._batch_grpc.columns, chunk, timeout)
+            if sending is not None:
+                ret += sending.result()
+        return ret
+
     def replace(
         self,
         uuid: UUID,
@@ -492,7 +706,7 @@ class _DataCollection(Generic[Properties], _Data):
         if vector is not None:
             weaviate_obj = self.__parse_vector(weaviate_obj, vector)
 
-        self._replace(weaviate_obj, uuid=uuid)
+        return self._replace(weaviate_obj, uuid=uuid)
 
     def update(
         self,
@@ -541,7 +755,7 @@ class _DataCollection(Generic[Properties], _Data):
         if vector is not None:
             weaviate_obj = self.__parse_vector(weaviate_obj, vector)
 
-        self._update(weaviate_obj, uuid=uuid)
+        return self._update(weaviate_obj, uuid=uuid)
 
     def reference_add(self, from_uuid: UUID, from_property: str, to: SingleReferenceInput) -> None:
         """Create a reference between an object in this collection and any other object in Weaviate.
@@ -574,7 +788,7 @@ class _DataCollection(Generic[Properties], _Data):
             ref = _Reference(target_collection=to.target_collection, uuids=to.uuids)
         else:
             ref = _Reference(target_collection=None, uuids=to)
-        self._reference_add(from_uuid=from_uuid, from_property=from_property, ref=ref)
+        return self._reference_add(from_uuid=from_uuid, from_property=from_property, ref=ref)
 
     def reference_add_many(self, refs: List[DataReferences]) -> BatchReferenceReturn:
         """Create multiple references on a property in batch between objects in this collection and any other object in Weaviate.
@@ -622,7 +836,7 @@ class _DataCollection(Generic[Properties], _Data):
             ref = _Reference(target_collection=to.target_collection, uuids=to.uuids)
         else:
             ref = _Reference(target_collection=None, uuids=to)
-        self._reference_delete(from_uuid=from_uuid, from_property=from_property, ref=ref)
+        return self._reference_delete(from_uuid=from_uuid, from_property=from_property, ref=ref)
 
     def reference_replace(self, from_uuid: UUID, from_property: str, to: ReferenceInput) -> None:
         """Replace a reference of an object within the collection.
@@ -657,7 +871,7 @@ class _DataCollection(Generic[Properties], _Data):
             ref = _Reference(target_collection=to.target_collection, uuids=to.uuids)
         else:
             ref = _Reference(target_collection=None, uuids=to)
-        self._reference_replace(from_uuid=from_uuid, from_property=from_property, ref=ref)
+        return self._reference_replace(from_uuid=from_uuid, from_property=from_property, ref=ref)
 
     def exists(self, uuid: UUID) -> bool:
         """Check for existence of a single object in the collection.
@@ -1,6 +1,18 @@
 from dataclasses import dataclass
 import struct
-from typing import Any, Dict, List, Literal, Optional, Sequence, Set, TypeVar, Union, cast, Tuple
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+    cast,
+    Tuple,
+)
 
 from typing_extensions import TypeAlias
 
@@ -30,6 +42,7 @@ from weaviate.collections.filters import _FilterToGRPC
 from weaviate.collections.grpc.shared import _BaseGRPC
 
 from weaviate.connect import ConnectionV4
+from weaviate.connect.query_cache import _QueryCache
 from weaviate.exceptions import WeaviateQueryError
 from weaviate.types import NUMBER, UUID
 from weaviate.util import _get_vector_v4
@@ -108,7 +121,7 @@ class _QueryGRPC(_BaseGRPC):
         return_references: Optional[REFERENCES] = None,
         generative: Optional[_Generative] = None,
         rerank: Optional[Rerank] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(_ValidateArgument([_Sorting, None], "sort", sort))
 
@@ -133,7 +146,7 @@ class _QueryGRPC(_BaseGRPC):
             sort_by=sort_by,
         )
 
-        return self.__call(request)
+        return request
 
     def hybrid(
         self,
@@ -152,7 +165,7 @@ class _QueryGRPC(_BaseGRPC):
         generative: Optional[_Generative] = None,
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -204,7 +217,7 @@ class _QueryGRPC(_BaseGRPC):
             hybrid_search=hybrid_search,
         )
 
-        return self.__call(request)
+        return request
 
     def bm25(
         self,
@@ -219,7 +232,7 @@ class _QueryGRPC(_BaseGRPC):
         return_references: Optional[REFERENCES] = None,
         generative: Optional[_Generative] = None,
         rerank: Optional[Rerank] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -244,7 +257,7 @@ class _QueryGRPC(_BaseGRPC):
             if query is not None
             else None,
         )
-        return self.__call(request)
+        return request
 
     def near_vector(
         self,
@@ -262,7 +275,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -293,7 +306,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
-        return self.__call(request)
+        return request
 
     def near_object(
         self,
@@ -311,7 +324,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -341,7 +354,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
-        return self.__call(base_request)
+        return base_request
 
     def near_text(
         self,
@@ -361,7 +374,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -415,7 +428,7 @@ class _QueryGRPC(_BaseGRPC):
             near_text=near_text_req,
         )
 
-        return self.__call(request)
+        return request
 
     def near_media(
         self,
@@ -434,7 +447,7 @@ class _QueryGRPC(_BaseGRPC):
         return_metadata: Optional[_MetadataQuery] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Optional[REFERENCES] = None,
-    ) -> search_get_pb2.SearchReply:
+    ) -> search_get_pb2.SearchRequest:
         if self._validate_arguments:
             _validate_input(
                 [
@@ -489,7 +502,56 @@ class _QueryGRPC(_BaseGRPC):
             group_by=group_by,
             **kwargs,
         )
-        return self.__call(request)
+        return request
+
+    def template(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        autocut: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        return_metadata: Optional[_MetadataQuery] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Optional[REFERENCES] = None,
+    ) -> search_get_pb2.SearchRequest:
+        """Build a request without a search, which is completed by the calls of a prepared query."""
+        return self.__create_request(
+            limit=limit,
+            offset=offset,
+            autocut=autocut,
+            filters=filters,
+            metadata=return_metadata,
+            return_properties=return_properties,
+            return_references=return_references,
+        )
+
+    def search(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        """Send a search request that was built by one of the other methods, or return its cached reply."""
+        cache = self.__cache(request)
+        if cache is None:
+            return self.__send(request)
+
+        key = request.SerializeToString(deterministic=True)
+        res = cache.get(key)
+        if res is None:
+            generation = cache.generation(request.collection)
+            res = self.__send(request)
+            cache.put(request.collection, key, res, generation)
+        return res
+
+    async def asearch(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        """Send a search request over the async gRPC channel of the running event loop, see `search`."""
+        cache = self.__cache(request)
+        if cache is None:
+            return await self.__asend(request)
+
+        key = request.SerializeToString(deterministic=True)
+        res = cache.get(key)
+        if res is None:
+            generation = cache.generation(request.collection)
+            res = await self.__asend(request)
+            cache.put(request.collection, key, res, generation)
+        return res
 
     def __create_request(
         self,
@@ -602,18 +664,37 @@ class _QueryGRPC(_BaseGRPC):
             near_video=near_video,
         )
 
-    def __call(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+    def __cache(self, request: search_get_pb2.SearchRequest) -> Optional[_QueryCache]:
+        if request.HasField("generative"):
+            # generative searches are not cached, every call is expected to generate a new answer
+            return None
+        return self._connection.query_cache
+
+    def __send(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
         try:
-            assert self._connection.grpc_stub is not None
             res: search_get_pb2.SearchReply  # According to PEP-0526
-            res, _ = self._connection.grpc_stub.Search.with_call(
+            with self._connection.acquire_grpc_stub() as stub:
+                res, _ = stub.Search.with_call(
+                    request,
+                    metadata=self._connection.grpc_headers(),
+                    timeout=self._connection.timeout_config.query,
+                )
+
+            return res
+
+        except grpc.RpcError as e:
+            raise WeaviateQueryError(e.details(), "GRPC search")  # pyright: ignore
+
+    async def __asend(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        stub = self._connection.agrpc_stub
+        assert stub is not None, "the async client is not connected, call `await client.connect()`"
+        try:
+            res: search_get_pb2.SearchReply = await stub.Search(
                 request,
                 metadata=self._connection.grpc_headers(),
                 timeout=self._connection.timeout_config.query,
             )
-
             return res
-
         except grpc.RpcError as e:
             raise WeaviateQueryError(e.details(), "GRPC search")  # pyright: ignore
 
@@ -1,4 +1,6 @@
-from typing import Callable, Generic, Iterable, Iterator, List, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, Iterator, List, Optional
 from uuid import UUID
 
 from weaviate.collections.classes.internal import Object
@@ -13,31 +15,141 @@ class _ObjectIterator(Generic[P, R], Iterable[Object[P, R]]):
         self,
         fetch_objects_query: Callable[[int, Optional[UUID]], List[Object[P, R]]],
         init_after: Optional[UUID],
+        page_size: int = ITERATOR_CACHE_SIZE,
+        arrow_query_factory: Optional[Callable[[], Callable[[int, Optional[UUID]], Any]]] = None,
     ) -> None:
         self.__query = fetch_objects_query
+        self.__arrow_query_factory = arrow_query_factory
         self.__init_after = init_after
+        self.__page_size = page_size
 
-        self.__iter_object_cache: List[Object[P, R]] = []
+        self.__iter_object_cache: Deque[Object[P, R]] = deque()
         self.__iter_object_last_uuid: Optional[UUID] = init_after
+        self.__next_page: Optional["Future[List[Object[P, R]]]"] = None
+        self.__executor: Optional[ThreadPoolExecutor] = None
 
     def __iter__(self) -> Iterator[Object[P, R]]:
-        self.__iter_object_cache = []
+        self.__close()
+        self.__iter_object_cache = deque()
         self.__iter_object_last_uuid = self.__init_after
         return self
 
     def __next__(self) -> Object[P, R]:
         if len(self.__iter_object_cache) == 0:
-            objects = self.__query(
-                ITERATOR_CACHE_SIZE,
-                self.__iter_object_last_uuid,
-            )
-            self.__iter_object_cache = objects
-            if len(self.__iter_object_cache) == 0:
+            objects = self.__fetch_page()
+            if len(objects) == 0:
+                self.__close()
                 raise StopIteration
+            self.__iter_object_cache.extend(objects)
 
-        ret_object = self.__iter_object_cache.pop(0)
+        ret_object = self.__iter_object_cache.popleft()
         self.__iter_object_last_uuid = ret_object.uuid
         assert (
             self.__iter_object_last_uuid is not None
         )  # if this is None the iterator will never stop
         return ret_object
+
+    def __fetch_page(self) -> List[Object[P, R]]:
+        if self.__next_page is not None:
+            objects = self.__next_page.result()
+            self.__next_page = None
+        else:
+            objects = self.__query(self.__page_size, self.__iter_object_last_uuid)
+
+        if len(objects) > 0:
+            # request the following page while the caller consumes this one, its cursor is the last uuid of this page
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=1)
+            self.__next_page = self.__executor.submit(
+                self.__query, self.__page_size, objects[-1].uuid
+            )
+        return objects
+
+    def to_arrow_batches(self) -> Iterator[Any]:
+        """Iterate over the objects as `pyarrow.RecordBatch`es with one batch per page, instead of one `Object` at a time.
+
+        The pages are decoded straight into Arrow columns, like the results of a query with `return_format="arrow"`,
+        and the next page is requested while the current one is consumed. This requires pyarrow to be installed.
+        """
+        assert self.__arrow_query_factory is not None, "this iterator cannot return Arrow data"
+        # all pages of one iteration are typed by the same schema, it is requested again by the next iteration
+        arrow_query = self.__arrow_query_factory()
+        executor = ThreadPoolExecutor(max_workers=1)
+        page = executor.submit(arrow_query, self.__page_size, self.__init_after)
+        try:
+            while True:
+                table = page.result()
+                if table.num_rows == 0:
+                    return
+                after = UUID(bytes=table.column("uuid")[-1].as_py())
+                page = executor.submit(arrow_query, self.__page_size, after)
+                yield from table.to_batches()
+        finally:
+            page.cancel()
+            executor.shutdown(wait=False)
+
+    def __close(self) -> None:
+        if self.__next_page is not None:
+            self.__next_page.cancel()
+            self.__next_page = None
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+    def __del__(self) -> None:
+        self.__close()
+
+
+class _ScanIterator(Generic[P, R], Iterable[Object[P, R]]):
+    """Reads a collection through `parallelism` cursors that each cover a disjoint range of the uuid keyspace.
+
+    The ranges are fetched concurrently and the objects are yielded as soon as a page of any range arrives, so the
+    objects are not ordered by uuid.
+    """
+
+    def __init__(
+        self,
+        fetch_objects_query: Callable[[int, Optional[UUID]], List[Object[P, R]]],
+        parallelism: int,
+        page_size: int = ITERATOR_CACHE_SIZE,
+    ) -> None:
+        self.__query = fetch_objects_query
+        self.__parallelism = parallelism
+        self.__page_size = page_size
+
+    def __iter__(self) -> Iterator[Object[P, R]]:
+        return self.__scan()
+
+    def __scan(self) -> Iterator[Object[P, R]]:
+        # range i contains the uuids in (bounds[i], bounds[i + 1]], None stands for the start and end of the keyspace
+        bounds: List[Optional[UUID]] = [None]
+        bounds.extend(
+            UUID(int=(i << 128) // self.__parallelism - 1) for i in range(1, self.__parallelism)
+        )
+        bounds.append(None)
+
+        executor = ThreadPoolExecutor(max_workers=self.__parallelism)
+        pending: Dict["Future[List[Object[P, R]]]", Optional[UUID]] = {}
+        try:
+            for after, upper in zip(bounds[:-1], bounds[1:]):
+                pending[executor.submit(self.__query, self.__page_size, after)] = upper
+
+            while len(pending) > 0:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    upper = pending.pop(future)
+                    objects = future.result()
+                    page = (
+                        objects
+                        if upper is None
+                        else [obj for obj in objects if obj.uuid.int <= upper.int]
+                    )
+                    # the cursor of a range continues into the next range, it is finished once it crosses its bound
+                    if len(page) > 0 and len(page) == len(objects):
+                        after = page[-1].uuid
+                        pending[executor.submit(self.__query, self.__page_size, after)] = upper
+                    yield from page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
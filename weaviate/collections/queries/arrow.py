@@ -0,0 +1,236 @@
+import struct
+import uuid as uuid_lib
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from weaviate.collections.classes.config import DataType, _NestedProperty, _Property
+from weaviate.collections.classes.internal import _QueryOptions
+from weaviate.collections.classes.types import GeoCoordinate, _PhoneNumber
+from weaviate.proto.v1 import properties_pb2, search_get_pb2
+from weaviate.util import (
+    _datetime_from_unix_timestamp,
+    _datetime_from_weaviate_str,
+    _import_pyarrow,
+)
+
+# (name, presence flag, value field) of the metadata that is returned as a column
+_METADATA_COLUMNS: List[Tuple[str, str, str]] = [
+    ("distance", "distance_present", "distance"),
+    ("certainty", "certainty_present", "certainty"),
+    ("score", "score_present", "score"),
+    ("explain_score", "explain_score_present", "explain_score"),
+    ("is_consistent", "is_consistent_present", "is_consistent"),
+    ("rerank_score", "rerank_score_present", "rerank_score"),
+]
+_TIMESTAMP_COLUMNS: List[Tuple[str, str, str]] = [
+    ("creation_time", "creation_time_unix_present", "creation_time_unix"),
+    ("last_update_time", "last_update_time_unix_present", "last_update_time_unix"),
+]
+
+
+def _to_arrow_value(value: Any) -> Any:
+    """Convert a deserialized property into a value whose Arrow type can be inferred."""
+    if isinstance(value, list):
+        return [_to_arrow_value(val) for val in value]
+    if isinstance(value, dict):
+        return {key: _to_arrow_value(val) for key, val in value.items()}
+    if isinstance(value, uuid_lib.UUID):
+        return str(value)
+    if isinstance(value, (GeoCoordinate, _PhoneNumber)):
+        return value.model_dump()
+    return value
+
+
+# the field of `properties_pb2.Value` that holds the values of the scalar data types
+_SCHEMA_KINDS: Dict[DataType, str] = {
+    DataType.TEXT: "string_value",
+    DataType.INT: "int_value",
+    DataType.NUMBER: "number_value",
+    DataType.BOOL: "bool_value",
+    DataType.UUID: "uuid_value",
+    DataType.BLOB: "blob_value",
+    DataType.DATE: "date_value",
+}
+_SCHEMA_ARRAY_ELEMENTS: Dict[DataType, DataType] = {
+    DataType.TEXT_ARRAY: DataType.TEXT,
+    DataType.INT_ARRAY: DataType.INT,
+    DataType.NUMBER_ARRAY: DataType.NUMBER,
+    DataType.BOOL_ARRAY: DataType.BOOL,
+    DataType.UUID_ARRAY: DataType.UUID,
+    DataType.DATE_ARRAY: DataType.DATE,
+}
+
+
+def _scalar_columns(pa: Any) -> Dict[str, Tuple[Callable[[properties_pb2.Value], Any], Any]]:
+    """Return how the scalar values of every field of `properties_pb2.Value` are read, and their Arrow type."""
+    return {
+        "string_value": (attrgetter("string_value"), pa.string()),
+        "int_value": (attrgetter("int_value"), pa.int64()),
+        "number_value": (attrgetter("number_value"), pa.float64()),
+        "bool_value": (attrgetter("bool_value"), pa.bool_()),
+        "uuid_value": (attrgetter("uuid_value"), pa.string()),
+        "blob_value": (attrgetter("blob_value"), pa.string()),
+        "date_value": (
+            lambda value: _datetime_from_weaviate_str(value.date_value),
+            pa.timestamp("us", tz="UTC"),
+        ),
+    }
+
+
+def _schema_type(
+    pa: Any, data_type: DataType, nested_properties: Optional[Sequence[_NestedProperty]]
+) -> Any:
+    """Return the Arrow type of the values of a property with `data_type`."""
+    if data_type == DataType.OBJECT or data_type == DataType.OBJECT_ARRAY:
+        struct = pa.struct(
+            [
+                pa.field(prop.name, _schema_type(pa, prop.data_type, prop.nested_properties))
+                for prop in nested_properties or []
+            ]
+        )
+        return struct if data_type == DataType.OBJECT else pa.list_(struct)
+    if data_type in _SCHEMA_ARRAY_ELEMENTS:
+        return pa.list_(_schema_type(pa, _SCHEMA_ARRAY_ELEMENTS[data_type], None))
+    if data_type == DataType.GEO_COORDINATES:
+        return pa.struct([("latitude", pa.float64()), ("longitude", pa.float64())])
+    if data_type == DataType.PHONE_NUMBER:
+        return pa.struct(
+            [
+                ("country_code", pa.int64()),
+                ("default_country", pa.string()),
+                ("international_formatted", pa.string()),
+                ("national", pa.int64()),
+                ("national_formatted", pa.string()),
+                ("number", pa.string()),
+                ("valid", pa.bool_()),
+            ]
+        )
+    return _scalar_columns(pa)[_SCHEMA_KINDS[data_type]][1]
+
+
+def _property_column(
+    pa: Any,
+    values: Sequence[Optional[properties_pb2.Value]],
+    deserialize: Callable[[properties_pb2.Value], Any],
+    schema: Optional[Union[_Property, _NestedProperty]] = None,
+) -> Tuple[Callable[[properties_pb2.Value], Any], Any]:
+    """Return how the values of a property column are read, and the Arrow type of the column.
+
+    The column is typed by the `schema` of the property if it is known, and by the first value that is set otherwise.
+    Scalar values of that type are read from their field directly, all other values are deserialized with
+    `deserialize`. The Arrow type of columns of other values is inferred if there is no schema.
+    """
+
+    def generic(value: properties_pb2.Value) -> Any:
+        return _to_arrow_value(deserialize(value))
+
+    if schema is not None:
+        kind = _SCHEMA_KINDS.get(schema.data_type)
+        if kind is None:
+            return generic, _schema_type(pa, schema.data_type, schema.nested_properties)
+    else:
+        kind = next(
+            (
+                value.WhichOneof("kind")
+                for value in values
+                if value is not None and value.WhichOneof("kind") not in (None, "null_value")
+            ),
+            None,
+        )
+    scalars = _scalar_columns(pa)
+    if kind not in scalars:
+        return generic, None
+
+    read, type_ = scalars[kind]
+
+    def scalar(value: properties_pb2.Value) -> Any:
+        return read(value) if value.WhichOneof("kind") == kind else generic(value)
+
+    return scalar, type_
+
+
+def _results_to_arrow(
+    results: Sequence[search_get_pb2.SearchResult],
+    options: _QueryOptions,
+    deserialize: Callable[[properties_pb2.Value], Any],
+    schema: Optional[Sequence[_Property]] = None,
+) -> Any:
+    """Decode the results of a search into a `pyarrow.Table` with one row per object.
+
+    The table has a `uuid` column with the 16 bytes of the UUIDs, one column per property and, if they were requested,
+    one column per vector and metadata field. Vectors are float32 `FixedSizeList` columns that are built from the raw
+    bytes of the reply if all vectors of a name have the same dimensionality. The default vector is called `vector`
+    and named vectors `vector.<name>`. Properties that are not plain scalars are deserialized with `deserialize`.
+
+    If the `schema` of the returned properties is known, every property of it is a column of the type of its data type,
+    even if none of the results has a value for it, so that all results of the same query have the same columns.
+    Otherwise the columns are the properties of the results and typed by their values.
+    """
+    pa = _import_pyarrow()
+    metas = [result.metadata for result in results]
+    columns: Dict[str, Any] = {
+        "uuid": pa.array([meta.id_as_bytes for meta in metas], type=pa.binary(16))
+    }
+
+    if options.include_properties:
+        props = [result.properties.non_ref_props.fields for result in results]
+        schemas = {prop.name: prop for prop in schema or []}
+        names = list(dict.fromkeys([*schemas, *(name for fields in props for name in fields)]))
+        for name in names:
+            values = [fields[name] if name in fields else None for fields in props]
+            read, type_ = _property_column(pa, values, deserialize, schemas.get(name))
+            rows = [read(value) if value is not None else None for value in values]
+            try:
+                columns[name] = pa.array(rows, type=type_)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # the values do not match the schema, eg. because it changed since it was requested
+                columns[name] = pa.array(rows)
+
+    if options.include_vector:
+        vectors: Dict[str, List[Optional[bytes]]] = {}
+        for i, meta in enumerate(metas):
+            if len(meta.vector_bytes) > 0:
+                vectors.setdefault("vector", [None] * len(metas))[i] = meta.vector_bytes
+            elif len(meta.vector) > 0:
+                # older Weaviate versions only return the default vector as floats
+                vectors.setdefault("vector", [None] * len(metas))[i] = struct.pack(
+                    f"{len(meta.vector)}f", *meta.vector
+                )
+            for vec in meta.vectors:
+                vectors.setdefault(f"vector.{vec.name}", [None] * len(metas))[i] = vec.vector_bytes
+        for name, rows in vectors.items():
+            columns[name] = _vector_column(pa, rows)
+
+    if options.include_metadata:
+        for name, present, field in _METADATA_COLUMNS:
+            if any(getattr(meta, present) for meta in metas):
+                columns[name] = pa.array(
+                    [getattr(meta, field) if getattr(meta, present) else None for meta in metas]
+                )
+        for name, present, field in _TIMESTAMP_COLUMNS:
+            if any(getattr(meta, present) for meta in metas):
+                columns[name] = pa.array(
+                    [
+                        _datetime_from_unix_timestamp(getattr(meta, field))
+                        if getattr(meta, present)
+                        else None
+                        for meta in metas
+                    ],
+                    type=pa.timestamp("us", tz="UTC"),
+                )
+
+    return pa.table(columns)
+
+
+def _vector_column(pa: Any, rows: List[Optional[bytes]]) -> Any:
+    sizes = {len(row) for row in rows if row is not None}
+    if len(sizes) == 1 and all(row is not None for row in rows):
+        # all rows are float32 vectors of the same length, their bytes are the values buffer of the column
+        size = sizes.pop()
+        data = b"".join(row for row in rows if row is not None)
+        values = pa.Array.from_buffers(pa.float32(), len(data) // 4, [None, pa.py_buffer(data)])
+        return pa.FixedSizeListArray.from_arrays(values, size // 4)
+    return pa.array(
+        [list(memoryview(row).cast("f")) if row is not None else None for row in rows],
+        type=pa.list_(pa.float32()),
+    )
@@ -1,14 +1,27 @@
-import datetime
 import io
-import os
 import pathlib
 import struct
 import uuid as uuid_lib
-from typing import Any, Dict, Generic, List, Optional, Sequence, Type, Union, cast
+from functools import partial
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import is_typeddict
 
-from weaviate.collections.classes.config import ConsistencyLevel
+from weaviate.collections.classes.config import ConsistencyLevel, DataType, _Property
 from weaviate.collections.classes.grpc import (
     _QueryReference,
     MetadataQuery,
@@ -35,6 +48,8 @@ from weaviate.collections.classes.internal import (
     GenerativeGroup,
     QueryReturn,
     QueryNearMediaReturnType,
+    _ArrowTable,
+    _LazyObject,
     _QueryOptions,
     ReturnProperties,
     ReturnReferences,
@@ -50,22 +65,77 @@ from weaviate.collections.classes.types import (
     TReferences,
 )
 from weaviate.collections.grpc.query import _QueryGRPC
+from weaviate.collections.queries.arrow import _results_to_arrow
 from weaviate.connect import ConnectionV4
+from weaviate.connect.v4 import _async_requests
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.proto.v1 import search_get_pb2, properties_pb2
 from weaviate.util import (
-    file_encoder_b64,
+    _encode_media,
+    _datetime_from_unix_timestamp,
     _datetime_from_weaviate_str,
+    _import_numpy,
 )
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.warnings import _Warnings
 
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, RETURN_FORMAT, VECTOR_FORMAT
+
+
+def _deserialize_phone_number(value: properties_pb2.Value) -> _PhoneNumber:
+    phone = value.phone_value
+    return _PhoneNumber(
+        country_code=phone.country_code,
+        default_country=phone.default_country,
+        international_formatted=phone.international_formatted,
+        national=phone.national,
+        national_formatted=phone.national_formatted,
+        number=phone.input,
+        valid=phone.valid,
+    )
+
+
+# One deserializer per field of the `kind` oneof of `properties_pb2.Value`. Looking up the set field with a single
+# `WhichOneof` call is much cheaper than testing every field with `HasField`, which dominates the decoding of wide objects.
+_VALUE_DESERIALIZERS: Dict[str, Callable[[properties_pb2.Value], Any]] = {
+    "string_value": attrgetter("string_value"),
+    "int_value": attrgetter("int_value"),
+    "number_value": attrgetter("number_value"),
+    "bool_value": attrgetter("bool_value"),
+    "blob_value": attrgetter("blob_value"),
+    "uuid_value": lambda value: uuid_lib.UUID(value.uuid_value),
+    "date_value": lambda value: _datetime_from_weaviate_str(value.date_value),
+    "list_value": lambda value: [_deserialize_value(val) for val in value.list_value.values],
+    "object_value": lambda value: _deserialize_properties(value.object_value),
+    "geo_value": lambda value: GeoCoordinate(
+        latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
+    ),
+    "phone_value": _deserialize_phone_number,
+    "null_value": lambda value: None,
+}
+
+
+def _deserialize_value(value: properties_pb2.Value) -> Any:
+    kind = value.WhichOneof("kind")
+    deserializer = _VALUE_DESERIALIZERS.get(kind) if kind is not None else None
+    if deserializer is None:
+        _Warnings.unknown_type_encountered(str(kind))
+        return None
+    return deserializer(value)
+
+
+def _deserialize_properties(properties: properties_pb2.Properties) -> Dict[str, Any]:
+    return {name: _deserialize_value(value) for name, value in properties.fields.items()}
 
 
 class _WeaviateUUIDInt(uuid_lib.UUID):
     def __init__(self, hex_: int) -> None:
         object.__setattr__(self, "int", hex_)
+        object.__setattr__(self, "is_safe", uuid_lib.SafeUUID.unknown)
+
+
+_Q = TypeVar("_Q", bound="_BaseQuery[Any, Any]")
+_T = TypeVar("_T")
 
 
 class _BaseQuery(Generic[Properties, References]):
@@ -78,6 +148,9 @@ class _BaseQuery(Generic[Properties, References]):
         properties: Optional[Type[Properties]],
         references: Optional[Type[References]],
         validate_arguments: bool,
+        vector_format: VECTOR_FORMAT = "list",
+        on_search: Optional[Callable[[search_get_pb2.SearchRequest], None]] = None,
+        arrow_schema: Optional[Sequence[_Property]] = None,
     ):
         self.__connection = connection
         self._name = name
@@ -86,6 +159,9 @@ class _BaseQuery(Generic[Properties, References]):
         self._properties = properties
         self._references = references
         self._validate_arguments = validate_arguments
+        self._vector_format = vector_format
+        self.__on_search = on_search
+        self.__arrow_schema = arrow_schema
         self._query = _QueryGRPC(
             self.__connection,
             self._name,
@@ -94,15 +170,58 @@ class _BaseQuery(Generic[Properties, References]):
             validate_arguments=self._validate_arguments,
         )
 
-    def __retrieve_timestamp(
+    def _with_tenant(
+        self: _Q,
+        tenant: Optional[str],
+        on_search: Optional[Callable[[search_get_pb2.SearchRequest], None]] = None,
+    ) -> _Q:
+        """Return the same namespace for another tenant of the collection, which passes its searches to `on_search`."""
+        return type(self)(
+            self.__connection,
+            self._name,
+            self.__consistency_level,
+            tenant,
+            self._properties,
+            self._references,
+            self._validate_arguments,
+            self._vector_format,
+            on_search,
+            self.__arrow_schema,
+        )
+
+    def _with_arrow_schema(self: _Q, schema: Optional[Sequence[_Property]]) -> _Q:
+        """Return the same namespace, which types the property columns of its Arrow results by `schema`."""
+        return type(self)(
+            self.__connection,
+            self._name,
+            self.__consistency_level,
+            self.__tenant,
+            self._properties,
+            self._references,
+            self._validate_arguments,
+            self._vector_format,
+            self.__on_search,
+            schema,
+        )
+
+    def _search(
         self,
-        timestamp: int,
-    ) -> datetime.datetime:
-        # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958
-        if len(str(timestamp)) <= 13:
-            return datetime.datetime.fromtimestamp(timestamp / 1000, tz=datetime.timezone.utc)
-        else:
-            return datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
+        request: search_get_pb2.SearchRequest,
+        decode: Callable[[search_get_pb2.SearchReply], _T],
+    ) -> _T:
+        """Send a search request built by `self._query` and decode its reply with `decode`."""
+        if self.__on_search is not None:
+            self.__on_search(request)
+        if _async_requests.get():
+            return cast(_T, self.__asearch(request, decode))
+        return decode(self._query.search(request))
+
+    async def __asearch(
+        self,
+        request: search_get_pb2.SearchRequest,
+        decode: Callable[[search_get_pb2.SearchReply], _T],
+    ) -> _T:
+        return decode(await self._query.asearch(request))
 
     def __extract_metadata_for_object(
         self,
@@ -112,12 +231,12 @@ class _BaseQuery(Generic[Properties, References]):
             distance=add_props.distance if add_props.distance_present else None,
             certainty=add_props.certainty if add_props.certainty_present else None,
             creation_time=(
-                self.__retrieve_timestamp(add_props.creation_time_unix)
+                _datetime_from_unix_timestamp(add_props.creation_time_unix)
                 if add_props.creation_time_unix_present
                 else None
             ),
             last_update_time=(
-                self.__retrieve_timestamp(add_props.last_update_time_unix)
+                _datetime_from_unix_timestamp(add_props.last_update_time_unix)
                 if add_props.last_update_time_unix_present
                 else None
             ),
@@ -143,10 +262,30 @@ class _BaseQuery(Generic[Properties, References]):
     ) -> uuid_lib.UUID:
         return _WeaviateUUIDInt(int.from_bytes(add_props.id_as_bytes, byteorder="big"))
 
+    def __extract_vector_bytes_for_object(
+        self,
+        add_props: "search_get_pb2.MetadataResult",
+    ) -> Dict[str, bytes]:
+        vector_bytes = add_props.vector_bytes
+        if len(vector_bytes) > 0:
+            return {"default": vector_bytes}
+        if len(add_props.vector) > 0:
+            # older Weaviate versions only return the default vector as floats
+            np = _import_numpy()
+            return {"default": np.asarray(add_props.vector, dtype=np.float32).tobytes()}
+        return {vec.name: vec.vector_bytes for vec in add_props.vectors}
+
     def __extract_vector_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> Dict[str, List[float]]:
+        if self._vector_format == "numpy":
+            np = _import_numpy()
+            return {
+                name: np.frombuffer(vector_bytes, dtype=np.float32)
+                for name, vector_bytes in self.__extract_vector_bytes_for_object(add_props).items()
+            }
+
         if (
             len(add_props.vector_bytes) == 0
             and len(add_props.vector) == 0
@@ -166,59 +305,51 @@ class _BaseQuery(Generic[Properties, References]):
             vecs[vec.name] = list(vector_bytes)
         return vecs
 
+    def __extract_vector_matrices(
+        self,
+        results: Sequence["search_get_pb2.SearchResult"],
+    ) -> Tuple[Dict[str, Any], List[Dict[str, List[float]]]]:
+        """Decode the vectors of all results into one `(n, d)` matrix per vector name.
+
+        Every vector name that is present with the same dimensionality in all results is decoded with a single
+        `np.frombuffer` call and the vectors of the objects are rows of that matrix. All other vectors are decoded per
+        object.
+        """
+        np = _import_numpy()
+        raw = [self.__extract_vector_bytes_for_object(obj.metadata) for obj in results]
+        matrices: Dict[str, Any] = {}
+        for name in {vector_name for vecs in raw for vector_name in vecs}:
+            rows = [vecs.get(name, b"") for vecs in raw]
+            size = len(rows[0])
+            if size == 0 or any(len(row) != size for row in rows):
+                continue
+            matrices[name] = np.frombuffer(b"".join(rows), dtype=np.float32).reshape(
+                len(rows), size // 4
+            )
+        vectors = [
+            {
+                name: (
+                    matrices[name][i]
+                    if name in matrices
+                    else np.frombuffer(vector_bytes, dtype=np.float32)
+                )
+                for name, vector_bytes in vecs.items()
+            }
+            for i, vecs in enumerate(raw)
+        ]
+        return matrices, vectors
+
     def __extract_generated_for_object(
         self,
         add_props: "search_get_pb2.MetadataResult",
     ) -> Optional[str]:
         return add_props.generative if add_props.generative_present else None
 
-    def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            return _datetime_from_weaviate_str(value.date_value)
-        if value.HasField("string_value"):
-            return str(value.string_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
-            return [self.__deserialize_non_ref_prop(val) for val in value.list_value.values]
-        if value.HasField("object_value"):
-            return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
-            return None
-
-        _Warnings.unknown_type_encountered(value.WhichOneof("Value"))
-        return None
-
     def __parse_nonref_properties_result(
         self,
         properties: properties_pb2.Properties,
     ) -> dict:
-        return {
-            name: self.__deserialize_non_ref_prop(value)
-            for name, value in properties.fields.items()
-        }
+        return _deserialize_properties(properties)
 
     def __parse_ref_properties_result(
         self,
@@ -244,25 +375,40 @@ class _BaseQuery(Generic[Properties, References]):
         props: search_get_pb2.PropertiesResult,
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
+        vector: Optional[Dict[str, List[float]]] = None,
     ) -> Object[Any, Any]:
-        return Object(
-            collection=props.target_collection,
-            properties=(
-                self.__parse_nonref_properties_result(props.non_ref_props)
-                if options.include_properties
-                else {}
-            ),
-            metadata=(
+        return _LazyObject(partial(self.__decode_object_field, props, meta, options, vector))
+
+    def __decode_object_field(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        options: _QueryOptions,
+        vector: Optional[Dict[str, List[float]]],
+        name: str,
+    ) -> Any:
+        if name == "uuid":
+            return self.__extract_id_for_object(meta)
+        if name == "metadata":
+            return (
                 self.__extract_metadata_for_object(meta)
                 if options.include_metadata
                 else MetadataReturn()
-            ),
-            references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
-            ),
-            uuid=self.__extract_id_for_object(meta),
-            vector=self.__extract_vector_for_object(meta) if options.include_vector else {},
-        )
+            )
+        if name == "properties":
+            return (
+                self.__parse_nonref_properties_result(props.non_ref_props)
+                if options.include_properties
+                else {}
+            )
+        if name == "references":
+            return self.__parse_ref_properties_result(props) if options.include_references else None
+        if name == "vector":
+            if vector is not None:
+                return vector
+            return self.__extract_vector_for_object(meta) if options.include_vector else {}
+        assert name == "collection"
+        return props.target_collection
 
     def __result_to_generative_object(
         self,
@@ -362,6 +508,7 @@ class _BaseQuery(Generic[Properties, References]):
         references: Optional[
             ReturnReferences[TReferences]
         ],  # required until 3.12 is minimum supported version to use new generics syntax
+        return_format: RETURN_FORMAT = "objects",
     ) -> Union[
         QueryReturn[Properties, References],
         QueryReturn[Properties, CrossReferences],
@@ -369,7 +516,19 @@ class _BaseQuery(Generic[Properties, References]):
         QueryReturn[TProperties, References],
         QueryReturn[TProperties, CrossReferences],
         QueryReturn[TProperties, TReferences],
+        _ArrowTable,
     ]:
+        if return_format == "arrow":
+            return self._result_to_arrow(res, options, properties, references)
+        if options.include_vector and self._vector_format == "numpy":
+            matrices, vectors = self.__extract_vector_matrices(res.results)
+            return QueryReturn(
+                objects=[
+                    self.__result_to_query_object(obj.properties, obj.metadata, options, vector)
+                    for obj, vector in zip(res.results, vectors)
+                ],
+                vectors=matrices,
+            )
         return QueryReturn(
             objects=[
                 self.__result_to_query_object(obj.properties, obj.metadata, options)
@@ -377,6 +536,42 @@ class _BaseQuery(Generic[Properties, References]):
             ]
         )
 
+    def _result_to_arrow(
+        self,
+        res: search_get_pb2.SearchReply,
+        options: _QueryOptions,
+        properties: Optional[ReturnProperties[TProperties]],
+        references: Optional[ReturnReferences[TReferences]],
+    ) -> _ArrowTable:
+        if references is not None:
+            raise WeaviateInvalidInputError(
+                'References cannot be returned as Arrow, use return_format="objects" with return_references.'
+            )
+        return _results_to_arrow(
+            res.results,
+            options,
+            _deserialize_value,
+            self.__arrow_columns(properties) if options.include_properties else None,
+        )
+
+    def __arrow_columns(
+        self, properties: Optional[ReturnProperties[TProperties]]
+    ) -> Optional[List[_Property]]:
+        """Return the properties of the schema of this namespace that are returned as Arrow columns, if it has one.
+
+        Without `properties` all properties but blobs are returned.
+        """
+        if self.__arrow_schema is None:
+            return None
+        returned = self._parse_return_properties(properties)
+        if returned is None:
+            return [prop for prop in self.__arrow_schema if prop.data_type != DataType.BLOB]
+        names = {
+            prop if isinstance(prop, str) else prop.name
+            for prop in ([returned] if isinstance(returned, (str, QueryNested)) else returned)
+        }
+        return [prop for prop in self.__arrow_schema if prop.name in names]
+
     def _result_to_generative_query_return(
         self,
         res: search_get_pb2.SearchReply,
@@ -494,7 +689,16 @@ class _BaseQuery(Generic[Properties, References]):
         references: Optional[
             ReturnReferences[TReferences]
         ],  # required until 3.12 is minimum supported version to use new generics syntax
-    ) -> QueryNearMediaReturnType[Properties, References, TProperties, TReferences]:
+        return_format: RETURN_FORMAT = "objects",
+    ) -> Union[
+        QueryNearMediaReturnType[Properties, References, TProperties, TReferences], _ArrowTable
+    ]:
+        if return_format == "arrow":
+            if options.is_group_by:
+                raise WeaviateInvalidInputError(
+                    'Grouped results cannot be returned as Arrow, use return_format="objects" with group_by.'
+                )
+            return self._result_to_arrow(res, options, properties, references)
         return (
             self._result_to_query_return(res, options, properties, references)
             if not options.is_group_by
@@ -579,13 +783,9 @@ class _BaseQuery(Generic[Properties, References]):
 
     @staticmethod
     def _parse_media(media: Union[str, pathlib.Path, io.BufferedReader]) -> str:
-        if isinstance(media, str):  # if already encoded by user or string to path
-            if os.path.isfile(media):
-                return file_encoder_b64(media)
-            else:
-                return media
-        elif isinstance(media, pathlib.Path) or isinstance(media, io.BufferedReader):
-            return file_encoder_b64(media)
+        if isinstance(media, (str, pathlib.Path, io.BufferedReader)):
+            # strings are either encoded by the user or the path to a file
+            return _encode_media(media)
         else:
             raise WeaviateInvalidInputError(
                 f"media must be a string, pathlib.Path, or io.BufferedReader but is {type(media)}"
@@ -82,7 +82,7 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.bm25(
+        request = self._query.bm25(
             query=query,
             properties=query_properties,
             limit=limit,
@@ -99,16 +99,19 @@ class _BM25Generate(Generic[Properties, References], _BaseQuery[Properties, Refe
                 grouped_properties=grouped_properties,
             ),
         )
-        return self._result_to_generative_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_generative_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
             ),
-            return_properties,
-            return_references,
         )
@@ -1,10 +1,11 @@
-from typing import Generic, List, Optional
+from typing import Generic, List, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
 )
 from weaviate.collections.classes.grpc import Rerank, METADATA
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     QueryReturnType,
     ReturnProperties,
     ReturnReferences,
@@ -12,7 +13,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import INCLUDE_VECTOR
+from weaviate.types import INCLUDE_VECTOR, RETURN_FORMAT
 
 
 class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -27,10 +28,11 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
         filters: Optional[_Filters] = None,
         rerank: Optional[Rerank] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[QueryReturnType[Properties, References, TProperties, TReferences], _ArrowTable]:
         """Search for objects in this collection using the keyword-based BM25 algorithm.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/bm25) for a more detailed explanation.
@@ -52,6 +54,10 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `return_format`
+                How the results are returned, `"objects"` for a `QueryReturn` or `"arrow"` for a `pyarrow.Table` with one
+                row per object, which requires pyarrow and cannot be combined with references or `group_by`. If not
+                specified, this is set to "objects".
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -69,7 +75,7 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.bm25(
+        request = self._query.bm25(
             query=query,
             properties=query_properties,
             limit=limit,
@@ -81,16 +87,20 @@ class _BM25Query(Generic[Properties, References], _BaseQuery[Properties, Referen
             return_references=self._parse_return_references(return_references),
             rerank=rerank,
         )
-        return self._result_to_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata=return_metadata,
-                return_properties=return_properties,
-                include_vector=include_vector,
-                collection_references=self._references,
-                query_references=return_references,
-                rerank=rerank,
+        return self._search(
+            request,
+            lambda res: self._result_to_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata=return_metadata,
+                    return_properties=return_properties,
+                    include_vector=include_vector,
+                    collection_references=self._references,
+                    query_references=return_references,
+                    rerank=rerank,
+                ),
+                return_properties,
+                return_references,
+                return_format,
             ),
-            return_properties,
-            return_references,
         )
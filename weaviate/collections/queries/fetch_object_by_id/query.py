@@ -18,6 +18,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
+from weaviate.proto.v1 import search_get_pb2
 from weaviate.types import INCLUDE_VECTOR, UUID
 
 
@@ -56,46 +57,52 @@ class _FetchObjectByIDQuery(Generic[Properties, References], _BaseQuery[Properti
         return_metadata = MetadataQuery(
             creation_time=True, last_update_time=True, is_consistent=True
         )
-        res = self._query.get(
+        request = self._query.get(
             limit=1,
             filters=Filter.by_id().equal(uuid),
             return_metadata=self._parse_return_metadata(return_metadata, include_vector),
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        objects = self._result_to_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+
+        def decode(
+            res: search_get_pb2.SearchReply,
+        ) -> Optional[QuerySingleReturn[Properties, References, TProperties, TReferences]]:
+            objects = self._result_to_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
-                return_references,
-            ),
-            return_properties,
-            None,
-        )
+                None,
+            )
 
-        if len(objects.objects) == 0:
-            return None
+            if len(objects.objects) == 0:
+                return None
 
-        obj = objects.objects[0]
-        assert obj.metadata is not None
-        assert obj.metadata.creation_time is not None
-        assert obj.metadata.last_update_time is not None
+            obj = objects.objects[0]
+            assert obj.metadata is not None
+            assert obj.metadata.creation_time is not None
+            assert obj.metadata.last_update_time is not None
 
-        return cast(
-            QuerySingleReturn[Properties, References, TProperties, TReferences],
-            ObjectSingleReturn(
-                uuid=obj.uuid,
-                vector=obj.vector,
-                properties=obj.properties,
-                metadata=MetadataSingleObjectReturn(
-                    creation_time=obj.metadata.creation_time,
-                    last_update_time=obj.metadata.last_update_time,
-                    is_consistent=obj.metadata.is_consistent,
+            return cast(
+                QuerySingleReturn[Properties, References, TProperties, TReferences],
+                ObjectSingleReturn(
+                    uuid=obj.uuid,
+                    vector=obj.vector,
+                    properties=obj.properties,
+                    metadata=MetadataSingleObjectReturn(
+                        creation_time=obj.metadata.creation_time,
+                        last_update_time=obj.metadata.last_update_time,
+                        is_consistent=obj.metadata.is_consistent,
+                    ),
+                    references=obj.references,
+                    collection=obj.collection,
                 ),
-                references=obj.references,
-                collection=obj.collection,
-            ),
-        )
+            )
+
+        return self._search(request, decode)
@@ -73,7 +73,7 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.get(
+        request = self._query.get(
             limit=limit,
             offset=offset,
             after=after,
@@ -88,15 +88,18 @@ class _FetchObjectsGenerate(Generic[Properties, References], _BaseQuery[Properti
                 grouped_properties=grouped_properties,
             ),
         )
-        return self._result_to_generative_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_generative_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
             ),
-            return_properties,
-            return_references,
         )
@@ -1,10 +1,11 @@
-from typing import Generic, Optional
+from typing import Generic, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
 )
 from weaviate.collections.classes.grpc import METADATA, _Sorting
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     QueryReturnType,
     ReturnProperties,
     ReturnReferences,
@@ -12,7 +13,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import UUID, INCLUDE_VECTOR
+from weaviate.types import UUID, INCLUDE_VECTOR, RETURN_FORMAT
 
 
 class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -25,10 +26,11 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         filters: Optional[_Filters] = None,
         sort: Optional[_Sorting] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
-    ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[QueryReturnType[Properties, References, TProperties, TReferences], _ArrowTable]:
         """Retrieve the objects in this collection without any search.
 
         Arguments:
@@ -44,6 +46,10 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
                 The sorting to apply to the retrieval.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `return_format`
+                How the results are returned, `"objects"` for a `QueryReturn` or `"arrow"` for a `pyarrow.Table` with one
+                row per object, which requires pyarrow and cannot be combined with references or `group_by`. If not
+                specified, this is set to "objects".
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -63,7 +69,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.get(
+        request = self._query.get(
             limit=limit,
             offset=offset,
             after=after,
@@ -73,15 +79,19 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
+                return_format,
             ),
-            return_properties,
-            return_references,
         )
@@ -5,6 +5,7 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES, _Sort, _Sorting
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     QueryReturn,
     CrossReferences,
     ReturnProperties,
@@ -27,6 +28,23 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["arrow"],
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[PROPERTIES] = None,
+        return_references: Literal[None] = None
+    ) -> _ArrowTable: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[_Filters] = None,
+        sort: Optional[_Sorting] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Literal[None] = None
@@ -42,6 +60,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: REFERENCES
@@ -57,6 +76,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[PROPERTIES] = None,
         return_references: Type[TReferences]
@@ -72,6 +92,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None
@@ -87,6 +108,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES
@@ -102,6 +124,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences]
@@ -117,6 +140,7 @@ class _FetchObjectsQuery(Generic[Properties, References], _BaseQuery[Properties,
         sort: Optional[_Sorting] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: Literal["objects"] = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None
@@ -91,7 +91,7 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.hybrid(
+        request = self._query.hybrid(
             query=query,
             alpha=alpha,
             vector=vector,
@@ -112,16 +112,19 @@ class _HybridGenerate(Generic[Properties, References], _BaseQuery[Properties, Re
                 grouped_properties=grouped_properties,
             ),
         )
-        return self._result_to_generative_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_generative_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
             ),
-            return_properties,
-            return_references,
         )
@@ -1,10 +1,11 @@
-from typing import Generic, List, Optional
+from typing import Generic, List, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
 )
 from weaviate.collections.classes.grpc import METADATA, HybridFusion, Rerank
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     QueryReturnType,
     ReturnProperties,
     ReturnReferences,
@@ -12,7 +13,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, RETURN_FORMAT
 
 
 class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -31,10 +32,11 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[QueryReturnType[Properties, References, TProperties, TReferences], _ArrowTable]:
         """Search for objects in this collection using the hybrid algorithm blending keyword-based BM25 and vector-based similarity.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/hybrid) for a more detailed explanation.
@@ -62,6 +64,10 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `return_format`
+                How the results are returned, `"objects"` for a `QueryReturn` or `"arrow"` for a `pyarrow.Table` with one
+                row per object, which requires pyarrow and cannot be combined with references or `group_by`. If not
+                specified, this is set to "objects".
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -81,7 +87,7 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the network connection to Weaviate fails.
         """
-        res = self._query.hybrid(
+        request = self._query.hybrid(
             query=query,
             alpha=alpha,
             vector=vector,
@@ -97,16 +103,20 @@ class _HybridQuery(Generic[Properties, References], _BaseQuery[Properties, Refer
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_query_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
+                return_format,
             ),
-            return_properties,
-            return_references,
         )
@@ -86,7 +86,7 @@ class _NearImageGenerate(Generic[Properties, References], _BaseQuery[Properties,
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_media(
+        request = self._query.near_media(
             media=self._parse_media(near_image),
             type_="image",
             certainty=certainty,
@@ -107,17 +107,20 @@ class _NearImageGenerate(Generic[Properties, References], _BaseQuery[Properties,
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_generative_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                    group_by,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
-                group_by,
             ),
-            return_properties,
-            return_references,
         )
@@ -7,6 +7,7 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import METADATA, GroupBy, Rerank
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     _GroupBy,
     ReturnProperties,
     ReturnReferences,
@@ -15,7 +16,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, RETURN_FORMAT
 
 
 class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -33,10 +34,13 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QueryNearMediaReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[
+        QueryNearMediaReturnType[Properties, References, TProperties, TReferences], _ArrowTable
+    ]:
         """Search for objects by image in this collection using an image-capable vectorization module and vector-based similarity search.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/image) for a more detailed explanation.
@@ -63,6 +67,10 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `return_format`
+                How the results are returned, `"objects"` for a `QueryReturn` or `"arrow"` for a `pyarrow.Table` with one
+                row per object, which requires pyarrow and cannot be combined with references or `group_by`. If not
+                specified, this is set to "objects".
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -82,7 +90,7 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_media(
+        request = self._query.near_media(
             media=self._parse_media(near_image),
             type_="image",
             certainty=certainty,
@@ -98,17 +106,21 @@ class _NearImageQuery(Generic[Properties, References], _BaseQuery[Properties, Re
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_or_groupby_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                    group_by,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
-                group_by,
+                return_format,
             ),
-            return_properties,
-            return_references,
         )
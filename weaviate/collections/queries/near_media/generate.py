@@ -89,7 +89,7 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_media(
+        request = self._query.near_media(
             media=self._parse_media(media),
             type_=media_type.value,
             certainty=certainty,
@@ -110,17 +110,20 @@ class _NearMediaGenerate(Generic[Properties, References], _BaseQuery[Properties,
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_generative_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                    group_by,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
-                group_by,
             ),
-            return_properties,
-            return_references,
         )
@@ -7,6 +7,7 @@ from weaviate.collections.classes.filters import (
 )
 from weaviate.collections.classes.grpc import GroupBy, METADATA, NearMediaType, Rerank
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     _GroupBy,
     ReturnProperties,
     ReturnReferences,
@@ -15,7 +16,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import NUMBER, INCLUDE_VECTOR
+from weaviate.types import NUMBER, INCLUDE_VECTOR, RETURN_FORMAT
 
 
 class _NearMediaQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -34,10 +35,13 @@ class _NearMediaQuery(Generic[Properties, References], _BaseQuery[Properties, Re
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QueryNearMediaReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[
+        QueryNearMediaReturnType[Properties, References, TProperties, TReferences], _ArrowTable
+    ]:
         """Search for objects by audio in this collection using an audio-capable vectorization module and vector-based similarity search.
 
         See the [docs](https://weaviate.io/developers/weaviate/modules/retriever-vectorizer-modules/multi2vec-bind) for a more detailed explanation.
@@ -66,6 +70,10 @@ class _NearMediaQuery(Generic[Properties, References], _BaseQuery[Properties, Re
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `return_format`
+                How the results are returned, `"objects"` for a `QueryReturn` or `"arrow"` for a `pyarrow.Table` with one
+                row per object, which requires pyarrow and cannot be combined with references or `group_by`. If not
+                specified, this is set to "objects".
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -86,7 +94,7 @@ class _NearMediaQuery(Generic[Properties, References], _BaseQuery[Properties, Re
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_media(
+        request = self._query.near_media(
             media=self._parse_media(media),
             type_=media_type.value,
             certainty=certainty,
@@ -102,16 +110,20 @@ class _NearMediaQuery(Generic[Properties, References], _BaseQuery[Properties, Re
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_or_groupby_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
+                return_format,
             ),
-            return_properties,
-            return_references,
         )
@@ -81,7 +81,7 @@ class _NearObjectGenerate(Generic[Properties, References], _BaseQuery[Properties
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_object(
+        request = self._query.near_object(
             near_object=near_object,
             certainty=certainty,
             distance=distance,
@@ -101,17 +101,20 @@ class _NearObjectGenerate(Generic[Properties, References], _BaseQuery[Properties
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_generative_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_generative_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                    group_by,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
-                group_by,
             ),
-            return_properties,
-            return_references,
         )
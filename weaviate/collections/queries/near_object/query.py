@@ -1,10 +1,11 @@
-from typing import Generic, Optional
+from typing import Generic, Optional, Union
 
 from weaviate.collections.classes.filters import (
     _Filters,
 )
 from weaviate.collections.classes.grpc import METADATA, GroupBy, Rerank
 from weaviate.collections.classes.internal import (
+    _ArrowTable,
     _GroupBy,
     ReturnProperties,
     ReturnReferences,
@@ -13,7 +14,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.classes.types import Properties, TProperties, References, TReferences
 from weaviate.collections.queries.base import _BaseQuery
-from weaviate.types import NUMBER, INCLUDE_VECTOR, UUID
+from weaviate.types import NUMBER, INCLUDE_VECTOR, UUID, RETURN_FORMAT
 
 
 class _NearObjectQuery(Generic[Properties, References], _BaseQuery[Properties, References]):
@@ -31,10 +32,13 @@ class _NearObjectQuery(Generic[Properties, References], _BaseQuery[Properties, R
         rerank: Optional[Rerank] = None,
         target_vector: Optional[str] = None,
         include_vector: INCLUDE_VECTOR = False,
+        return_format: RETURN_FORMAT = "objects",
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> QueryNearMediaReturnType[Properties, References, TProperties, TReferences]:
+    ) -> Union[
+        QueryNearMediaReturnType[Properties, References, TProperties, TReferences], _ArrowTable
+    ]:
         """Search for objects in this collection by another object using a vector-based similarity search.
 
         See the [docs](https://weaviate.io/developers/weaviate/api/graphql/search-operators#nearobject) for a more detailed explanation.
@@ -58,6 +62,10 @@ class _NearObjectQuery(Generic[Properties, References], _BaseQuery[Properties, R
                 How the results should be reranked. NOTE: A `rerank-*` module must be enabled for this functionality to work.
             `include_vector`
                 Whether to include the vector in the results. If not specified, this is set to False.
+            `return_format`
+                How the results are returned, `"objects"` for a `QueryReturn` or `"arrow"` for a `pyarrow.Table` with one
+                row per object, which requires pyarrow and cannot be combined with references or `group_by`. If not
+                specified, this is set to "objects".
             `return_metadata`
                 The metadata to return for each object, defaults to `None`.
             `return_properties`
@@ -77,7 +85,7 @@ class _NearObjectQuery(Generic[Properties, References], _BaseQuery[Properties, R
             `weaviate.exceptions.WeaviateGRPCQueryError`:
                 If the request to the Weaviate server fails.
         """
-        res = self._query.near_object(
+        request = self._query.near_object(
             near_object=near_object,
             certainty=certainty,
             distance=distance,
@@ -92,17 +100,21 @@ class _NearObjectQuery(Generic[Properties, References], _BaseQuery[Properties, R
             return_properties=self._parse_return_properties(return_properties),
             return_references=self._parse_return_references(return_references),
         )
-        return self._result_to_query_or_groupby_return(
-            res,
-            _QueryOptions.from_input(
-                return_metadata,
+        return self._search(
+            request,
+            lambda res: self._result_to_query_or_groupby_return(
+                res,
+                _QueryOptions.from_input(
+                    return_metadata,
+                    return_properties,
+                    include_vector,
+                    self._references,
+                    return_references,
+                    rerank,
+                    group_by,
+                ),
                 return_properties,
-                include_vector,
-                self._references,
                 return_references,
-                rerank,
-                group_by,
+                return_format,
             ),
-            return_properties,
-            return_references,
         )
@@ -0,0 +1,169 @@
+import struct
+from typing import TYPE_CHECKING, Any, Generic, List, Optional, Union, cast
+
+from weaviate.collections.classes.internal import (
+    QueryReturn,
+    ReturnProperties,
+    ReturnReferences,
+    _QueryOptions,
+)
+from weaviate.collections.classes.types import Properties, References
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.types import NUMBER
+from weaviate.util import _get_vector_bytes_v4, _get_vector_v4
+
+if TYPE_CHECKING:
+    from weaviate.collections.queries.base import _BaseQuery
+
+
+class _PreparedQuery(Generic[Properties, References]):
+    """A query whose returned fields and filters are converted to a search request once, by `query.prepare`.
+
+    Every search copies this request and only sets its vector or query text and limit, the arguments are not validated
+    again.
+    """
+
+    def __init__(
+        self,
+        query: "_BaseQuery[Properties, References]",
+        template: search_get_pb2.SearchRequest,
+        options: _QueryOptions,
+        return_properties: Optional[ReturnProperties[Any]],
+        return_references: Optional[ReturnReferences[Any]],
+        target_vector: Optional[str],
+    ) -> None:
+        self.__query = query
+        self.__template = template
+        self.__options = options
+        self.__return_properties = return_properties
+        self.__return_references = return_references
+        self.__target_vectors = [target_vector] if target_vector is not None else None
+
+    def near_vector(
+        self,
+        near_vector: Any,
+        *,
+        limit: Optional[int] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+    ) -> QueryReturn[Properties, References]:
+        """Search for objects by vector with the prepared query.
+
+        Arguments:
+            `near_vector`
+                The vector to search on, REQUIRED. A list of floats or an object that exposes float32 data through the
+                buffer protocol, eg. a `numpy.ndarray`.
+            `limit`
+                The maximum number of results to return. If not specified, the limit of the prepared query is used.
+            `certainty`
+                The minimum similarity score to return. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search. If not specified, the default distance specified by the server is used.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        vector_bytes = _get_vector_bytes_v4(near_vector)
+        if vector_bytes is None:
+            vector = _get_vector_v4(near_vector)
+            vector_bytes = struct.pack("{}f".format(len(vector)), *vector)
+        request = self.__request(limit)
+        request.near_vector.CopyFrom(
+            search_get_pb2.NearVector(
+                vector_bytes=vector_bytes,
+                certainty=certainty,
+                distance=distance,
+                target_vectors=self.__target_vectors,
+            )
+        )
+        return self.__search(request)
+
+    def near_text(
+        self,
+        query: Union[List[str], str],
+        *,
+        limit: Optional[int] = None,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+    ) -> QueryReturn[Properties, References]:
+        """Search for objects by text with the prepared query, which requires a text2vec module.
+
+        Arguments:
+            `query`
+                The text or texts to search on, REQUIRED.
+            `limit`
+                The maximum number of results to return. If not specified, the limit of the prepared query is used.
+            `certainty`
+                The minimum similarity score to return. If not specified, the default certainty specified by the server is used.
+            `distance`
+                The maximum distance to search. If not specified, the default distance specified by the server is used.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        request = self.__request(limit)
+        request.near_text.CopyFrom(
+            search_get_pb2.NearTextSearch(
+                query=[query] if isinstance(query, str) else query,
+                certainty=certainty,
+                distance=distance,
+                target_vectors=self.__target_vectors,
+            )
+        )
+        return self.__search(request)
+
+    def bm25(
+        self,
+        query: str,
+        *,
+        limit: Optional[int] = None,
+        query_properties: Optional[List[str]] = None,
+    ) -> QueryReturn[Properties, References]:
+        """Search for objects by keywords with the prepared query.
+
+        Arguments:
+            `query`
+                The keyword-based query to search for, REQUIRED.
+            `limit`
+                The maximum number of results to return. If not specified, the limit of the prepared query is used.
+            `query_properties`
+                The properties to search in. If not specified, all properties are searched.
+
+        Returns:
+            A `QueryReturn` object that includes the searched objects.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If the request to the Weaviate server fails.
+        """
+        request = self.__request(limit)
+        request.bm25_search.CopyFrom(
+            search_get_pb2.BM25(query=query, properties=query_properties or [])
+        )
+        return self.__search(request)
+
+    def __request(self, limit: Optional[int]) -> search_get_pb2.SearchRequest:
+        request = search_get_pb2.SearchRequest()
+        request.CopyFrom(self.__template)
+        if limit is not None:
+            request.limit = limit
+        return request
+
+    def __search(
+        self, request: search_get_pb2.SearchRequest
+    ) -> QueryReturn[Properties, References]:
+        res = self.__query._query.search(request)
+        return cast(
+            QueryReturn[Properties, References],
+            self.__query._result_to_query_return(
+                res, self.__options, self.__return_properties, self.__return_references
+            ),
+        )
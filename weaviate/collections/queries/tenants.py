@@ -0,0 +1,80 @@
+import heapq
+from itertools import islice
+from typing import Any, List, Sequence, Tuple, Union, cast
+
+from weaviate.collections.classes.internal import Object, QueryReturn, TenantsQueryReturn
+from weaviate.collections.classes.tenants import Tenant
+from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import search_get_pb2
+
+
+def _tenant_names(tenants: Sequence[Union[str, Tenant]]) -> List[str]:
+    """Return the names of the tenants to query, every tenant once and in the given order."""
+    names = [tenant.name if isinstance(tenant, Tenant) else tenant for tenant in tenants]
+    for name in names:
+        if not isinstance(name, str):
+            raise WeaviateInvalidInputError(
+                f"tenants must be a list of str or wvc.tenants.Tenant, got {type(name)}"
+            )
+    return list(dict.fromkeys(names))
+
+
+def _has_comparable_scores(searches: Sequence[search_get_pb2.SearchRequest]) -> bool:
+    """Return whether the scores of the result of `searches`, the searches of one tenant, can be compared across tenants.
+
+    BM25 scores depend on the term statistics of every tenant and relative score fusion normalizes the scores per
+    tenant, only the scores of ranked fusion depend on nothing but the ranks of the objects.
+    """
+    return (
+        len(searches) == 1
+        and searches[0].HasField("hybrid_search")
+        and searches[0].hybrid_search.fusion_type == search_get_pb2.Hybrid.FUSION_TYPE_RANKED
+    )
+
+
+def _merge_tenant_results(
+    tenants: List[str],
+    results: Sequence[Any],
+    limit: int,
+    searches: Sequence[Sequence[search_get_pb2.SearchRequest]],
+) -> TenantsQueryReturn[Any, Any]:
+    """Merge the results of the same query of several tenants into the best `limit` objects of all of them.
+
+    Weaviate returns the objects of every tenant ordered by ascending distance for vector searches and by descending
+    score for keyword and hybrid searches, so the results are merged with a heap without sorting all objects again.
+    Scores are only merged if the `searches` of every tenant are a single hybrid search with ranked fusion.
+    """
+    runs: List[List[Tuple[str, Object[Any, Any]]]] = []
+    for tenant, result in zip(tenants, results):
+        if not isinstance(result, QueryReturn):
+            raise WeaviateInvalidInputError(
+                f"The query of every tenant must return a QueryReturn to be merged, got {type(result)}. Queries with "
+                "`group_by` or `return_format='arrow'` cannot be merged."
+            )
+        runs.append([(tenant, obj) for obj in result.objects])
+
+    objects = [obj for run in runs for _, obj in run]
+    if all(obj.metadata.distance is not None for obj in objects):
+        merged = heapq.merge(*runs, key=lambda entry: cast(float, entry[1].metadata.distance))
+    elif all(obj.metadata.score is not None for obj in objects):
+        if not all(_has_comparable_scores(search) for search in searches):
+            raise WeaviateInvalidInputError(
+                "The scores of BM25 searches and of hybrid searches with relative score fusion depend on the objects of "
+                "every tenant and cannot be compared across tenants. Request the distance of vector searches with "
+                "`return_metadata=MetadataQuery(distance=True)`, or use hybrid searches with "
+                "`fusion_type=HybridFusion.RANKED`."
+            )
+        merged = heapq.merge(
+            *runs, key=lambda entry: cast(float, entry[1].metadata.score), reverse=True
+        )
+    else:
+        raise WeaviateInvalidInputError(
+            "The objects of all tenants need a distance or a score to be merged. Request it with "
+            "`return_metadata=MetadataQuery(distance=True)` for vector searches or `MetadataQuery(score=True)` for "
+            "hybrid searches with `fusion_type=HybridFusion.RANKED`."
+        )
+
+    top = list(islice(merged, limit))
+    return TenantsQueryReturn(
+        objects=[obj for _, obj in top], tenants=[tenant for tenant, _ in top]
+    )
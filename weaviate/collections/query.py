@@ -1,5 +1,18 @@
-from typing import Generic
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar, Union
 
+from weaviate.collections.classes.filters import _Filters
+from weaviate.collections.classes.grpc import METADATA
+from weaviate.collections.classes.internal import (
+    QueryReturn,
+    ReturnProperties,
+    ReturnReferences,
+    TenantsQueryReturn,
+    _QueryOptions,
+)
+from weaviate.collections.classes.tenants import Tenant
 from weaviate.collections.classes.types import TProperties, References
 
 from weaviate.collections.queries.bm25 import _BM25Generate, _BM25Query
@@ -26,6 +39,32 @@ from weaviate.collections.queries.near_vector import (
     _NearVectorGenerate,
     _NearVectorQuery,
 )
+from weaviate.collections.queries.prepared import _PreparedQuery
+from weaviate.collections.queries.tenants import _merge_tenant_results, _tenant_names
+from weaviate.proto.v1 import search_get_pb2
+from weaviate.types import INCLUDE_VECTOR
+from weaviate.validator import _validate_input, _validate_positive_int, _ValidateArgument
+
+T = TypeVar("T")
+
+
+def _run_concurrently(calls: Sequence[Callable[[], T]], concurrency: int) -> List[T]:
+    """Run the calls in up to `concurrency` threads and return their results in the same order.
+
+    Every call runs in a copy of the context of the caller, so context variables that are set by the caller apply to
+    the calls as well. If a call fails, the calls that have not been started yet are cancelled.
+    """
+    if len(calls) == 0:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(calls))) as executor:
+        futures = [executor.submit(copy_context().run, call) for call in calls]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
 
 class _QueryCollection(
@@ -40,7 +79,159 @@ class _QueryCollection(
     _NearTextQuery[TProperties, References],
     _NearVectorQuery[TProperties, References],
 ):
-    pass
+    def many(
+        self,
+        queries: Sequence[Callable[["_QueryCollection[TProperties, References]"], T]],
+        *,
+        concurrency: int = 16,
+    ) -> List[T]:
+        """Run several queries on this collection concurrently and return their results in the same order.
+
+        Each query is a function that receives this namespace and performs a single query with it, e.g.
+        `lambda q: q.near_vector(vector, limit=10)`. Up to `concurrency` queries are in flight at the same time, they
+        share the gRPC channel of the client which multiplexes them over one connection.
+
+        Arguments:
+            `queries`
+                The queries to run, REQUIRED.
+            `concurrency`
+                The maximum number of queries that are sent to Weaviate at the same time.
+
+        Returns:
+            The results of the queries in the order of `queries`.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If one of the queries fails. The queries that have not been sent yet are cancelled.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If `concurrency` is not a positive integer.
+        """
+        _validate_positive_int(concurrency, "concurrency")
+        return _run_concurrently([partial(query, self) for query in queries], concurrency)
+
+    def across_tenants(
+        self,
+        tenants: Sequence[Union[str, Tenant]],
+        query: Callable[
+            ["_QueryCollection[TProperties, References]"], QueryReturn[TProperties, References]
+        ],
+        *,
+        limit: int,
+        concurrency: int = 16,
+    ) -> TenantsQueryReturn[TProperties, References]:
+        """Run the same query on several tenants of this collection concurrently and merge their best objects.
+
+        The query is a function that receives this namespace for one tenant and performs a single search with it,
+        e.g. `lambda q: q.near_vector(vector, limit=10, return_metadata=MetadataQuery(distance=True))`. The objects of
+        all tenants are merged by ascending distance, or by descending score if they have no distance, so the query
+        must return one of them. Scores can only be merged for hybrid searches with `fusion_type=HybridFusion.RANKED`,
+        as the scores of BM25 searches and of relative score fusion are not comparable across tenants. Up to
+        `concurrency` tenants are queried at the same time.
+
+        Arguments:
+            `tenants`
+                The tenants to query, REQUIRED. Can be `str` or `wvc.tenants.Tenant`.
+            `query`
+                The query to run on every tenant, REQUIRED. It should return at least `limit` objects per tenant.
+            `limit`
+                The number of objects to return from all tenants together, REQUIRED.
+            `concurrency`
+                The maximum number of tenants that are queried at the same time.
+
+        Returns:
+            A `TenantsQueryReturn` object with the best `limit` objects of all tenants and the tenant of each object.
+
+        Raises:
+            `weaviate.exceptions.WeaviateQueryError`:
+                If the query of a tenant fails.
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If one of the arguments is invalid, or if the objects have neither a distance nor a score of a hybrid
+                search with ranked fusion.
+        """
+        names = _tenant_names(tenants)
+        _validate_positive_int(limit, "limit")
+        _validate_positive_int(concurrency, "concurrency")
+        searches: List[List[search_get_pb2.SearchRequest]] = [[] for _ in names]
+        results = _run_concurrently(
+            [
+                partial(query, self._with_tenant(name, tenant_searches.append))
+                for name, tenant_searches in zip(names, searches)
+            ],
+            concurrency,
+        )
+        return _merge_tenant_results(names, results, limit, searches)
+
+    def prepare(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[_Filters] = None,
+        target_vector: Optional[str] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[Any]] = None,
+        return_references: Optional[ReturnReferences[Any]] = None,
+    ) -> _PreparedQuery[TProperties, References]:
+        """Prepare a query that is run many times with the same filters and returned fields.
+
+        The arguments are validated and converted to a search request once. Every `near_vector`, `near_text` or `bm25`
+        search of the prepared query only sets the vector or query text and the limit of a copy of that request, e.g.
+        `prepared = collection.query.prepare(limit=10, filters=...)` and then `prepared.near_vector(vector)`.
+
+        Arguments:
+            `limit`
+                The maximum number of results to return. If not specified, the default limit specified by the server is returned.
+            `offset`
+                The offset to start from. If not specified, the retrieval begins from the first object in the server.
+            `auto_limit`
+                The maximum number of [autocut](https://weaviate.io/developers/weaviate/api/graphql/additional-operators#autocut) results to return. If not specified, no limit is applied.
+            `filters`
+                The filters to apply to the search.
+            `target_vector`
+                The name of the vector space to search in for named vector configurations.
+            `include_vector`
+                Whether to include the vector in the results. If not specified, this is set to False.
+            `return_metadata`
+                The metadata to return for each object, defaults to `None`.
+            `return_properties`
+                The properties to return for each object.
+            `return_references`
+                The references to return for each object.
+
+        Returns:
+            The prepared query.
+
+        Raises:
+            `weaviate.exceptions.WeaviateInvalidInputError`:
+                If one of the arguments is invalid.
+        """
+        if self._validate_arguments:
+            _validate_input(_ValidateArgument([str, None], "target_vector", target_vector))
+        template = self._query.template(
+            limit=limit,
+            offset=offset,
+            autocut=auto_limit,
+            filters=filters,
+            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        return _PreparedQuery(
+            self,
+            template,
+            _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+            ),
+            return_properties,
+            return_references,
+            target_vector,
+        )
 
 
 class _GenerateCollection(
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, Union
+from typing import Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
@@ -9,6 +9,24 @@ class ConnectionConfig:
     session_pool_connections: int = 20
     session_pool_maxsize: int = 100
     session_pool_max_retries: int = 3
+    # seconds after which idle connections of the pool are closed
+    session_pool_keepalive_expiry: float = 5.0
+    # send the REST requests of https connections over HTTP/2, which multiplexes them on few connections. This
+    # requires the `h2` package.
+    http2: bool = False
+    # number of gRPC channels, every channel has its own HTTP/2 connection and calls are spread across them
+    grpc_channels: int = 1
+    # how the channel of a call is chosen, in turn or the one with the fewest calls in flight
+    grpc_channel_selection: Literal["round_robin", "least_outstanding"] = "round_robin"
+    # connect every channel to all addresses the gRPC host resolves to, eg. the nodes behind a headless service,
+    # and spread the calls across them
+    grpc_balance_resolved_addresses: bool = False
+    # keep the replies of searches and return them for identical searches until they expire or objects of their
+    # collection are written through this client. Writes of other clients are only visible once the replies expire.
+    query_cache: bool = False
+    query_cache_ttl: float = 60.0
+    query_cache_max_entries: int = 1024
+    query_cache_max_bytes: int = 64 * 1024 * 1024
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int):
@@ -23,6 +41,44 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_max_retries must be {int}, received {type(self.session_pool_max_retries)}"
             )
+        if not isinstance(self.session_pool_keepalive_expiry, (int, float)):
+            raise TypeError(
+                f"session_pool_keepalive_expiry must be {float}, received {type(self.session_pool_keepalive_expiry)}"
+            )
+        if not isinstance(self.http2, bool):
+            raise TypeError(f"http2 must be {bool}, received {type(self.http2)}")
+        if not isinstance(self.grpc_channels, int):
+            raise TypeError(f"grpc_channels must be {int}, received {type(self.grpc_channels)}")
+        if self.grpc_channels < 1:
+            raise ValueError(f"grpc_channels must be at least 1, received {self.grpc_channels}")
+        if self.grpc_channel_selection not in ("round_robin", "least_outstanding"):
+            raise ValueError(
+                f"grpc_channel_selection must be 'round_robin' or 'least_outstanding', received {self.grpc_channel_selection}"
+            )
+        if not isinstance(self.grpc_balance_resolved_addresses, bool):
+            raise TypeError(
+                f"grpc_balance_resolved_addresses must be {bool}, received {type(self.grpc_balance_resolved_addresses)}"
+            )
+        if not isinstance(self.query_cache, bool):
+            raise TypeError(f"query_cache must be {bool}, received {type(self.query_cache)}")
+        if not isinstance(self.query_cache_ttl, (int, float)):
+            raise TypeError(
+                f"query_cache_ttl must be {float}, received {type(self.query_cache_ttl)}"
+            )
+        if self.query_cache_ttl <= 0:
+            raise ValueError(f"query_cache_ttl must be positive, received {self.query_cache_ttl}")
+        if not isinstance(self.query_cache_max_entries, int):
+            raise TypeError(
+                f"query_cache_max_entries must be {int}, received {type(self.query_cache_max_entries)}"
+            )
+        if self.query_cache_max_entries < 1:
+            raise ValueError(
+                f"query_cache_max_entries must be at least 1, received {self.query_cache_max_entries}"
+            )
+        if not isinstance(self.query_cache_max_bytes, int):
+            raise TypeError(
+                f"query_cache_max_bytes must be {int}, received {type(self.query_cache_max_bytes)}"
+            )
 
 
 # used in v3 only
@@ -4,6 +4,7 @@ Weaviate and run REST requests.
 """
 
 from .base import ConnectionParams, ProtocolParams
+from .metrics import RestEndpointMetrics
 from .v3 import Connection
 from .v4 import ConnectionV4
 
@@ -12,4 +13,5 @@ __all__ = [
     "ConnectionParams",
     "ConnectionV4",
     "ProtocolParams",
+    "RestEndpointMetrics",
 ]
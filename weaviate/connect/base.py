@@ -2,7 +2,7 @@ import datetime
 import os
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Literal, Tuple, TypeVar, Union, cast, overload
+from typing import Any, Dict, Literal, Sequence, Tuple, TypeVar, Union, cast, overload
 from urllib.parse import urlparse
 
 import grpc  # type: ignore
@@ -110,35 +110,47 @@ class ConnectionParams(BaseModel):
         return f"{self.grpc.host}:{self.grpc.port}"
 
     @overload
-    def _grpc_channel(self, async_channel: Literal[False], proxies: Dict[str, str]) -> Channel:
+    def _grpc_channel(
+        self,
+        async_channel: Literal[False],
+        proxies: Dict[str, str],
+        options: Sequence[Tuple[str, Any]] = (),
+    ) -> Channel:
         ...
 
     @overload
-    def _grpc_channel(self, async_channel: Literal[True], proxies: Dict[str, str]) -> AsyncChannel:
+    def _grpc_channel(
+        self,
+        async_channel: Literal[True],
+        proxies: Dict[str, str],
+        options: Sequence[Tuple[str, Any]] = (),
+    ) -> AsyncChannel:
         ...
 
     def _grpc_channel(
-        self, async_channel: bool, proxies: Dict[str, str]
+        self,
+        async_channel: bool,
+        proxies: Dict[str, str],
+        options: Sequence[Tuple[str, Any]] = (),
     ) -> Union[Channel, AsyncChannel]:
         if async_channel:
             import_path = grpc.aio
         else:
             import_path = grpc
 
+        channel_options: list = [*GRPC_DEFAULT_OPTIONS, *options]
         if (p := proxies.get("grpc")) is not None:
-            options: list = [*GRPC_DEFAULT_OPTIONS, ("grpc.http_proxy", p)]
-        else:
-            options = GRPC_DEFAULT_OPTIONS
+            channel_options.append(("grpc.http_proxy", p))
         if self.grpc.secure:
             return import_path.secure_channel(
                 target=self._grpc_target,
                 credentials=ssl_channel_credentials(),
-                options=options,
+                options=channel_options,
             )
         else:
             return import_path.insecure_channel(
                 target=self._grpc_target,
-                options=options,
+                options=channel_options,
             )
 
     @property
@@ -0,0 +1,69 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Literal
+
+from grpc import Channel  # type: ignore
+
+from weaviate.proto.v1 import weaviate_pb2_grpc
+
+GrpcChannelSelection = Literal["round_robin", "least_outstanding"]
+
+
+class _GrpcChannelPool:
+    """The gRPC channels of a connection and the selection of the channel that a call is sent over.
+
+    Every channel has its own HTTP/2 connection, so the number of concurrent streams is not capped by the single
+    connection of one channel. With `round_robin` the channels are used in turn, with `least_outstanding` a call is
+    sent over the channel with the fewest calls in flight, ties are broken in turn.
+    """
+
+    def __init__(self, channels: List[Channel], selection: GrpcChannelSelection) -> None:
+        assert len(channels) > 0
+        self.__channels = channels
+        self.__stubs = [weaviate_pb2_grpc.WeaviateStub(channel) for channel in channels]
+        self.__outstanding = [0] * len(channels)
+        self.__least_outstanding = selection == "least_outstanding"
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def channel(self) -> Channel:
+        """The first channel of the pool, eg. for health checks."""
+        return self.__channels[0]
+
+    @property
+    def stub(self) -> weaviate_pb2_grpc.WeaviateStub:
+        """The stub of the first channel of the pool."""
+        return self.__stubs[0]
+
+    def outstanding(self) -> List[int]:
+        """Return the number of calls in flight on every channel."""
+        with self.__lock:
+            return list(self.__outstanding)
+
+    @contextmanager
+    def acquire(self) -> Iterator[weaviate_pb2_grpc.WeaviateStub]:
+        """Select the channel of a call and yield its stub, the call counts as outstanding until the context exits."""
+        if len(self.__stubs) == 1:
+            yield self.__stubs[0]
+            return
+
+        with self.__lock:
+            count = len(self.__stubs)
+            index = self.__next % count
+            if self.__least_outstanding:
+                index = min(
+                    ((index + i) % count for i in range(count)),
+                    key=self.__outstanding.__getitem__,
+                )
+            self.__next = index + 1
+            self.__outstanding[index] += 1
+        try:
+            yield self.__stubs[index]
+        finally:
+            with self.__lock:
+                self.__outstanding[index] -= 1
+
+    def close(self) -> None:
+        for channel in self.__channels:
+            channel.close()
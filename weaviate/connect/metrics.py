@@ -0,0 +1,89 @@
+import threading
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional
+
+from httpx import Response
+
+
+@dataclass
+class RestEndpointMetrics:
+    """Metrics of the REST requests that a client sent to one endpoint of Weaviate.
+
+    Attributes:
+        requests: The number of requests, including the failed ones.
+        errors: The number of requests that failed without a response, eg. because the connection failed or no
+            connection of the pool became available in time.
+        new_connections: The number of connections that were opened for the requests. If this is close to `requests`,
+            connections are not reused, because the pool is too small or its connections expire before they are used
+            again.
+        tls_handshakes: The number of TLS handshakes of the new connections.
+        http2_requests: The number of requests that were sent over HTTP/2.
+        total_seconds: The time of all requests together, including the time spent waiting for a connection.
+        max_seconds: The time of the slowest request.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    tls_handshakes: int = 0
+    http2_requests: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class _RequestTrace:
+    """Counts the connections that are opened for one request, through the `trace` extension of httpcore."""
+
+    __slots__ = ("new_connections", "tls_handshakes")
+
+    def __init__(self) -> None:
+        self.new_connections = 0
+        self.tls_handshakes = 0
+
+    def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self(event_name, info)
+
+
+def _endpoint(path: str) -> str:
+    """Return the endpoint of a request path without the names and ids in it, eg. `schema/tenants`."""
+    parts = path.strip("/").split("/")
+    if parts[0] == "schema" and len(parts) > 2:
+        # the tenants, shards and properties of a collection
+        return f"schema/{parts[2]}"
+    return parts[0]
+
+
+class _RestMetrics:
+    """Collects the metrics of the REST requests of a connection by endpoint."""
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__endpoints: Dict[str, RestEndpointMetrics] = {}
+
+    def record(
+        self, path: str, seconds: float, trace: _RequestTrace, response: Optional[Response]
+    ) -> None:
+        endpoint = _endpoint(path)
+        with self.__lock:
+            metrics = self.__endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self.__endpoints[endpoint] = RestEndpointMetrics()
+            metrics.requests += 1
+            metrics.new_connections += trace.new_connections
+            metrics.tls_handshakes += trace.tls_handshakes
+            metrics.total_seconds += seconds
+            metrics.max_seconds = max(metrics.max_seconds, seconds)
+            if response is None:
+                metrics.errors += 1
+            elif response.http_version == "HTTP/2":
+                metrics.http2_requests += 1
+
+    def snapshot(self) -> Dict[str, RestEndpointMetrics]:
+        with self.__lock:
+            return {endpoint: replace(metrics) for endpoint, metrics in self.__endpoints.items()}
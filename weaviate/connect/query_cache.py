@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Set
+
+from weaviate.proto.v1 import search_get_pb2
+
+
+class _CacheEntry(NamedTuple):
+    collection: str
+    reply: search_get_pb2.SearchReply
+    size: int
+    expires: float
+
+
+class _QueryCache:
+    """The replies of searches of a connection, keyed by the serialized search request.
+
+    Entries expire `ttl` seconds after they were stored, and the least recently used entries are evicted if there are
+    more than `max_entries` entries or their replies are larger than `max_bytes` together. The entries of a collection
+    are dropped when objects or references of it are written through the same connection.
+
+    Every collection has a generation that is increased by every write. A reply is only stored if the generation of its
+    collection did not change while it was requested, so a search that overlaps with a write cannot store a reply that
+    misses the write.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__ttl = ttl
+        self.__lock = threading.Lock()
+        self.__entries: "OrderedDict[bytes, _CacheEntry]" = OrderedDict()
+        self.__keys: Dict[str, Set[bytes]] = {}
+        self.__generations: Dict[str, int] = {}
+        self.__bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """The size of all stored replies together."""
+        return self.__bytes
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def generation(self, collection: str) -> int:
+        """Return the generation of `collection`, which has to be passed to `put` with the reply of a search."""
+        return self.__generations.get(collection, 0)
+
+    def get(self, key: bytes) -> Optional[search_get_pb2.SearchReply]:
+        """Return the stored reply of a search request, or `None` if there is none or it expired."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= time.monotonic():
+                self.__remove(key)
+                return None
+            self.__entries.move_to_end(key)
+            return entry.reply
+
+    def put(
+        self,
+        collection: str,
+        key: bytes,
+        reply: search_get_pb2.SearchReply,
+        generation: int,
+    ) -> None:
+        """Store the reply of a search request of `collection`, unless the collection was written to since `generation`."""
+        size = reply.ByteSize() + len(key)
+        if size > self.__max_bytes:
+            return
+        with self.__lock:
+            if self.__generations.get(collection, 0) != generation:
+                return
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = _CacheEntry(
+                collection, reply, size, time.monotonic() + self.__ttl
+            )
+            self.__keys.setdefault(collection, set()).add(key)
+            self.__bytes += size
+            while len(self.__entries) > self.__max_entries or self.__bytes > self.__max_bytes:
+                self.__remove(next(iter(self.__entries)))
+
+    def invalidate(self, collection: str) -> None:
+        """Drop the entries of `collection`, eg. because objects of it were written."""
+        with self.__lock:
+            self.__generations[collection] = self.__generations.get(collection, 0) + 1
+            for key in self.__keys.pop(collection, set()):
+                entry = self.__entries.pop(key)
+                self.__bytes -= entry.size
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__keys.clear()
+            self.__bytes = 0
+
+    def __remove(self, key: bytes) -> None:
+        entry = self.__entries.pop(key)
+        self.__bytes -= entry.size
+        keys = self.__keys[entry.collection]
+        keys.discard(key)
+        if len(keys) == 0:
+            del self.__keys[entry.collection]
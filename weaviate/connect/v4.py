@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from contextvars import ContextVar
 from copy import copy
 from dataclasses import dataclass, field
 from threading import Thread, Event
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast, overload
+from typing import Any, ContextManager, Dict, List, Literal, Optional, Tuple, Union, cast
 
 from authlib.integrations.httpx_client import AsyncOAuth2Client, OAuth2Client  # type: ignore
 from grpc import _channel, Channel  # type: ignore
@@ -40,6 +42,9 @@ from weaviate.connect.base import (
     JSONPayload,
     _get_proxies,
 )
+from weaviate.connect.grpc_pool import _GrpcChannelPool
+from weaviate.connect.metrics import RestEndpointMetrics, _RequestTrace, _RestMetrics
+from weaviate.connect.query_cache import _QueryCache
 from weaviate.embedded import EmbeddedV4
 from weaviate.exceptions import (
     AuthenticationFailedError,
@@ -55,6 +60,7 @@ from weaviate.util import (
     is_weaviate_client_too_old,
     PYPI_PACKAGE_URL,
     _decode_json_response_dict,
+    _import_h2,
     _ServerVersion,
 )
 from weaviate.validator import _ValidateArgument, _validate_input
@@ -77,6 +83,18 @@ class _ExpectedStatusCodes:
             self.ok = self.ok_in
 
 
+# Set by the namespaces of the async client. The collection methods that support it return a coroutine that sends their
+# requests over the async clients of the running event loop, instead of sending them and returning their result.
+_async_requests: ContextVar[bool] = ContextVar("_async_requests", default=False)
+
+
+@dataclass
+class _AsyncClients:
+    session: AsyncSession
+    channel: AsyncChannel
+    stub: weaviate_pb2_grpc.WeaviateStub
+
+
 class _Connection(_ConnectionBase):
     """
     Connection class used to communicate to a weaviate instance.
@@ -96,18 +114,20 @@ class _Connection(_ConnectionBase):
         self.url = connection_params._http_url
         self.embedded_db = embedded_db
         self._api_version_path = "/v1"
-        self._aclient: Optional[AsyncSession] = None
         self._client: Session
         self.__additional_headers = {}
         self._auth = auth_client_secret
         self._connection_params = connection_params
         self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
-        self._grpc_stub_async: Optional[weaviate_pb2_grpc.WeaviateStub] = None
         self._grpc_channel: Optional[Channel] = None
-        self._grpc_channel_async: Optional[AsyncChannel] = None
+        self._grpc_pool: Optional[_GrpcChannelPool] = None
+        # the async clients are bound to the event loop they were opened on, so every loop (eg. of every running
+        # batch) gets its own ones
+        self.__async_clients: Dict[asyncio.AbstractEventLoop, _AsyncClients] = {}
         self.timeout_config = timeout_config
         self.__connection_config = connection_config
         self.__trust_env = trust_env
+        self.__rest_metrics = _RestMetrics()
         self._weaviate_version = _ServerVersion.from_string("")
         self.__connected = False
 
@@ -155,67 +175,70 @@ class _Connection(_ConnectionBase):
     def is_connected(self) -> bool:
         return self.__connected
 
-    @overload
-    def __make_mounts(self, type_: Literal["sync"]) -> Dict[str, HTTPTransport]:
-        ...
-
-    @overload
-    def __make_mounts(self, type_: Literal["async"]) -> Dict[str, AsyncHTTPTransport]:
-        ...
-
-    def __make_mounts(
-        self, type_: Literal["sync", "async"]
-    ) -> Union[Dict[str, HTTPTransport], Dict[str, AsyncHTTPTransport]]:
-        if type_ == "async":
-            return {
-                f"{key}://"
-                if key == "http" or key == "https"
-                else key: AsyncHTTPTransport(
-                    limits=Limits(
-                        max_connections=self.__connection_config.session_pool_maxsize,
-                        max_keepalive_connections=self.__connection_config.session_pool_connections,
-                    ),
-                    proxy=proxy,
-                    retries=self.__connection_config.session_pool_max_retries,
-                    trust_env=self.__trust_env,
-                )
-                for key, proxy in self._proxies.items()
-                if key != "grpc"
-            }
-        else:
-            assert type_ == "sync"
-            return {
-                f"{key}://"
-                if key == "http" or key == "https"
-                else key: HTTPTransport(
-                    limits=Limits(
-                        max_connections=self.__connection_config.session_pool_maxsize,
-                        max_keepalive_connections=self.__connection_config.session_pool_connections,
-                    ),
-                    proxy=proxy,
-                    retries=self.__connection_config.session_pool_max_retries,
-                    trust_env=self.__trust_env,
-                )
-                for key, proxy in self._proxies.items()
-                if key != "grpc"
-            }
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # a connection is pickled as a new, unconnected connection with the same configuration, eg. when it is sent to
+        # a batch worker process that opens its own clients and channels. The embedded db stays with the original.
+        return (
+            type(self),
+            (
+                self._connection_params,
+                self._auth,
+                self.timeout_config,
+                self._proxies,
+                self.__trust_env,
+                self.__additional_headers,
+                self.__connection_config,
+            ),
+        )
+
+    def __transport_options(self) -> Dict[str, Any]:
+        if self.__connection_config.http2:
+            _import_h2()
+        return {
+            "limits": Limits(
+                max_connections=self.__connection_config.session_pool_maxsize,
+                max_keepalive_connections=self.__connection_config.session_pool_connections,
+                keepalive_expiry=self.__connection_config.session_pool_keepalive_expiry,
+            ),
+            "http2": self.__connection_config.http2,
+            "retries": self.__connection_config.session_pool_max_retries,
+            "trust_env": self.__trust_env,
+        }
+
+    def __proxy_urls(self) -> Dict[str, str]:
+        return {
+            f"{key}://" if key == "http" or key == "https" else key: proxy
+            for key, proxy in self._proxies.items()
+            if key != "grpc"
+        }
 
     def __make_sync_client(self) -> Client:
+        # the pool of the default transport is used for all requests that do not go through a proxy
+        options = self.__transport_options()
         return Client(
             headers=self._headers,
             timeout=Timeout(
                 None, connect=self.timeout_config.query, read=self.timeout_config.insert
             ),
-            mounts=self.__make_mounts("sync"),
+            transport=HTTPTransport(**options),
+            mounts={
+                key: HTTPTransport(proxy=proxy, **options)
+                for key, proxy in self.__proxy_urls().items()
+            },
         )
 
     def __make_async_client(self) -> AsyncClient:
+        options = self.__transport_options()
         return AsyncClient(
             headers=self._headers,
             timeout=Timeout(
                 None, connect=self.timeout_config.query, read=self.timeout_config.insert
             ),
-            mounts=self.__make_mounts("async"),
+            transport=AsyncHTTPTransport(**options),
+            mounts={
+                key: AsyncHTTPTransport(proxy=proxy, **options)
+                for key, proxy in self.__proxy_urls().items()
+            },
         )
 
     def __make_clients(self) -> None:
@@ -363,23 +386,34 @@ class _Connection(_ConnectionBase):
         demon.start()
 
     async def aopen(self) -> None:
-        if self._aclient is None:
-            self._aclient = self.__make_async_client()
-        if self._grpc_stub_async is None:
-            self._grpc_channel_async = self._connection_params._grpc_channel(
+        loop = asyncio.get_running_loop()
+        if loop not in self.__async_clients:
+            channel = self._connection_params._grpc_channel(
                 async_channel=True, proxies=self._proxies
             )
-            assert self._grpc_channel_async is not None
-            self._grpc_stub_async = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel_async)
+            assert channel is not None
+            self.__async_clients[loop] = _AsyncClients(
+                session=self.__make_async_client(),
+                channel=channel,
+                stub=weaviate_pb2_grpc.WeaviateStub(channel),
+            )
 
     async def aclose(self) -> None:
-        if self._aclient is not None:
-            await self._aclient.aclose()
-            self._aclient = None
-        if self._grpc_stub_async is not None:
-            assert self._grpc_channel_async is not None
-            await self._grpc_channel_async.close()
-            self._grpc_stub_async = None
+        clients = self.__async_clients.pop(asyncio.get_running_loop(), None)
+        if clients is not None:
+            await clients.session.aclose()
+            await clients.channel.close()
+
+    def _running_async_clients(self) -> Optional[_AsyncClients]:
+        try:
+            return self.__async_clients.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
+
+    @property
+    def _aclient(self) -> Optional[AsyncSession]:
+        clients = self._running_async_clients()
+        return clients.session if clients is not None else None
 
     def close(self) -> None:
         """Shutdown connection class gracefully."""
@@ -392,8 +426,8 @@ class _Connection(_ConnectionBase):
 
         if hasattr(self, "_client"):
             self._client.close()
-        if self._grpc_channel is not None:
-            self._grpc_channel.close()
+        if self._grpc_pool is not None:
+            self._grpc_pool.close()
         if self.embedded_db is not None:
             self.embedded_db.stop()
         self.__connected = False
@@ -414,7 +448,7 @@ class _Connection(_ConnectionBase):
     def __send(
         self,
         method: Literal["DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"],
-        url: str,
+        path: str,
         error_msg: str,
         status_codes: Optional[_ExpectedStatusCodes],
         weaviate_object: Optional[JSONPayload] = None,
@@ -424,13 +458,17 @@ class _Connection(_ConnectionBase):
             raise WeaviateClosedClientError()
         if self.embedded_db is not None:
             self.embedded_db.ensure_running()
+        trace = _RequestTrace()
+        res: Optional[Response] = None
+        start = time.perf_counter()
         try:
             req = self._client.build_request(
                 method,
-                url,
+                self.url + self._api_version_path + path,
                 json=weaviate_object,
                 params=params,
                 headers=self.__get_latest_headers(),
+                extensions={"trace": trace},
             )
             res = self._client.send(req)
             if status_codes is not None and res.status_code not in status_codes.ok:
@@ -440,6 +478,65 @@ class _Connection(_ConnectionBase):
             raise WeaviateClosedClientError() from e
         except ConnectError as conn_err:
             raise WeaviateConnectionError(error_msg) from conn_err
+        finally:
+            self.__rest_metrics.record(path, time.perf_counter() - start, trace, res)
+
+    def request(
+        self,
+        method: Literal["DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"],
+        path: str,
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        return self.__send(
+            method,
+            path=path,
+            weaviate_object=weaviate_object,
+            params=params,
+            error_msg=error_msg,
+            status_codes=status_codes,
+        )
+
+    async def arequest(
+        self,
+        method: Literal["DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"],
+        path: str,
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
+    ) -> Response:
+        """Send a request with the async client of the running event loop, see `request`."""
+        if not self.is_connected():
+            raise WeaviateClosedClientError()
+        aclient = self._aclient
+        assert (
+            aclient is not None
+        ), "the async client is not connected, call `await client.connect()`"
+        if self.embedded_db is not None:
+            self.embedded_db.ensure_running()
+        trace = _RequestTrace()
+        res: Optional[Response] = None
+        start = time.perf_counter()
+        try:
+            req = aclient.build_request(
+                method,
+                self.url + self._api_version_path + path,
+                json=weaviate_object,
+                params=params,
+                headers=self.__get_latest_headers(),
+                extensions={"trace": trace.atrace},
+            )
+            res = await aclient.send(req)
+            if status_codes is not None and res.status_code not in status_codes.ok:
+                raise UnexpectedStatusCodeError(error_msg, response=res)
+            return cast(Response, res)
+        except ConnectError as conn_err:
+            raise WeaviateConnectionError(error_msg) from conn_err
+        finally:
+            self.__rest_metrics.record(path, time.perf_counter() - start, trace, res)
 
     def delete(
         self,
@@ -451,7 +548,7 @@ class _Connection(_ConnectionBase):
     ) -> Response:
         return self.__send(
             "DELETE",
-            url=self.url + self._api_version_path + path,
+            path=path,
             weaviate_object=weaviate_object,
             params=params,
             error_msg=error_msg,
@@ -468,7 +565,7 @@ class _Connection(_ConnectionBase):
     ) -> Response:
         return self.__send(
             "PATCH",
-            url=self.url + self._api_version_path + path,
+            path=path,
             weaviate_object=weaviate_object,
             params=params,
             error_msg=error_msg,
@@ -485,7 +582,7 @@ class _Connection(_ConnectionBase):
     ) -> Response:
         return self.__send(
             "POST",
-            url=self.url + self._api_version_path + path,
+            path=path,
             weaviate_object=weaviate_object,
             params=params,
             error_msg=error_msg,
@@ -497,20 +594,16 @@ class _Connection(_ConnectionBase):
         path: str,
         weaviate_object: JSONPayload,
         params: Optional[Dict[str, Any]] = None,
+        error_msg: str = "",
+        status_codes: Optional[_ExpectedStatusCodes] = None,
     ) -> Response:
-        if not self.is_connected():
-            raise WeaviateClosedClientError()
-        assert self._aclient is not None
-
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return await self._aclient.post(
-            url=request_url,
-            json=weaviate_object,
+        return await self.arequest(
+            "POST",
+            path=path,
+            weaviate_object=weaviate_object,
             params=params,
-            headers=self.__get_latest_headers(),
+            error_msg=error_msg,
+            status_codes=status_codes,
         )
 
     def put(
@@ -523,7 +616,7 @@ class _Connection(_ConnectionBase):
     ) -> Response:
         return self.__send(
             "PUT",
-            url=self.url + self._api_version_path + path,
+            path=path,
             weaviate_object=weaviate_object,
             params=params,
             error_msg=error_msg,
@@ -542,10 +635,8 @@ class _Connection(_ConnectionBase):
         if params is None:
             params = {}
 
-        request_url = self.url + self._api_version_path + path
-
         return self.__send(
-            "GET", url=request_url, params=params, error_msg=error_msg, status_codes=status_codes
+            "GET", path=path, params=params, error_msg=error_msg, status_codes=status_codes
         )
 
     def head(
@@ -557,7 +648,7 @@ class _Connection(_ConnectionBase):
     ) -> Response:
         return self.__send(
             "HEAD",
-            url=self.url + self._api_version_path + path,
+            path=path,
             params=params,
             error_msg=error_msg,
             status_codes=status_codes,
@@ -570,6 +661,10 @@ class _Connection(_ConnectionBase):
         """
         return str(self._weaviate_version)
 
+    def rest_metrics(self) -> Dict[str, RestEndpointMetrics]:
+        """Return a copy of the metrics of the REST requests of this connection, by endpoint."""
+        return self.__rest_metrics.snapshot()
+
     def get_proxies(self) -> dict:
         return self._proxies
 
@@ -609,6 +704,16 @@ class ConnectionV4(_Connection):
             connection_config,
             embedded_db,
         )
+        self.__connection_config = connection_config
+        self.query_cache: Optional[_QueryCache] = (
+            _QueryCache(
+                connection_config.query_cache_max_entries,
+                connection_config.query_cache_max_bytes,
+                connection_config.query_cache_ttl,
+            )
+            if connection_config.query_cache
+            else None
+        )
         self.__prepare_grpc_headers()
 
     def __prepare_grpc_headers(self) -> None:
@@ -663,12 +768,24 @@ class ConnectionV4(_Connection):
 
     def connect(self, skip_init_checks: bool) -> None:
         super().connect(skip_init_checks)
-        # create GRPC channel. If Weaviate does not support GRPC then error now.
-        self._grpc_channel = self._connection_params._grpc_channel(
-            async_channel=False, proxies=self._proxies
+        # create GRPC channels. If Weaviate does not support GRPC then error now.
+        options: List[Tuple[str, Any]] = []
+        if self.__connection_config.grpc_channels > 1:
+            # channels with the same options share their connection unless every channel has its own subchannels
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        if self.__connection_config.grpc_balance_resolved_addresses:
+            options.append(("grpc.lb_policy_name", "round_robin"))
+        self._grpc_pool = _GrpcChannelPool(
+            [
+                self._connection_params._grpc_channel(
+                    async_channel=False, proxies=self._proxies, options=options
+                )
+                for _ in range(self.__connection_config.grpc_channels)
+            ],
+            self.__connection_config.grpc_channel_selection,
         )
-        assert self._grpc_channel is not None
-        self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel)
+        self._grpc_channel = self._grpc_pool.channel
+        self._grpc_stub = self._grpc_pool.stub
         if not skip_init_checks:
             self._ping_grpc()
 
@@ -684,8 +801,26 @@ class ConnectionV4(_Connection):
             raise WeaviateClosedClientError()
         return self._grpc_stub
 
+    def acquire_grpc_stub(self) -> ContextManager[weaviate_pb2_grpc.WeaviateStub]:
+        """Return a context manager with the stub of the channel that the next call is sent over.
+
+        The call counts as outstanding on its channel until the context exits.
+        """
+        if not self.is_connected():
+            raise WeaviateClosedClientError()
+        assert self._grpc_pool is not None
+        return self._grpc_pool.acquire()
+
+    def invalidate_query_cache(self, *collections: str) -> None:
+        """Drop the cached searches of `collections` after objects or references of them were written."""
+        if self.query_cache is None:
+            return
+        for collection in collections:
+            self.query_cache.invalidate(collection)
+
     @property
     def agrpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
         if not self.is_connected():
             raise WeaviateClosedClientError()
-        return self._grpc_stub_async
+        clients = self._running_async_clients()
+        return clients.stub if clients is not None else None
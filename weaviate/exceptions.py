@@ -3,7 +3,7 @@ Weaviate Exceptions.
 """
 
 from json.decoder import JSONDecodeError
-from typing import Union, Tuple
+from typing import Any, Union, Tuple
 import httpx
 import requests
 
@@ -260,6 +260,10 @@ class WeaviateBatchValidationError(WeaviateBaseError):
         super().__init__(msg)
         self.message = message
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # recreate the error from the original message, it is sent back from batch worker processes
+        return (type(self), (self.message,))
+
 
 class WeaviateInsertInvalidPropertyError(WeaviateBaseError):
     """Is raised when inserting an invalid property."""
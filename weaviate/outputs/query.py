@@ -21,6 +21,7 @@ from weaviate.collections.classes.internal import (
     QuerySingleReturn,
     ReferenceInput,
     ReferenceInputs,
+    TenantsQueryReturn,
 )
 from weaviate.collections.classes.types import (
     GeoCoordinate,
@@ -52,6 +53,7 @@ __all__ = [
     "ReferenceInput",
     "ReferenceInputs",
     "Sorting",
+    "TenantsQueryReturn",
     "WeaviateField",
     "WeaviateProperties",
 ]
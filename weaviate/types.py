@@ -1,6 +1,6 @@
 import datetime
 import uuid as uuid_package
-from typing import Dict, Union, List, Sequence, Tuple
+from typing import Dict, Literal, Union, List, Sequence, Tuple
 
 DATE = datetime.datetime
 UUID = Union[str, uuid_package.UUID]
@@ -9,6 +9,8 @@ NUMBER = Union[int, float]
 GEO_COORDINATES = Tuple[float, float]
 VECTORS = Union[Dict[str, List[float]], List[float]]
 INCLUDE_VECTOR = Union[bool, str, List[str]]
+VECTOR_FORMAT = Literal["list", "numpy"]
+RETURN_FORMAT = Literal["objects", "arrow"]
 
 BEACON = "weaviate://localhost/"
 
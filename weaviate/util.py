@@ -3,14 +3,20 @@ Helper functions!
 """
 
 import base64
+import binascii
 import datetime
+import importlib
 import io
 import json
+import mmap
 import os
 import re
+import sys
+import threading
+from collections import OrderedDict
 from enum import Enum, EnumMeta
 from pathlib import Path
-from typing import Union, Sequence, Any, Optional, List, Dict, Generator, Tuple, cast
+from typing import Union, Sequence, Any, Optional, List, Dict, Tuple, cast
 
 import requests
 import httpx
@@ -32,7 +38,15 @@ MAXIMUM_MINOR_VERSION_DELTA = 3  # The maximum delta between minor versions of W
 MINIMUM_NO_WARNING_VERSION = (
     "v1.16.0"  # The minimum version of Weaviate that will not trigger an upgrade warning.
 )
-BYTES_PER_CHUNK = 65535  # The number of bytes to read per chunk when encoding files ~ 64kb
+MEDIA_CACHE_BYTES = (
+    64 * 1024 * 1024
+)  # The maximum size of the encoded files that are cached for queries ~ 64mb
+MAX_FILE_NAME_LENGTH = (
+    255  # The maximum length of a file name, longer strings without separators are not paths
+)
+MAX_PATH_LENGTH = (
+    32767 if os.name == "nt" else 4096
+)  # The maximum length of a path, longer strings are not paths
 
 
 # MetaEnum and BaseEnum are required to support `in` statements:
@@ -115,46 +129,97 @@ def file_encoder_b64(file_or_file_path: Union[str, Path, io.BufferedReader]) ->
     TypeError
         If the argument is of a wrong data type.
     """
-
-    def _chunks(buffer: io.BufferedReader, chunk_size: int) -> Generator[bytes, Any, Any]:
-        while True:
-            data = buffer.read(chunk_size)
-            if not data:
-                break
-            yield data
-
-    should_close_file = False
-    use_buffering = True
-
     if isinstance(file_or_file_path, str):
         if not os.path.isfile(file_or_file_path):
             raise ValueError("No file found at location " + file_or_file_path)
-        file = open(file_or_file_path, "br")
-        should_close_file = True
-        use_buffering = os.path.getsize(file_or_file_path) > BYTES_PER_CHUNK
+        return _encode_file_b64(file_or_file_path)
     elif isinstance(file_or_file_path, Path):
         if not file_or_file_path.is_file():
             raise ValueError("No file found at location " + str(file_or_file_path))
-        file = file_or_file_path.open("br")
-        should_close_file = True
-        use_buffering = file_or_file_path.stat().st_size > BYTES_PER_CHUNK
+        return _encode_file_b64(file_or_file_path)
     elif isinstance(file_or_file_path, io.BufferedReader):
-        file = file_or_file_path
+        return binascii.b2a_base64(file_or_file_path.read(), newline=False).decode("ascii")
     else:
         raise TypeError(
             '"file_or_file_path" should be a file path or a binary read file' " (io.BufferedReader)"
         )
 
-    if use_buffering:
-        encoded: str = ""
-        for chunk in _chunks(file, BYTES_PER_CHUNK):
-            encoded += base64.b64encode(chunk).decode("utf-8")
-    else:
-        encoded = base64.b64encode(file.read()).decode("utf-8")
 
-    if should_close_file:
-        file.close()
-    return encoded
+def _encode_file_b64(path: Union[str, Path]) -> str:
+    """Encode the file at `path` in one pass over a memory map of it, without reading it into memory first."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return binascii.b2a_base64(content, newline=False).decode("ascii")
+
+
+class _EncodedFileCache:
+    """Caches the base64 encodings of files by their path, modification time and size.
+
+    The least recently used encodings are dropped once the encodings together are larger than `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.__max_bytes = max_bytes
+        self.__bytes = 0
+        self.__encodings: "OrderedDict[str, Tuple[Tuple[int, int], str]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def encode(self, path: Union[str, Path]) -> str:
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self.__lock:
+            cached = self.__encodings.get(key)
+            if cached is not None and cached[0] == version:
+                self.__encodings.move_to_end(key)
+                return cached[1]
+
+        encoded = _encode_file_b64(key)
+        with self.__lock:
+            if (previous := self.__encodings.pop(key, None)) is not None:
+                self.__bytes -= len(previous[1])
+            if len(encoded) <= self.__max_bytes:
+                self.__encodings[key] = (version, encoded)
+                self.__bytes += len(encoded)
+                while self.__bytes > self.__max_bytes:
+                    _, (_, dropped) = self.__encodings.popitem(last=False)
+                    self.__bytes -= len(dropped)
+        return encoded
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__encodings.clear()
+            self.__bytes = 0
+
+
+_media_cache = _EncodedFileCache(MEDIA_CACHE_BYTES)
+
+
+def _encode_media(media: Union[str, Path, io.BufferedReader]) -> str:
+    """Encode the media of a query, files are encoded once for every version of them.
+
+    Strings that are not the path of a file are returned as they are, they are already encoded.
+    """
+    if isinstance(media, str):
+        return (
+            _media_cache.encode(media) if _may_be_path(media) and os.path.isfile(media) else media
+        )
+    if isinstance(media, Path):
+        if not media.is_file():
+            raise ValueError("No file found at location " + str(media))
+        return _media_cache.encode(media)
+    return file_encoder_b64(media)
+
+
+def _may_be_path(media: str) -> bool:
+    """Return whether `media` can be the path of a file, which rules out most encoded media without a system call."""
+    if len(media) > MAX_PATH_LENGTH:
+        return False
+    if len(media) > MAX_FILE_NAME_LENGTH:
+        return os.sep in media or (os.altsep is not None and os.altsep in media)
+    return True
 
 
 def image_decoder_b64(encoded_image: str) -> bytes:
@@ -462,6 +527,91 @@ def _get_vector_v4(vector: Sequence) -> List[float]:
         ) from e
 
 
+def _float32_view(vector: Any) -> Optional[memoryview]:
+    """Return a C-contiguous float32 view of `vector` if it exposes its data through the buffer protocol.
+
+    This is the case for `numpy.ndarray` and `array.array`, arrays of other dtypes are converted with `astype`. Returns
+    `None` for all other types.
+    """
+    if isinstance(vector, list):
+        return None
+    try:
+        view = memoryview(vector)
+        if view.format != "f" and hasattr(vector, "astype"):
+            view = memoryview(vector.astype("float32"))
+    except (TypeError, ValueError):
+        return None
+    if view.format != "f" or not view.c_contiguous:
+        return None
+    return view
+
+
+def _get_vector_bytes_v4(vector: Any) -> Optional[bytes]:
+    """Get the float32 bytes of a single vector without converting it to a list first.
+
+    Returns `None` if the vector does not expose float32 data through the buffer protocol or is not one-dimensional
+    after squeezing, these vectors have to be converted with `_get_vector_v4` instead.
+    """
+    view = _float32_view(vector)
+    if view is None or view.nbytes != view.itemsize * max(view.shape or (), default=0):
+        return None
+    return view.tobytes()
+
+
+def _get_vector_rows_v4(vectors: Any) -> List[Any]:
+    """Split a matrix of vectors, eg. a 2-D `numpy.ndarray`, into one vector per row.
+
+    Rows of float32 matrices are returned as float32 bytes which are sent as they are, all other rows are returned
+    unchanged and converted individually.
+    """
+    view = _float32_view(vectors)
+    if view is None or view.shape is None or len(view.shape) != 2:
+        return list(vectors)
+    rows, columns = view.shape
+    flat = view.cast("B")
+    row_length = columns * view.itemsize
+    return [flat[i * row_length : (i + 1) * row_length].tobytes() for i in range(rows)]
+
+
+def _datetime_from_unix_timestamp(timestamp: int) -> datetime.datetime:
+    """Convert the creation or last update time of an object, which is returned as a unix timestamp, to a datetime."""
+    # Handle the case in which last_update_time_unix is in nanoseconds or milliseconds, issue #958
+    if len(str(timestamp)) <= 13:
+        return datetime.datetime.fromtimestamp(timestamp / 1000, tz=datetime.timezone.utc)
+    else:
+        return datetime.datetime.fromtimestamp(timestamp / 1e9, tz=datetime.timezone.utc)
+
+
+def _import_numpy() -> Any:
+    """Import numpy, which is only required for the opt-in `"numpy"` vector format of query results."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as e:
+        raise ImportError(
+            'The "numpy" vector format requires numpy to be installed, run `pip install numpy`'
+        ) from e
+
+
+def _import_pyarrow(module: str = "pyarrow") -> Any:
+    """Import pyarrow, or one of its modules, which is only required to import Arrow and Parquet data."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            "Importing Arrow and Parquet data requires pyarrow to be installed, run `pip install pyarrow`"
+        ) from e
+
+
+def _import_h2() -> Any:
+    """Import h2, which is only required to send REST requests over HTTP/2."""
+    try:
+        return importlib.import_module("h2")
+    except ImportError as e:
+        raise ImportError(
+            "Sending REST requests over HTTP/2 requires h2 to be installed, run `pip install h2`"
+        ) from e
+
+
 def get_domain_from_weaviate_url(url: str) -> str:
     """
     Get the domain from a weaviate URL.
@@ -952,6 +1102,14 @@ def _datetime_to_string(value: TIME) -> str:
 
 
 def _datetime_from_weaviate_str(string: str) -> datetime.datetime:
+    if sys.version_info >= (3, 11):
+        # fromisoformat parses RFC 3339 with any number of fractional digits since 3.11 and is much faster than strptime
+        try:
+            parsed = datetime.datetime.fromisoformat(string)
+            if parsed.tzinfo is not None:
+                return parsed
+        except ValueError:
+            pass
     try:
         return datetime.datetime.strptime(
             "".join(string.rsplit(":", 1) if string[-1] != "Z" else string),
@@ -26,6 +26,11 @@ def _validate_input(inputs: Union[List[_ValidateArgument], _ValidateArgument]) -
             )
 
 
+def _validate_positive_int(value: int, name: str) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise WeaviateInvalidInputError(f"{name} must be a positive integer, got {value}")
+
+
 def __is_valid(expected: Any, value: Any) -> bool:
     if expected is None:
         return value is None